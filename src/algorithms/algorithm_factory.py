@@ -1,3 +1,5 @@
+from algorithms.face_detectors import get_detector
+from algorithms.face_encoder import get_encoder
 from core.enums import Algorithm
 from core.logger import AppLogger
 from models.model.model_metadata import ModelMetadata
@@ -12,24 +14,35 @@ class AlgorithmFactory:
             from algorithms.algorithm_wrapper import AlgorithmWrapper
             if model.algorithm == Algorithm.KNN:
                 from .knn_classifier import KNNClassifier
-                return AlgorithmWrapper(
-                    KNNClassifier(
-                        model_path=model.clf_path,
-                        n_neighbors=model.n_neighbors,
-                        weight=model.weight
-                    )
+                classifier = KNNClassifier(
+                    model_path=model.clf_path,
+                    n_neighbors=model.n_neighbors,
+                    weight=model.weight,
+                    knn_algo=model.knn_algo,
+                    n_probe=model.n_probe,
+                    storage=model.encoding_storage
                 )
             elif model.algorithm == Algorithm.SVM:
                 from .svm_classifier import SVMClassifier
-                return AlgorithmWrapper(
-                    SVMClassifier(
-                        model_path=model.clf_path,
-                        gamma=model.gamma
-                    )
+                classifier = SVMClassifier(
+                    model_path=model.clf_path,
+                    gamma=model.gamma
+                )
+            elif model.algorithm == Algorithm.CENTROID:
+                from .centroid_classifier import CentroidClassifier
+                classifier = CentroidClassifier(
+                    model_path=model.clf_path,
+                    n_prototypes=model.n_prototypes,
+                    threshold=model.threshold
                 )
             else:
                 raise ValueError(f"Unknown algorithm: {model.algorithm}")
 
+            # training and inference must detect and encode faces the same way
+            classifier.set_detector(get_detector(model.detector, model.detector_upsample))
+            classifier.set_encoder(get_encoder(model.landmark_model, model.num_jitters))
+            return AlgorithmWrapper(classifier)
+
         except Exception as e:
             logger.exception(f"Error creating algorithm for {model.name}: {e}")
             raise
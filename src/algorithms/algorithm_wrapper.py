@@ -22,10 +22,10 @@ class AlgorithmWrapper:
             logger.exception("Error loading model")
             return False
 
-    def predict_webcam(self, frame: np.ndarray) -> Tuple[np.ndarray, int, str]:
+    def predict_webcam(self, frame: np.ndarray, state=None) -> Tuple[np.ndarray, int, str]:
         try:
             if hasattr(self.algorithm, 'predict_webcam'):
-                return self.algorithm.predict_webcam(frame)
+                return self.algorithm.predict_webcam(frame, state)
             else:
                 logger.error("Algorithm does not implement predict_webcam()")
                 return frame, 0, "Error"
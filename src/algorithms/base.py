@@ -1,20 +1,72 @@
+import json
 import pickle
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Tuple, Optional
 
 import cv2
-import face_recognition
 import numpy as np
 from PIL import ImageDraw, Image
-from sklearn.model_selection import train_test_split
 
-from algorithms.face_encoding import FaceEncoding
+from algorithms.encoding_dataset import EncodingDataset
+from algorithms.face_detectors import FaceDetector, FaceLocation, get_detector, select_primary_face
+from algorithms.face_encoder import FaceEncoder, get_encoder
+from algorithms.face_quality import QualityGate
+from algorithms.face_tracker import FaceTracker, recognize_tracked
+from algorithms.motion_detector import MotionDetector
+from core import config
 from core.logger import AppLogger
+from models.person.photo_manifest import PhotoManifest
+from utils.image_loader import load_image, load_image_min_side, scale_locations
+from utils.metrics import metrics
 
 logger = AppLogger().get_logger(__name__)
 
 
+class WebcamState:
+    """Consecutive-frame confirmation of the name seen by one camera stream."""
+
+    def __init__(self):
+        self.identified_name = ""
+        self.counter_frame = 0
+        self.tracker: Optional[FaceTracker] = FaceTracker() if config.camera.TRACK_FACES else None
+
+        # predictions are reused while the scene does not change
+        self.motion: Optional[MotionDetector] = MotionDetector() if config.camera.MOTION_GATE else None
+        self.predictions: List = []
+        self.detected_at = 0.0
+        self.face_seen_at = time.monotonic()
+        self.moving = True
+
+        # set by the frame-rate controller when frames cost more than its budget
+        self.detection_scale = 1.0
+
+    def remember(self, predictions: List, now: float) -> None:
+        self.predictions = predictions
+        self.detected_at = now
+        if predictions:
+            self.face_seen_at = now
+
+    @property
+    def idle(self) -> bool:
+        """No face for ``IDLE_AFTER_SECONDS`` and nothing moving in the latest frame."""
+        return not self.moving and time.monotonic() - self.face_seen_at >= config.camera.IDLE_AFTER_SECONDS
+
+    def update(self, predictions: List, unknown_label: str) -> Tuple[int, str]:
+        """Count frames in a row showing the same single known face."""
+        if len(predictions) == 1 and predictions[0][0]:
+            name = predictions[0][0]
+            if self.identified_name == name:
+                self.counter_frame += 1
+            elif name != unknown_label:
+                self.identified_name = name
+                self.counter_frame = 0
+        else:
+            self.counter_frame = 0
+        return self.counter_frame, self.identified_name
+
+
 class ClassifierBase(ABC):
     MAX_WORKERS = 8
     UNKNOWN_LABEL = "Unknown"
@@ -23,14 +75,17 @@ class ClassifierBase(ABC):
         self.model_name = model_name
         self.model_path = model_path or Path("model.clf")
         self.verbose = verbose
+        self.detector: FaceDetector = get_detector()
+        self.encoder: FaceEncoder = get_encoder()
+        self.quality = QualityGate()
 
-        self.train_data: List[FaceEncoding] = []
-        self.test_data: List[FaceEncoding] = []
+        self.train_data = EncodingDataset()
+        self.test_data = EncodingDataset()
         self.classifier = None
         self.accuracy = 0.0
 
-        self.identified_name = ""
-        self.counter_frame = 0
+        # confirmation state of the default stream, other cameras pass their own
+        self.webcam_state = WebcamState()
 
         self.train_persons: List[str] = []
         self.test_persons: List[str] = []
@@ -43,10 +98,16 @@ class ClassifierBase(ABC):
     def predict(self, encoding: np.ndarray) -> str:
         pass
 
+    def set_detector(self, detector: FaceDetector) -> None:
+        self.detector = detector
+        logger.info(f"Set {self.model_name} face detector to {detector.name}")
+
+    def set_encoder(self, encoder: FaceEncoder) -> None:
+        self.encoder = encoder
+        logger.info(f"Set {self.model_name} face encoder to {encoder.name}")
+
     def _load_training_data(self) -> bool:
         try:
-            self.train_data.clear()
-            self.test_data.clear()
             self.train_persons.clear()
             self.test_persons.clear()
 
@@ -56,10 +117,12 @@ class ClassifierBase(ABC):
                 logger.warning("No persons with photos found")
                 return False
 
-            total_encodings = 0
+            dataset = EncodingDataset()
+            rejected_faces = []
+            quality = QualityGate()
 
             for person in persons:
-                person_encodings = []
+                manifest = PhotoManifest.load(person.manifest_path)
 
                 for photo_path in person.photo_paths:
                     try:
@@ -67,55 +130,72 @@ class ClassifierBase(ABC):
                             logger.warning(f"Photo not found: {photo_path}")
                             continue
 
-                        image = face_recognition.load_image_file(str(photo_path))
-                        face_locations = face_recognition.face_locations(image)
+                        # boxes come from the manifest, detection only runs for new photos
+                        record = person_service.ingestor.scan(
+                            person, Path(photo_path), manifest, self.detector
+                        )
+                        if record is None:
+                            continue
+
+                        face_locations = record.face_locations(self.detector.name)
                         if not face_locations:
                             logger.debug(f"No faces detected in: {photo_path}")
                             continue
 
-                        encodings = face_recognition.face_encodings(
-                            image,
-                            known_face_locations=face_locations
-                        )
+                        image, _ = load_image(person.resized_path / record.resized)
+                        scale = record.scale
 
-                        for encoding in encodings:
-                            person_encodings.append(
-                                FaceEncoding(encoding=encoding, name=person.name)
+                        if config.model.PRIMARY_FACE_ONLY and len(face_locations) > 1:
+                            primary = select_primary_face(face_locations, image.shape)
+                            rejected_faces.extend(
+                                {"person": person.name, "photo": str(photo_path), "box": list(box)}
+                                for loc in face_locations if loc != primary
+                                for box in scale_locations([loc], scale)
                             )
-                            total_encodings += 1
+                            face_locations = [primary]
+
+                        face_locations, low_quality = quality.filter(image, face_locations)
+                        rejected_faces.extend(
+                            {"person": person.name, "photo": str(photo_path), "box": list(box), "reason": reason}
+                            for loc, reason in low_quality
+                            for box in scale_locations([loc], scale)
+                        )
+                        if not face_locations:
+                            logger.debug(f"No usable face in: {photo_path} ({low_quality[0][1]})")
+                            continue
+
+                        if config.model.ENCODE_FULL_RESOLUTION and scale != 1.0:
+                            image, _ = load_image(photo_path)
+                            face_locations = scale_locations(face_locations, scale)
+
+                        encodings = self.encoder.encode(image, face_locations)
+                        dataset.add(encodings, person.name)
 
                     except Exception as e:
                         logger.warning(f"Error processing photo {photo_path}: {e}")
                         continue
 
-                # split person's encodings into train/test
-                if len(person_encodings) > 0:
-                    if len(person_encodings) >= 2:
-                        # 80/20 split
-                        train, test = train_test_split(
-                            person_encodings,
-                            test_size=0.2,
-                            random_state=42
-                        )
-                        self.train_data.extend(train)
-                        self.test_data.extend(test)
-                    else:
-                        # only 1 encoding, put in training
-                        self.train_data.extend(person_encodings)
-
-                    # track persons in training
-                    if person.name not in self.train_persons:
-                        self.train_persons.append(person.name)
-                    if any(fe.name == person.name for fe in self.test_data):
-                        if person.name not in self.test_persons:
-                            self.test_persons.append(person.name)
+                if manifest.dirty:
+                    manifest.save(person.manifest_path)
+
+            if quality.checked:
+                logger.info(f"Training photo quality: {quality.summary()}")
+            if rejected_faces:
+                logger.info(f"Skipped {len(rejected_faces)} faces in training photos")
+                if config.model.SAVE_REJECTED_FACES:
+                    self._save_rejected_faces(rejected_faces)
+
+            # 80/20 split per person, persons with a single encoding go to training only
+            self.train_data, self.test_data = dataset.split(test_size=0.2, seed=42)
+            self.train_persons = self.train_data.persons()
+            self.test_persons = self.test_data.persons()
 
             if not self.train_data:
                 logger.error("No training data extracted from persons")
                 return False
 
             logger.info(
-                f"Loaded {total_encodings} encodings from {len(persons)} persons. "
+                f"Loaded {len(dataset)} encodings from {len(persons)} persons. "
                 f"Train: {len(self.train_data)}, Test: {len(self.test_data)}"
             )
             return True
@@ -124,23 +204,21 @@ class ClassifierBase(ABC):
             logger.exception(f"Error loading training data: {e}")
             return False
 
-    def _prepare_training_data(self) -> Tuple[List, List]:
+    def _save_rejected_faces(self, rejected_faces: List[dict]) -> None:
+        path = self.model_path.parent / config.model.REJECTED_FACES_FILE
         try:
-            x_train = [enc.encoding for enc in self.train_data]
-            y_train = [enc.name for enc in self.train_data]
-            return x_train, y_train
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(rejected_faces, f, indent=4)
+            logger.info(f"Rejected face boxes saved to {path}")
         except Exception as e:
-            logger.exception(f"Error preparing training data: {e}")
-            return [], []
+            logger.error(f"Cannot save rejected faces to {path}: {e}")
 
-    def _prepare_test_data(self) -> Tuple[List, List]:
-        try:
-            x_test = [enc.encoding for enc in self.test_data]
-            y_test = [enc.name for enc in self.test_data]
-            return x_test, y_test
-        except Exception as e:
-            logger.exception(f"Error preparing test data: {e}")
-            return [], []
+    def _prepare_training_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.train_data.encodings, self.train_data.names
+
+    def _prepare_test_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.test_data.encodings, self.test_data.names
 
     def evaluate(self) -> None:
         try:
@@ -151,8 +229,7 @@ class ClassifierBase(ABC):
 
             x_test, y_test = self._prepare_test_data()
             predictions = self.classifier.predict(x_test)
-            correct = sum(1 for p, t in zip(predictions, y_test) if p == t)
-            self.accuracy = correct / len(y_test) if y_test else 0.0
+            self.accuracy = float(np.mean(np.asarray(predictions, dtype=object) == y_test))
 
             logger.info(f"Model accuracy: {self.accuracy:.2%}")
 
@@ -195,15 +272,12 @@ class ClassifierBase(ABC):
 
         try:
             image = self._load_and_resize_image(image_path)
-            face_locations = face_recognition.face_locations(image)
+            face_locations = self.detector.detect(image)
 
             if not face_locations:
                 return image, self.UNKNOWN_LABEL
 
-            face_encodings = face_recognition.face_encodings(
-                image,
-                known_face_locations=face_locations
-            )
+            face_encodings = self.encoder.encode(image, face_locations)
 
             predictions = [
                 (self.predict(enc), loc) for enc, loc in zip(face_encodings, face_locations)
@@ -215,23 +289,73 @@ class ClassifierBase(ABC):
             logger.exception(f"Error predicting from image {image_path}: {e}")
             raise
 
-    def predict_webcam(self, frame: np.ndarray) -> Tuple[np.ndarray, int, str]:
+    def detect_faces(self, frame: np.ndarray, scale: float = 1.0) -> List[FaceLocation]:
+        """Face boxes of ``frame``, detected on a copy reduced by ``scale`` when below 1."""
+        if scale >= 1.0:
+            with metrics.timer("recognize.detect"):
+                return self.detector.detect(frame)
+        with metrics.timer("recognize.resize"):
+            small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        with metrics.timer("recognize.detect"):
+            return scale_locations(self.detector.detect(small), 1.0 / scale)
+
+    def _encode(self, frame: np.ndarray, face_locations: List[FaceLocation]) -> List[np.ndarray]:
+        with metrics.timer("recognize.encode"):
+            return self.encoder.encode(frame, face_locations)
+
+    def _classify(self, encoding: np.ndarray) -> str:
+        with metrics.timer("recognize.classify"):
+            return self.predict(encoding)
+
+    def recognize_faces(self, frame: np.ndarray, tracker: Optional[FaceTracker] = None,
+                        detection_scale: float = 1.0) -> List[Tuple[str, FaceLocation]]:
+        """``(name, location)`` for every face of an RGB frame.
+
+        With a ``tracker`` of consecutive frames, faces it has confirmed reuse their name.
+        """
+        face_locations = self.detect_faces(frame, detection_scale)
+        if tracker is not None:
+            return recognize_tracked(tracker, frame, face_locations, self._encode, self._classify,
+                                     self.quality.accept)
+
+        face_locations, _ = self.quality.filter(frame, face_locations)
+        if not face_locations:
+            return []
+
+        face_encodings = self._encode(frame, face_locations)
+        return [(self._classify(enc), loc) for enc, loc in zip(face_encodings, face_locations)]
+
+    def recognize_stream(self, frame: np.ndarray, state: WebcamState) -> List[Tuple[str, FaceLocation]]:
+        """``recognize_faces`` for consecutive frames of one stream.
+
+        Detection is skipped while the frame shows the same scene as the last detected one,
+        but runs at least every ``MOTION_REDETECT_SECONDS``.
+        """
+        now = time.monotonic()
+        if state.motion is not None:
+            with metrics.timer("recognize.motion"):
+                state.moving = state.motion.changed(frame)
+            if not state.moving and now - state.detected_at < config.camera.MOTION_REDETECT_SECONDS:
+                metrics.count("motion.detection_skipped")
+                return state.predictions
+
+        predictions = self.recognize_faces(frame, state.tracker, state.detection_scale)
+        state.remember(predictions, now)
+        return predictions
+
+    def predict_webcam(self, frame: np.ndarray, state: Optional[WebcamState] = None) -> Tuple[np.ndarray, int, str]:
         if self.classifier is None:
             raise ValueError("Classifier not trained or loaded")
 
+        state = state or self.webcam_state
         try:
-            face_locations = face_recognition.face_locations(frame)
+            predictions = self.recognize_stream(frame, state)
 
-            if not face_locations:
-                self.counter_frame = 0
-                return frame, self.counter_frame, ""
-
-            face_encodings = face_recognition.face_encodings(frame, face_locations)
-            predictions = [
-                (self.predict(enc), loc) for enc, loc in zip(face_encodings, face_locations)
-            ]
+            if not predictions:
+                state.counter_frame = 0
+                return frame, state.counter_frame, ""
 
-            return self._draw_predictions_on_webcam(frame, predictions)
+            return self._draw_predictions_on_webcam(frame, predictions, state)
 
         except Exception as e:
             logger.exception(f"Error predicting from webcam frame: {e}")
@@ -239,7 +363,7 @@ class ClassifierBase(ABC):
 
     @staticmethod
     def _load_and_resize_image(image_path: str, max_dimension: int = 400) -> np.ndarray:
-        image = face_recognition.load_image_file(image_path)
+        image = load_image_min_side(image_path, max_dimension)
         h, w = image.shape[:2]
 
         if w < h:
@@ -266,28 +390,21 @@ class ClassifierBase(ABC):
         del draw
         return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR), last_name
 
-    def _draw_predictions_on_webcam(self, frame: np.ndarray, predictions: List) -> Tuple[
-        np.ndarray, int, str]:
+    def _draw_predictions_on_webcam(self, frame: np.ndarray, predictions: List,
+                                    state: WebcamState) -> Tuple[np.ndarray, int, str]:
+        with metrics.timer("recognize.draw"):
+            frame = self.draw_predictions(frame, predictions)
+        counter, name = state.update(predictions, self.UNKNOWN_LABEL)
+        return frame, counter, name
+
+    @staticmethod
+    def draw_predictions(frame: np.ndarray, predictions: List) -> np.ndarray:
         pil_frame = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
         draw = ImageDraw.Draw(pil_frame)
 
-        current_name = None
-
         for name, (top, right, bottom, left) in predictions:
-            current_name = name
             draw.rectangle(((left, top), (right, bottom)), outline=(0, 255, 0), width=2)
             draw.text((left, top - 10), str(name), fill=(0, 255, 0))
 
         del draw
-        frame = cv2.cvtColor(np.array(pil_frame), cv2.COLOR_RGB2BGR)
-
-        if len(predictions) == 1 and current_name:
-            if self.identified_name == current_name:
-                self.counter_frame += 1
-            elif current_name != self.UNKNOWN_LABEL:
-                self.identified_name = current_name
-                self.counter_frame = 0
-        else:
-            self.counter_frame = 0
-
-        return frame, self.counter_frame, self.identified_name
+        return cv2.cvtColor(np.array(pil_frame), cv2.COLOR_RGB2BGR)
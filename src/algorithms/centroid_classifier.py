@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from algorithms import ClassifierBase
+from core.logger import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+
+class NearestCentroidModel:
+    """Condensed gallery: a few float32 prototypes per person.
+
+    ``predict`` mirrors the sklearn estimator API used by ``ClassifierBase.evaluate``,
+    so the model can be pickled to ``model.clf`` like the KNN/SVM estimators.
+    """
+
+    def __init__(self, prototypes: np.ndarray, prototype_labels: np.ndarray,
+                 labels: List[str], class_thresholds: np.ndarray):
+        self.prototypes = prototypes.astype(np.float32)
+        self.prototype_labels = prototype_labels.astype(np.int32)
+        self.labels = list(labels)
+        self.class_thresholds = class_thresholds.astype(np.float32)
+
+    @property
+    def nbytes(self) -> int:
+        return self.prototypes.nbytes + self.prototype_labels.nbytes + self.class_thresholds.nbytes
+
+    def nearest(self, x: np.ndarray):
+        x = np.atleast_2d(np.asarray(x, dtype=np.float32))
+        # ||a - b||^2 = ||a||^2 - 2ab + ||b||^2, one matrix product for the whole batch
+        sq = (
+                np.einsum('ij,ij->i', x, x)[:, None]
+                - 2.0 * x @ self.prototypes.T
+                + np.einsum('ij,ij->i', self.prototypes, self.prototypes)[None, :]
+        )
+        idx = np.argmin(sq, axis=1)
+        distances = np.sqrt(np.maximum(sq[np.arange(len(x)), idx], 0.0))
+        return distances, self.prototype_labels[idx]
+
+    def predict(self, x) -> np.ndarray:
+        _, label_ids = self.nearest(x)
+        return np.asarray(self.labels, dtype=object)[label_ids]
+
+
+class CentroidClassifier(ClassifierBase):
+    RADIUS_TOLERANCE = 1.25
+    KMEANS_SEED = 42
+
+    def __init__(self, model_path: Path, n_prototypes: Optional[int] = None,
+                 threshold: float = 0.6, verbose: bool = True):
+        super().__init__("Centroid", model_path, verbose)
+        self.n_prototypes = n_prototypes if n_prototypes and n_prototypes > 0 else 1
+        self.threshold = threshold
+
+    def train(self) -> bool:
+        if not self._load_training_data():
+            logger.warning("No training data found")
+            return False
+
+        if not self.train_data:
+            logger.warning("No face encodings found in training data")
+            return False
+
+        x_train, y_train = self._prepare_training_data()
+
+        try:
+            x_train = np.asarray(x_train, dtype=np.float32)
+            labels, y_ids = np.unique(np.asarray(y_train), return_inverse=True)
+
+            prototypes, prototype_labels, radii = [], [], []
+            for label_id in range(len(labels)):
+                person_x = x_train[y_ids == label_id]
+                centers = self._condense(person_x)
+
+                d = np.linalg.norm(person_x[:, None, :] - centers[None, :, :], axis=2).min(axis=1)
+                # single encoding has no spread, fall back to the global threshold
+                radii.append(d.max() * self.RADIUS_TOLERANCE if len(person_x) > 1 else np.inf)
+
+                prototypes.append(centers)
+                prototype_labels.extend([label_id] * len(centers))
+
+            self.classifier = NearestCentroidModel(
+                prototypes=np.vstack(prototypes),
+                prototype_labels=np.asarray(prototype_labels),
+                labels=[str(label) for label in labels],
+                class_thresholds=np.asarray(radii),
+            )
+            logger.info(
+                f"Condensed {len(x_train)} encodings into {len(prototype_labels)} prototypes "
+                f"({self.classifier.nbytes / 1024:.1f} KiB)"
+            )
+
+            if self.test_data:
+                self.evaluate()
+            else:
+                logger.warning("No test data available")
+
+            return self.save_model()
+        except Exception as e:
+            logger.error(f"Error training Centroid: {e}")
+            return False
+
+    def _condense(self, person_x: np.ndarray) -> np.ndarray:
+        n_clusters = min(self.n_prototypes, len(person_x))
+        if n_clusters == 1:
+            return person_x.mean(axis=0, keepdims=True)
+
+        from sklearn.cluster import KMeans
+        kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=self.KMEANS_SEED)
+        kmeans.fit(person_x)
+        return kmeans.cluster_centers_.astype(np.float32)
+
+    def predict(self, encoding: np.ndarray) -> str:
+        if self.classifier is None:
+            raise ValueError("Classifier not trained")
+
+        try:
+            distances, label_ids = self.classifier.nearest(encoding)
+            label_id = label_ids[0]
+            threshold = min(self.threshold, self.classifier.class_thresholds[label_id])
+
+            if distances[0] <= threshold:
+                return self.classifier.labels[label_id]
+            return self.UNKNOWN_LABEL
+
+        except Exception as e:
+            logger.exception(f"Error predicting with Centroid: {e}")
+            return self.UNKNOWN_LABEL
+
+    def set_threshold(self, threshold: float) -> None:
+        if not 0 <= threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1")
+        self.threshold = threshold
+        logger.info(f"Set Centroid threshold to {threshold}")
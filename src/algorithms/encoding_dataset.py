@@ -0,0 +1,101 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class EncodingDataset:
+    """Face encodings packed into one float32 matrix with int32 indices into a label table.
+
+    Rows are appended into a preallocated buffer that doubles when full, so loading
+    N encodings costs O(N) copies instead of one Python object per encoding.
+    """
+
+    ENCODING_SIZE = 128
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, labels: Optional[Sequence[str]] = None, capacity: int = INITIAL_CAPACITY):
+        self.labels: List[str] = list(labels or [])
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+        self._encodings = np.empty((max(1, capacity), self.ENCODING_SIZE), dtype=np.float32)
+        self._label_ids = np.empty(max(1, capacity), dtype=np.int32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def encodings(self) -> np.ndarray:
+        return self._encodings[:self._size]
+
+    @property
+    def label_ids(self) -> np.ndarray:
+        return self._label_ids[:self._size]
+
+    @property
+    def names(self) -> np.ndarray:
+        return np.asarray(self.labels, dtype=object)[self.label_ids]
+
+    @property
+    def nbytes(self) -> int:
+        return self.encodings.nbytes + self.label_ids.nbytes
+
+    def persons(self) -> List[str]:
+        """Labels that have at least one encoding, in label table order."""
+        present = np.bincount(self.label_ids, minlength=len(self.labels)) > 0
+        return [label for label, has_rows in zip(self.labels, present) if has_rows]
+
+    def add(self, encodings, label: str) -> None:
+        encodings = np.asarray(encodings, dtype=np.float32).reshape(-1, self.ENCODING_SIZE)
+        if not len(encodings):
+            return
+
+        if label not in self._label_index:
+            self._label_index[label] = len(self.labels)
+            self.labels.append(label)
+
+        self._reserve(self._size + len(encodings))
+        end = self._size + len(encodings)
+        self._encodings[self._size:end] = encodings
+        self._label_ids[self._size:end] = self._label_index[label]
+        self._size = end
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._label_ids)
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+        self._encodings = self._grow(self._encodings, capacity)
+        self._label_ids = self._grow(self._label_ids, capacity)
+
+    def _grow(self, array: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:self._size] = array[:self._size]
+        return grown
+
+    def take(self, rows: np.ndarray) -> "EncodingDataset":
+        subset = EncodingDataset(self.labels, capacity=len(rows))
+        subset._encodings[:len(rows)] = self.encodings[rows]
+        subset._label_ids[:len(rows)] = self.label_ids[rows]
+        subset._size = len(rows)
+        return subset
+
+    def split(self, test_size: float = 0.2, seed: int = 42) -> Tuple["EncodingDataset", "EncodingDataset"]:
+        """Stratified split; persons with a single encoding stay entirely in the train set.
+
+        Each person contributes ``ceil(test_size * count)`` encodings to the test set, the
+        same per-person sizes as ``train_test_split`` but without a Python loop per person.
+        """
+        label_ids = self.label_ids
+        counts = np.bincount(label_ids, minlength=len(self.labels))
+        n_test = np.where(counts >= 2, np.ceil(counts * test_size), 0).astype(np.int64)
+
+        # shuffle inside each person: sort by label, then by a random key
+        rng = np.random.default_rng(seed)
+        order = np.lexsort((rng.random(len(self)), label_ids))
+        starts = np.cumsum(counts) - counts
+        rank = np.arange(len(self)) - starts[label_ids[order]]
+
+        is_test = rank < n_test[label_ids[order]]
+        return self.take(np.sort(order[~is_test])), self.take(np.sort(order[is_test]))
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from core import config, Detector
+from core.logger import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+# (top, right, bottom, left), the box format used by face_recognition
+FaceLocation = Tuple[int, int, int, int]
+
+
+def select_primary_face(face_locations: List[FaceLocation], image_shape: Tuple[int, ...]) -> FaceLocation:
+    """Pick the face the photo is most likely about: large and close to the center."""
+    h, w = image_shape[:2]
+    half_diagonal = np.hypot(w, h) / 2
+
+    def score(location):
+        top, right, bottom, left = location
+        offset = np.hypot((left + right) / 2 - w / 2, (top + bottom) / 2 - h / 2)
+        # a face at the border keeps half of its area score
+        return (right - left) * (bottom - top) * (1.0 - 0.5 * offset / half_diagonal)
+
+    return max(face_locations, key=score)
+
+
+class FaceDetector(ABC):
+    """Finds face boxes in an RGB ``uint8`` image."""
+
+    detector_type: Detector
+
+    @abstractmethod
+    def detect(self, image: np.ndarray) -> List[FaceLocation]:
+        pass
+
+    @property
+    def name(self) -> str:
+        return self.detector_type.value
+
+
+class DlibHOGDetector(FaceDetector):
+    """dlib HOG + linear SVM; each upsampling step finds smaller faces at ~4x the cost."""
+
+    detector_type = Detector.HOG
+
+    def __init__(self, upsample: int = 1):
+        self.upsample = max(0, upsample)
+
+    def detect(self, image: np.ndarray) -> List[FaceLocation]:
+        import face_recognition
+        return face_recognition.face_locations(
+            image,
+            number_of_times_to_upsample=self.upsample,
+            model="hog"
+        )
+
+    @property
+    def name(self) -> str:
+        return f"{self.detector_type.value} (upsample {self.upsample})"
+
+
+class CascadeDetector(FaceDetector):
+    """OpenCV cascade classifier; the cascade file is parsed once per instance."""
+
+    SCALE_FACTOR = 1.1
+    MIN_NEIGHBORS = 5
+    MIN_SIZE = (30, 30)
+
+    def __init__(self, cascade_path: Path):
+        if not cascade_path.exists():
+            raise FileNotFoundError(f"Cascade file not found: {cascade_path}")
+
+        self.cascade = cv2.CascadeClassifier(str(cascade_path))
+        if self.cascade.empty():
+            raise ValueError(f"Cannot load cascade: {cascade_path}")
+
+    def detect(self, image: np.ndarray) -> List[FaceLocation]:
+        gray = cv2.equalizeHist(cv2.cvtColor(image, cv2.COLOR_RGB2GRAY))
+        boxes = self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.SCALE_FACTOR,
+            minNeighbors=self.MIN_NEIGHBORS,
+            minSize=self.MIN_SIZE
+        )
+        return [(int(y), int(x + w), int(y + h), int(x)) for x, y, w, h in boxes]
+
+
+class HaarCascadeDetector(CascadeDetector):
+    detector_type = Detector.HAAR
+    CASCADE_FILE = "haarcascade_frontalface_default.xml"
+
+    def __init__(self):
+        super().__init__(Path(cv2.data.haarcascades) / self.CASCADE_FILE)
+
+
+@lru_cache(maxsize=None)
+def get_detector(detector: Optional[Detector] = None, upsample: Optional[int] = None) -> FaceDetector:
+    """Shared detector instance for the given settings, defaults come from the config."""
+    detector = Detector(detector or config.model.DEFAULT_DETECTOR)
+
+    if detector == Detector.HOG:
+        if upsample is None:
+            upsample = config.model.DEFAULT_DETECTOR_UPSAMPLE
+        return DlibHOGDetector(upsample=upsample)
+    elif detector == Detector.HAAR:
+        return HaarCascadeDetector()
+
+    raise ValueError(f"Unknown detector: {detector}")
@@ -0,0 +1,110 @@
+from collections import Counter
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from algorithms.face_detectors import FaceLocation
+from core import config
+from core.logger import AppLogger
+from utils.metrics import metrics
+
+logger = AppLogger().get_logger(__name__)
+
+SMALL = "small"
+BLURRY = "blurry"
+DARK = "dark"
+BRIGHT = "bright"
+TURNED = "turned"
+
+# sharpness is measured on the face scaled to this width, so it does not depend on face size
+SHARPNESS_WIDTH = 64
+
+
+class QualityGate:
+    """Rejects faces not worth encoding, cheapest checks first.
+
+    Box size, then Laplacian variance of the grey face (sharpness), then its mean
+    (brightness), then, with ``QUALITY_CHECK_POSE``, the nose offset from the middle of the
+    eyes in the 5-point landmarks (yaw). ``skipped`` counts the reasons faces were rejected.
+    """
+
+    def __init__(self):
+        self.enabled = config.model.QUALITY_GATE
+        self.checked = 0
+        self.skipped: Counter = Counter()
+
+    def check(self, image: np.ndarray, location: FaceLocation) -> Optional[str]:
+        """Reason to skip the face at ``location`` of an RGB image, ``None`` when it is fine."""
+        with metrics.timer("recognize.quality"):
+            reason = self._check(image, location)
+        self.checked += 1
+        if reason:
+            self.skipped[reason] += 1
+            metrics.count(f"quality.{reason}")
+        return reason
+
+    def filter(self, image: np.ndarray, locations: List[FaceLocation]
+               ) -> Tuple[List[FaceLocation], List[Tuple[FaceLocation, str]]]:
+        """Accepted locations and ``(location, reason)`` of the rejected ones."""
+        if not self.enabled:
+            return list(locations), []
+
+        accepted, rejected = [], []
+        for location in locations:
+            reason = self.check(image, location)
+            if reason:
+                rejected.append((location, reason))
+            else:
+                accepted.append(location)
+        return accepted, rejected
+
+    def accept(self, image: np.ndarray, location: FaceLocation) -> bool:
+        return not self.enabled or self.check(image, location) is None
+
+    def summary(self) -> str:
+        reasons = ", ".join(f"{count} {reason}" for reason, count in self.skipped.most_common())
+        return f"{sum(self.skipped.values())} of {self.checked} faces skipped" + (f" ({reasons})" if reasons else "")
+
+    def _check(self, image: np.ndarray, location: FaceLocation) -> Optional[str]:
+        top, right, bottom, left = location
+        if min(right - left, bottom - top) < config.model.QUALITY_MIN_FACE_SIZE:
+            return SMALL
+
+        h, w = image.shape[:2]
+        crop = image[max(0, top):min(h, bottom), max(0, left):min(w, right)]
+        if crop.size == 0:
+            return SMALL
+
+        grey = cv2.cvtColor(crop, cv2.COLOR_RGB2GRAY)
+        scaled_height = max(1, round(grey.shape[0] * SHARPNESS_WIDTH / grey.shape[1]))
+        grey = cv2.resize(grey, (SHARPNESS_WIDTH, scaled_height), interpolation=cv2.INTER_AREA)
+        if cv2.Laplacian(grey, cv2.CV_64F).var() < config.model.QUALITY_MIN_SHARPNESS:
+            return BLURRY
+
+        brightness = float(grey.mean())
+        if brightness < config.model.QUALITY_MIN_BRIGHTNESS:
+            return DARK
+        if brightness > config.model.QUALITY_MAX_BRIGHTNESS:
+            return BRIGHT
+
+        if config.model.QUALITY_CHECK_POSE and abs(self.yaw(image, location)) > config.model.QUALITY_MAX_YAW:
+            return TURNED
+        return None
+
+    @staticmethod
+    def yaw(image: np.ndarray, location: FaceLocation) -> float:
+        """Nose offset from the middle of the eyes in eye distances; 0 is frontal, ~0.5 profile."""
+        import face_recognition
+        landmarks = face_recognition.face_landmarks(image, face_locations=[location], model="small")
+        if not landmarks:
+            return 0.0
+
+        points = landmarks[0]
+        left_eye = np.mean(points["left_eye"], axis=0)
+        right_eye = np.mean(points["right_eye"], axis=0)
+        nose = np.mean(points["nose_tip"], axis=0)
+        eye_distance = np.linalg.norm(right_eye - left_eye)
+        if eye_distance == 0:
+            return 0.0
+        return float((nose[0] - (left_eye[0] + right_eye[0]) / 2) / eye_distance)
@@ -0,0 +1,127 @@
+import itertools
+import time
+from typing import List, Optional, Tuple
+
+from algorithms.face_detectors import FaceLocation
+from core import config
+from utils.metrics import metrics
+
+
+def box_iou(a: FaceLocation, b: FaceLocation) -> float:
+    """Intersection over union of two ``(top, right, bottom, left)`` boxes."""
+    top, right = max(a[0], b[0]), min(a[1], b[1])
+    bottom, left = min(a[2], b[2]), max(a[3], b[3])
+    inter = max(0, right - left) * max(0, bottom - top)
+    if inter == 0:
+        return 0.0
+    area_a = (a[1] - a[3]) * (a[2] - a[0])
+    area_b = (b[1] - b[3]) * (b[2] - b[0])
+    return inter / float(area_a + area_b - inter)
+
+
+class FaceTrack:
+    def __init__(self, track_id: int, location: FaceLocation):
+        self.track_id = track_id
+        self.location = location
+        self.name: Optional[str] = None
+        self.confirmations = 0
+        self.missed = 0
+        self.verified_at = 0.0
+        self.jumped = False
+
+    @property
+    def confirmed(self) -> bool:
+        return self.confirmations >= config.camera.TRACK_CONFIRM_FRAMES
+
+
+class FaceTracker:
+    """Follows faces across frames of one stream by box overlap and caches their identity.
+
+    Each detected box continues the track it overlaps most. A track whose name came out the
+    same ``TRACK_CONFIRM_FRAMES`` times in a row is confirmed: its faces skip encoding and
+    classification until ``TRACK_REVERIFY_SECONDS`` have passed or the box jumps (overlaps
+    its previous position less than ``TRACK_JUMP_IOU``), which is usually another person
+    stepping into the same spot.
+    """
+
+    def __init__(self):
+        self.tracks: List[FaceTrack] = []
+        self.encoded = 0
+        self.cached = 0
+        self._ids = itertools.count(1)
+
+    def assign(self, locations: List[FaceLocation]) -> List[FaceTrack]:
+        """Track of every location, in order; unmatched tracks age and are dropped."""
+        pairs = sorted(
+            ((box_iou(track.location, location), t, l)
+             for t, track in enumerate(self.tracks) for l, location in enumerate(locations)),
+            reverse=True,
+        )
+        assigned: List[Optional[FaceTrack]] = [None] * len(locations)
+        used = set()
+        for iou, t, l in pairs:
+            if iou < config.camera.TRACK_MATCH_IOU:
+                break
+            if t in used or assigned[l] is not None:
+                continue
+            track = self.tracks[t]
+            track.jumped = iou < config.camera.TRACK_JUMP_IOU
+            track.location = locations[l]
+            track.missed = 0
+            assigned[l] = track
+            used.add(t)
+
+        for t, track in enumerate(self.tracks):
+            if t not in used:
+                track.missed += 1
+        self.tracks = [track for track in self.tracks if track.missed <= config.camera.TRACK_MAX_MISSED]
+
+        for l, location in enumerate(locations):
+            if assigned[l] is None:
+                assigned[l] = FaceTrack(next(self._ids), location)
+                self.tracks.append(assigned[l])
+        return assigned
+
+    def needs_encoding(self, track: FaceTrack, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        if not track.confirmed or track.jumped:
+            return True
+        return now - track.verified_at >= config.camera.TRACK_REVERIFY_SECONDS
+
+    def observe(self, track: FaceTrack, name: str, now: Optional[float] = None) -> None:
+        """Record a fresh prediction; a different name starts the confirmation over."""
+        if name == track.name:
+            track.confirmations += 1
+        else:
+            track.name = name
+            track.confirmations = 1
+        track.verified_at = time.monotonic() if now is None else now
+        track.jumped = False
+
+    def reset(self) -> None:
+        self.tracks = []
+
+
+def recognize_tracked(tracker: FaceTracker, frame, locations: List[FaceLocation],
+                      encode, predict, accept=None) -> List[Tuple[str, FaceLocation]]:
+    """``(name, location)`` per face, encoding only faces without a confirmed cached name.
+
+    ``accept(frame, location)`` can veto encoding a face; it keeps the cached name, if any.
+    """
+    now = time.monotonic()
+    tracks = tracker.assign(locations)
+    pending = [
+        i for i, track in enumerate(tracks)
+        if tracker.needs_encoding(track, now) and (accept is None or accept(frame, locations[i]))
+    ]
+
+    if pending:
+        encodings = encode(frame, [locations[i] for i in pending])
+        for i, encoding in zip(pending, encodings):
+            tracker.observe(tracks[i], predict(encoding), now)
+    tracker.encoded += len(pending)
+    tracker.cached += len(tracks) - len(pending)
+    metrics.count("track.encoded", len(pending))
+    metrics.count("track.cached", len(tracks) - len(pending))
+
+    return [(track.name, location) for track, location in zip(tracks, locations) if track.name is not None]
@@ -0,0 +1,189 @@
+import math
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from algorithms.quantization import EncodingStore, STORES, create_store
+from core.logger import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+
+def nearest_centers(x: np.ndarray, centers: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+    """Index of the closest center for every row of ``x``, computed in chunks to bound memory."""
+    centers_sq = np.einsum('ij,ij->i', centers, centers)
+    out = np.empty(len(x), dtype=np.int64)
+    for start in range(0, len(x), chunk_size):
+        block = x[start:start + chunk_size]
+        # ||x||^2 is constant per row and does not change the argmin
+        out[start:start + chunk_size] = np.argmin(centers_sq[None, :] - 2.0 * block @ centers.T, axis=1)
+    return out
+
+
+def kmeans(x: np.ndarray, n_clusters: int, n_iter: int = 20, max_samples: Optional[int] = None,
+           seed: int = 42) -> np.ndarray:
+    """Plain Lloyd k-means on (a sample of) ``x``; returns float32 cluster centers."""
+    rng = np.random.default_rng(seed)
+    x = np.asarray(x, dtype=np.float32)
+
+    if max_samples and len(x) > max_samples:
+        x = x[rng.choice(len(x), size=max_samples, replace=False)]
+
+    n_clusters = max(1, min(n_clusters, len(x)))
+    centers = x[rng.choice(len(x), size=n_clusters, replace=False)].copy()
+
+    for _ in range(n_iter):
+        assignment = nearest_centers(x, centers)
+        counts = np.bincount(assignment, minlength=n_clusters)
+        order = np.argsort(assignment, kind="stable")
+
+        filled = np.flatnonzero(counts)
+        starts = (np.cumsum(counts) - counts)[filled]
+        sums = np.add.reduceat(x[order], starts, axis=0)
+        centers[filled] = sums / counts[filled, None]
+
+        empty = counts == 0
+        if empty.any():
+            # re-seed empty clusters on random points instead of dropping them
+            centers[empty] = x[rng.choice(len(x), size=int(empty.sum()), replace=False)]
+
+    return centers
+
+
+class IVFNeighborsClassifier:
+    """Inverted-file k-NN: a k-means coarse quantizer plus one inverted list per centroid.
+
+    A query is compared only against the vectors of the ``n_probe`` closest lists. The
+    estimator follows the subset of the ``KNeighborsClassifier`` API used by
+    ``KNNClassifier`` (``fit``, ``kneighbors``, ``predict``). Vectors live in an
+    ``EncodingStore`` (float32, float16 or int8); with ``n_lists=1`` the index is an exact
+    flat search over the compressed vectors. Index arrays are stored in a separate ``.npz``
+    file next to ``model.clf``; the pickle only keeps the parameters.
+    """
+
+    _ARRAYS = ("centroids", "label_ids", "list_offsets")
+    _STORE_PREFIX = "store_"
+    TRAIN_SAMPLES_PER_LIST = 256
+
+    def __init__(self, n_neighbors: int = 5, weights: str = "distance",
+                 n_lists: Optional[int] = None, n_probe: int = 8, storage: str = "float32"):
+        self.n_neighbors = n_neighbors
+        self.weights = weights
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.storage = storage if storage in STORES else "float32"
+
+        self.classes_ = np.asarray([], dtype=object)
+        self.centroids: Optional[np.ndarray] = None
+        self.store: Optional[EncodingStore] = None
+        self.label_ids: Optional[np.ndarray] = None
+        self.list_offsets: Optional[np.ndarray] = None
+
+    def fit(self, x, y) -> "IVFNeighborsClassifier":
+        x = np.asarray(x, dtype=np.float32)
+        self.classes_, y_ids = np.unique(np.asarray(y), return_inverse=True)
+        self.classes_ = self.classes_.astype(object)
+
+        n_lists = self.n_lists or max(1, int(round(math.sqrt(len(x)))))
+        self.centroids = kmeans(x, n_lists, max_samples=n_lists * self.TRAIN_SAMPLES_PER_LIST)
+        self.n_lists = len(self.centroids)
+
+        assignment = nearest_centers(x, self.centroids)
+        order = np.argsort(assignment, kind="stable")
+
+        # vectors of one inverted list are contiguous, list i is rows offsets[i]:offsets[i+1]
+        self.store = create_store(self.storage, x[order])
+        self.label_ids = y_ids[order].astype(np.int32)
+        self.list_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(assignment, minlength=self.n_lists)))
+        ).astype(np.int64)
+
+        logger.info(
+            f"Built IVF index: {len(x)} {self.storage} vectors in {self.n_lists} lists "
+            f"({self.nbytes / 1024:.1f} KiB)"
+        )
+        return self
+
+    def _search_one(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        n_probe = max(1, min(self.n_probe, self.n_lists))
+        centroid_d = np.einsum('ij,ij->i', self.centroids - query, self.centroids - query)
+        probe = np.argpartition(centroid_d, n_probe - 1)[:n_probe] if n_probe < self.n_lists \
+            else np.arange(self.n_lists)
+
+        ranges = [(self.list_offsets[i], self.list_offsets[i + 1]) for i in probe]
+        ranges = [(start, stop) for start, stop in ranges if stop > start]
+        if not ranges:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+
+        # contiguous slices avoid gathering the candidate vectors into a copy
+        d = np.concatenate([self.store.squared_distances(slice(a, b), query) for a, b in ranges])
+        ids = np.concatenate([np.arange(a, b) for a, b in ranges])
+
+        k = min(k, len(ids))
+        top = np.argpartition(d, k - 1)[:k]
+        top = top[np.argsort(d[top])]
+        return np.sqrt(d[top]), ids[top]
+
+    def kneighbors(self, x, n_neighbors: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(distances, indices)`` padded with ``inf``/``-1`` when lists run short."""
+        x = np.atleast_2d(np.asarray(x, dtype=np.float32))
+        k = n_neighbors or self.n_neighbors
+
+        distances = np.full((len(x), k), np.inf, dtype=np.float32)
+        indices = np.full((len(x), k), -1, dtype=np.int64)
+        for row, query in enumerate(x):
+            d, ids = self._search_one(query, k)
+            distances[row, :len(d)] = d
+            indices[row, :len(ids)] = ids
+        return distances, indices
+
+    def predict(self, x) -> np.ndarray:
+        distances, indices = self.kneighbors(x)
+        return np.asarray([self._vote(d, ids) for d, ids in zip(distances, indices)], dtype=object)
+
+    def _vote(self, distances: np.ndarray, indices: np.ndarray):
+        valid = indices >= 0
+        if not valid.any():
+            return None
+
+        labels = self.label_ids[indices[valid]]
+        distances = distances[valid]
+
+        if self.weights == "distance":
+            exact = distances == 0
+            # same convention as sklearn: exact matches win outright
+            weights = exact.astype(np.float64) if exact.any() else 1.0 / distances
+        else:
+            weights = np.ones_like(distances, dtype=np.float64)
+
+        scores = np.bincount(labels, weights=weights, minlength=len(self.classes_))
+        return self.classes_[int(np.argmax(scores))]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [getattr(self, name) for name in self._ARRAYS if getattr(self, name) is not None]
+        return sum(a.nbytes for a in arrays) + (self.store.nbytes if self.store else 0)
+
+    def save_index(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {name: getattr(self, name) for name in self._ARRAYS}
+        arrays.update({self._STORE_PREFIX + k: v for k, v in self.store.to_arrays().items()})
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    def load_index(self, path: Path) -> None:
+        with np.load(path, allow_pickle=False) as data:
+            for name in self._ARRAYS:
+                setattr(self, name, data[name])
+            self.store = STORES[self.storage].from_arrays({
+                k[len(self._STORE_PREFIX):]: data[k] for k in data.files
+                if k.startswith(self._STORE_PREFIX)
+            })
+        self.n_lists = len(self.centroids)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._ARRAYS + ("store",):
+            state[name] = None
+        return state
@@ -5,20 +5,37 @@ from typing import Optional
 import numpy as np
 
 from algorithms import ClassifierBase
+from algorithms.ivf_index import IVFNeighborsClassifier
+from core import config
 from core.logger import AppLogger
 
 logger = AppLogger().get_logger(__name__)
 
 
 class KNNClassifier(ClassifierBase):
+    KNN_ALGOS = ("ball_tree", "flat", "ivf")
+
     def __init__(self, model_path: Path, n_neighbors: Optional[int] = None,
-                 weight: str = "distance", verbose: bool = True):
+                 weight: str = "distance", knn_algo: Optional[str] = None,
+                 n_probe: Optional[int] = None, storage: Optional[str] = None,
+                 verbose: bool = True):
         super().__init__("KNN", model_path, verbose)
         self.n_neighbors = n_neighbors
         self.weight = weight if weight in ("distance", "uniform") else "distance"
-        self.knn_algo = "ball_tree"
+        self.knn_algo = knn_algo if knn_algo in self.KNN_ALGOS else "ball_tree"
+        self.n_probe = n_probe
+        self.storage = storage or "float32"
         self.threshold = 0.6
 
+        if self.knn_algo == "ball_tree" and self.storage != "float32":
+            # the sklearn tree keeps float64 copies, compressed encodings need the NumPy index
+            logger.info(f"Using flat index for {self.storage} encoding storage")
+            self.knn_algo = "flat"
+
+    @property
+    def index_path(self) -> Path:
+        return self.model_path.with_suffix(".ivf.npz")
+
     def train(self) -> bool:
         if not self._load_training_data():
             logger.warning("No training data found")
@@ -35,12 +52,21 @@ class KNNClassifier(ClassifierBase):
             logger.info(f"Auto-selected n_neighbors: {self.n_neighbors}")
 
         try:
-            from sklearn.neighbors import KNeighborsClassifier
-            self.classifier = KNeighborsClassifier(
-                n_neighbors=self.n_neighbors,
-                algorithm=self.knn_algo,
-                weights=self.weight
-            )
+            if self.knn_algo in ("flat", "ivf"):
+                self.classifier = IVFNeighborsClassifier(
+                    n_neighbors=self.n_neighbors,
+                    weights=self.weight,
+                    n_lists=1 if self.knn_algo == "flat" else None,
+                    n_probe=self.n_probe or config.model.DEFAULT_N_PROBE,
+                    storage=self.storage
+                )
+            else:
+                from sklearn.neighbors import KNeighborsClassifier
+                self.classifier = KNeighborsClassifier(
+                    n_neighbors=self.n_neighbors,
+                    algorithm=self.knn_algo,
+                    weights=self.weight
+                )
             self.classifier.fit(x_train, y_train)
 
             if self.test_data:
@@ -53,6 +79,31 @@ class KNNClassifier(ClassifierBase):
             logger.error(f"Error training KNN: {e}")
             return False
 
+    def save_model(self) -> bool:
+        if isinstance(self.classifier, IVFNeighborsClassifier):
+            try:
+                self.classifier.save_index(self.index_path)
+                logger.info(f"IVF index saved to {self.index_path}")
+            except Exception as e:
+                logger.error(f"Cannot save IVF index: {e}")
+                return False
+        return super().save_model()
+
+    def load_model(self) -> bool:
+        if not super().load_model():
+            return False
+
+        if isinstance(self.classifier, IVFNeighborsClassifier):
+            try:
+                self.classifier.load_index(self.index_path)
+                if self.n_probe:
+                    self.classifier.n_probe = self.n_probe
+            except Exception as e:
+                logger.error(f"Error loading IVF index from {self.index_path}: {e}")
+                self.classifier = None
+                return False
+        return True
+
     def predict(self, encoding: np.ndarray) -> str:
         if self.classifier is None:
             raise ValueError("Classifier not trained")
@@ -0,0 +1,45 @@
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from core import config
+
+
+class MotionDetector:
+    """Tells whether a frame differs from the one last accepted as reference.
+
+    Frames are subsampled to about ``MOTION_WIDTH`` pixels wide (green channel only, which
+    works for RGB and BGR alike) and blurred against sensor noise. The scene has changed
+    when more than ``MOTION_MIN_AREA`` of the pixels moved by over ``MOTION_PIXEL_THRESHOLD``.
+    Comparing with the reference rather than the previous frame also catches slow changes.
+    """
+
+    def __init__(self):
+        self.reference: Optional[np.ndarray] = None
+        self.changes = 0
+        self.unchanged = 0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        step = max(1, frame.shape[1] // config.camera.MOTION_WIDTH)
+        small = np.ascontiguousarray(frame[::step, ::step, 1])
+        return cv2.GaussianBlur(small, (5, 5), 0)
+
+    def changed(self, frame: np.ndarray) -> bool:
+        thumbnail = self._thumbnail(frame)
+        if self.reference is None or self.reference.shape != thumbnail.shape:
+            self.reference = thumbnail
+            self.changes += 1
+            return True
+
+        moved = cv2.absdiff(thumbnail, self.reference) > config.camera.MOTION_PIXEL_THRESHOLD
+        if np.count_nonzero(moved) > config.camera.MOTION_MIN_AREA * moved.size:
+            self.reference = thumbnail
+            self.changes += 1
+            return True
+
+        self.unchanged += 1
+        return False
+
+    def reset(self) -> None:
+        self.reference = None
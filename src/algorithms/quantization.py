@@ -0,0 +1,153 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Union
+
+import numpy as np
+
+Rows = Union[slice, np.ndarray]
+
+
+class EncodingStore(ABC):
+    """Compressed matrix of face encodings with distances computed on the stored form.
+
+    Every store keeps the squared norms of the *decoded* vectors, so a squared distance is
+    ``norms - 2 * dot(rows, query) + |query|^2`` and only ``dot`` depends on the encoding.
+    """
+
+    kind = ""
+
+    def __init__(self, norms: np.ndarray):
+        self.norms = norms
+
+    @classmethod
+    @abstractmethod
+    def encode(cls, x: np.ndarray) -> "EncodingStore":
+        pass
+
+    @abstractmethod
+    def dot(self, rows: Rows, query: np.ndarray) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def decode(self, rows: Rows = slice(None)) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "EncodingStore":
+        pass
+
+    def __len__(self) -> int:
+        return len(self.norms)
+
+    def squared_distances(self, rows: Rows, query: np.ndarray) -> np.ndarray:
+        query = np.asarray(query, dtype=np.float32)
+        return np.maximum(self.norms[rows] - 2.0 * self.dot(rows, query) + query @ query, 0.0)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.to_arrays().values())
+
+
+class Float32Store(EncodingStore):
+    kind = "float32"
+
+    def __init__(self, data: np.ndarray, norms: np.ndarray):
+        super().__init__(norms)
+        self.data = data
+
+    @classmethod
+    def encode(cls, x: np.ndarray) -> "Float32Store":
+        data = np.ascontiguousarray(x, dtype=np.float32)
+        return cls(data, np.einsum('ij,ij->i', data, data))
+
+    def dot(self, rows: Rows, query: np.ndarray) -> np.ndarray:
+        return self.data[rows] @ query
+
+    def decode(self, rows: Rows = slice(None)) -> np.ndarray:
+        return self.data[rows]
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {"data": self.data, "norms": self.norms}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "Float32Store":
+        return cls(arrays["data"], arrays["norms"])
+
+
+class Float16Store(EncodingStore):
+    kind = "float16"
+
+    def __init__(self, data: np.ndarray, norms: np.ndarray):
+        super().__init__(norms)
+        self.data = data
+
+    @classmethod
+    def encode(cls, x: np.ndarray) -> "Float16Store":
+        data = np.ascontiguousarray(x, dtype=np.float16)
+        decoded = data.astype(np.float32)
+        return cls(data, np.einsum('ij,ij->i', decoded, decoded))
+
+    def dot(self, rows: Rows, query: np.ndarray) -> np.ndarray:
+        return self.data[rows].astype(np.float32) @ query
+
+    def decode(self, rows: Rows = slice(None)) -> np.ndarray:
+        return self.data[rows].astype(np.float32)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {"data": self.data, "norms": self.norms}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "Float16Store":
+        return cls(arrays["data"], arrays["norms"])
+
+
+class Int8Store(EncodingStore):
+    """Per-dimension scalar quantization: ``x ~= offset + scale * code`` with int8 codes."""
+
+    kind = "int8"
+
+    def __init__(self, codes: np.ndarray, scale: np.ndarray, offset: np.ndarray, norms: np.ndarray):
+        super().__init__(norms)
+        self.codes = codes
+        self.scale = scale
+        self.offset = offset
+
+    @classmethod
+    def encode(cls, x: np.ndarray) -> "Int8Store":
+        x = np.asarray(x, dtype=np.float32)
+        lo, hi = x.min(axis=0), x.max(axis=0)
+        offset = (lo + hi) / 2.0
+        scale = np.maximum((hi - lo) / 254.0, np.finfo(np.float32).eps)
+        codes = np.clip(np.rint((x - offset) / scale), -127, 127).astype(np.int8)
+
+        store = cls(codes, scale.astype(np.float32), offset.astype(np.float32), np.empty(0))
+        decoded = store.decode()
+        store.norms = np.einsum('ij,ij->i', decoded, decoded)
+        return store
+
+    def dot(self, rows: Rows, query: np.ndarray) -> np.ndarray:
+        # (offset + scale * c) . q = offset . q + c . (scale * q)
+        return self.codes[rows].astype(np.float32) @ (self.scale * query) + self.offset @ query
+
+    def decode(self, rows: Rows = slice(None)) -> np.ndarray:
+        return self.offset + self.scale * self.codes[rows].astype(np.float32)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {"codes": self.codes, "scale": self.scale, "offset": self.offset, "norms": self.norms}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "Int8Store":
+        return cls(arrays["codes"], arrays["scale"], arrays["offset"], arrays["norms"])
+
+
+STORES = {store.kind: store for store in (Float32Store, Float16Store, Int8Store)}
+
+
+def create_store(kind: str, x: np.ndarray) -> EncodingStore:
+    if kind not in STORES:
+        raise ValueError(f"Unknown encoding storage: {kind}")
+    return STORES[kind].encode(x)
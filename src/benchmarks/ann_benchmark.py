@@ -0,0 +1,77 @@
+"""Recall@1 and latency of the IVF index against exact brute-force search.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.ann_benchmark --size 200000 --probes 1 2 4 8 16 32
+    python -m benchmarks.ann_benchmark --gallery      # use encodings of person photos
+"""
+import argparse
+import time
+
+import numpy as np
+
+from algorithms.ivf_index import IVFNeighborsClassifier
+from benchmarks.common import load_gallery_encodings, print_table
+
+
+def synthetic_gallery(size: int, n_persons: int, seed: int = 0):
+    """Clustered 128-d vectors with roughly the spread of dlib face encodings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(0.0, 0.09, size=(n_persons, 128)).astype(np.float32)
+    labels = rng.integers(0, n_persons, size=size)
+    x = centers[labels] + rng.normal(0.0, 0.025, size=(size, 128)).astype(np.float32)
+    return x, labels.astype(str)
+
+
+def exact_nearest(x: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    x_sq = np.einsum('ij,ij->i', x, x)
+    return np.asarray([np.argmin(x_sq - 2.0 * (x @ q)) for q in queries])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200000, help="synthetic gallery size")
+    parser.add_argument("--persons", type=int, default=5000, help="synthetic identities")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--lists", type=int, default=None, help="inverted lists (default sqrt(N))")
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--gallery", action="store_true", help="use person photo encodings")
+    args = parser.parse_args()
+
+    if args.gallery:
+        x, y = load_gallery_encodings()
+        x = x.astype(np.float32)
+    else:
+        x, y = synthetic_gallery(args.size, args.persons)
+
+    rng = np.random.default_rng(1)
+    picks = rng.choice(len(x), size=min(args.queries, len(x)), replace=False)
+    queries = x[picks] + rng.normal(0.0, 0.01, size=(len(picks), x.shape[1])).astype(np.float32)
+
+    start = time.perf_counter()
+    index = IVFNeighborsClassifier(n_neighbors=1, n_lists=args.lists).fit(x, y)
+    build_s = time.perf_counter() - start
+    print(f"Gallery: {len(x)} vectors, IVF build {build_s:.2f}s, {index.n_lists} lists\n")
+
+    start = time.perf_counter()
+    truth = exact_nearest(index.store.decode(), queries)
+    exact_ms = (time.perf_counter() - start) * 1000.0 / len(queries)
+
+    rows = [{"search": "exact", "n_probe": "-", "recall@1": 1.0, "ms/query": exact_ms}]
+    for n_probe in args.probes:
+        index.n_probe = n_probe
+        start = time.perf_counter()
+        _, found = index.kneighbors(queries, n_neighbors=1)
+        ms = (time.perf_counter() - start) * 1000.0 / len(queries)
+        rows.append({
+            "search": "ivf",
+            "n_probe": n_probe,
+            "recall@1": float(np.mean(found[:, 0] == truth)),
+            "ms/query": ms,
+        })
+
+    print_table(rows, ["search", "n_probe", "recall@1", "ms/query"])
+
+
+if __name__ == '__main__':
+    main()
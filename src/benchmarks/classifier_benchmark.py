@@ -0,0 +1,52 @@
+"""Compare memory footprint and per-query latency of trained models.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.classifier_benchmark "My KNN model" "My centroid model"
+"""
+import argparse
+import pickle
+
+import numpy as np
+
+from algorithms import AlgorithmFactory
+from benchmarks.common import load_gallery_encodings, measure_latency, file_size_kib, print_table
+from services import model_service
+
+
+def benchmark_model(model, x: np.ndarray, y: np.ndarray) -> dict:
+    algorithm = AlgorithmFactory.create(model)
+    if not algorithm.load_model():
+        raise RuntimeError(f"Cannot load model {model.name}")
+
+    in_memory = len(pickle.dumps(algorithm.classifier, protocol=pickle.HIGHEST_PROTOCOL))
+    latency = measure_latency(algorithm.predict, list(x))
+    predictions = np.asarray([algorithm.predict(enc) for enc in x])
+
+    return {
+        "model": model.name,
+        "algorithm": model.algorithm.value,
+        "file_kib": file_size_kib(model.clf_path),
+        "memory_kib": in_memory / 1024.0,
+        "p50_ms": latency["p50_ms"],
+        "p95_ms": latency["p95_ms"],
+        "accuracy": float(np.mean(predictions == y)) if len(y) else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("models", nargs="*", help="model names (default: all models)")
+    parser.add_argument("--no-cache", action="store_true", help="re-encode gallery photos")
+    args = parser.parse_args()
+
+    models = [model_service.get_model(name) for name in args.models] or model_service.get_all_models()
+    x, y = load_gallery_encodings(use_cache=not args.no_cache)
+    print(f"Gallery: {len(x)} encodings, {len(set(y))} persons\n")
+
+    rows = [benchmark_model(model, x, y) for model in models if model]
+    print_table(rows, ["model", "algorithm", "file_kib", "memory_kib", "p50_ms", "p95_ms", "accuracy"])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from core import config, AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+GALLERY_CACHE = config.paths.TEMP_DIR / "benchmark_gallery.npz"
+
+
+def load_gallery_encodings(use_cache: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode every person photo once (first face per photo) and cache the result."""
+    if use_cache and GALLERY_CACHE.exists():
+        data = np.load(GALLERY_CACHE, allow_pickle=False)
+        return data["x"], data["y"]
+
+    import face_recognition
+    from services import person_service
+
+    encodings, names = [], []
+    for person in person_service.get_persons_with_photos(min_photos=1):
+        for photo_path in person.photo_paths:
+            image = face_recognition.load_image_file(str(photo_path))
+            found = face_recognition.face_encodings(image)
+            if found:
+                encodings.append(found[0])
+                names.append(person.name)
+
+    x = np.asarray(encodings, dtype=np.float64).reshape(-1, 128)
+    y = np.asarray(names, dtype=str)
+    GALLERY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(GALLERY_CACHE, x=x, y=y)
+    logger.info(f"Encoded {len(x)} gallery photos for benchmarks")
+    return x, y
+
+
+def gallery_photo_paths(image_dir: Optional[Path] = None, limit: Optional[int] = None) -> List[Path]:
+    """Photos of ``image_dir`` (recursively) or, by default, of every stored person."""
+    if image_dir is not None:
+        paths = sorted(
+            p for p in Path(image_dir).rglob("*")
+            if p.is_file() and config.person.validate_image(str(p))
+        )
+    else:
+        from services import person_service
+        paths = [
+            Path(photo_path)
+            for person in person_service.get_persons_with_photos(min_photos=1)
+            for photo_path in person.photo_paths
+        ]
+    return paths[:limit] if limit else paths
+
+
+def measure_latency(fn: Callable, items: List, repeat: int = 1) -> dict:
+    """Call ``fn`` on every item and return latency percentiles in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        for item in items:
+            start = time.perf_counter()
+            fn(item)
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+    if not samples:
+        return {"n": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+
+    samples = np.asarray(samples)
+    return {
+        "n": len(samples),
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+    }
+
+
+def file_size_kib(path: Optional[Path]) -> float:
+    if path is None or not Path(path).exists():
+        return 0.0
+    return Path(path).stat().st_size / 1024.0
+
+
+def print_table(rows: List[dict], columns: List[str]) -> None:
+    widths = {c: max([len(c)] + [len(_fmt(r.get(c))) for r in rows]) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print("  ".join(_fmt(row.get(c)).ljust(widths[c]) for c in columns))
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return "" if value is None else str(value)
@@ -0,0 +1,64 @@
+"""Latency and detection rate of every face detector backend.
+
+Every photo of the image set is expected to contain a face, so the detection rate is the
+share of photos where at least one face was found.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.detector_benchmark
+    python -m benchmarks.detector_benchmark --dir path/to/images --upsample 0 1 2
+"""
+import argparse
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from algorithms.face_detectors import FaceDetector, get_detector
+from benchmarks.common import gallery_photo_paths, measure_latency, print_table
+from core import Detector, config
+from utils.image_loader import load_image
+
+
+def load_images(paths: List[Path], max_dimension: int) -> List[np.ndarray]:
+    return [load_image(path, max_dimension)[0] for path in paths]
+
+
+def benchmark_detector(detector: FaceDetector, images: List[np.ndarray]) -> dict:
+    counts = [len(detector.detect(image)) for image in images]
+    latency = measure_latency(detector.detect, images)
+    return {
+        "detector": detector.name,
+        "mean_ms": latency["mean_ms"],
+        "p50_ms": latency["p50_ms"],
+        "p95_ms": latency["p95_ms"],
+        "detection_rate": float(np.mean([c > 0 for c in counts])) if counts else 0.0,
+        "faces_per_image": float(np.mean(counts)) if counts else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", type=Path, default=None, help="image directory (default: person photos)")
+    parser.add_argument("--limit", type=int, default=200, help="maximum number of images")
+    parser.add_argument("--max-dimension", type=int, default=config.person.INGEST_MAX_DIMENSION,
+                        help="decode images to at most this many pixels on the longer side")
+    parser.add_argument("--upsample", type=int, nargs="+", default=[0, 1], help="HOG upsampling steps")
+    args = parser.parse_args()
+
+    paths = gallery_photo_paths(args.dir, args.limit)
+    images = load_images(paths, args.max_dimension)
+    print(f"Images: {len(images)}\n")
+
+    detectors = [get_detector(Detector.HOG, upsample) for upsample in args.upsample]
+    try:
+        detectors.append(get_detector(Detector.HAAR))
+    except Exception as e:
+        print(f"Skipping {Detector.HAAR.value}: {e}")
+
+    rows = [benchmark_detector(detector, images) for detector in detectors]
+    print_table(rows, ["detector", "mean_ms", "p50_ms", "p95_ms", "detection_rate", "faces_per_image"])
+
+
+if __name__ == '__main__':
+    main()
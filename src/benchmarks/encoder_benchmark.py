@@ -0,0 +1,82 @@
+"""Encoding latency and 1-NN accuracy for each landmark model / jitter setting.
+
+Faces are detected once per photo; every setting then encodes the same face boxes, so the
+latency column only measures landmark alignment and the ResNet passes.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.encoder_benchmark
+    python -m benchmarks.encoder_benchmark --jitters 1 5 --limit 300
+"""
+import argparse
+from typing import List, Tuple
+
+import numpy as np
+
+from algorithms.encoding_dataset import EncodingDataset
+from algorithms.face_detectors import get_detector, select_primary_face
+from algorithms.face_encoder import FaceEncoder
+from benchmarks.common import gallery_photo_paths, measure_latency, print_table
+from core import config
+from utils.image_loader import load_image
+
+
+def detect_faces(limit: int) -> List[Tuple[np.ndarray, tuple, str]]:
+    """``(image, primary face box, person name)`` for every gallery photo with a face."""
+    detector = get_detector()
+    samples = []
+    for path in gallery_photo_paths(limit=limit):
+        image, _ = load_image(path, config.person.INGEST_MAX_DIMENSION)
+        face_locations = detector.detect(image)
+        if face_locations:
+            primary = select_primary_face(face_locations, image.shape)
+            # person photos live in person_data/<name>/photos/
+            samples.append((image, primary, path.parent.parent.name))
+    return samples
+
+
+def nearest_neighbor_accuracy(dataset: EncodingDataset) -> float:
+    train, test = dataset.split(test_size=0.2, seed=42)
+    if not len(train) or not len(test):
+        return 0.0
+
+    x, q = train.encodings, test.encodings
+    d = np.einsum('ij,ij->i', x, x)[None, :] - 2.0 * q @ x.T
+    predicted = train.label_ids[np.argmin(d, axis=1)]
+    return float(np.mean(predicted == test.label_ids))
+
+
+def benchmark_encoder(encoder: FaceEncoder, samples) -> dict:
+    dataset = EncodingDataset()
+    for image, location, name in samples:
+        dataset.add(encoder.encode(image, [location]), name)
+
+    latency = measure_latency(lambda s: encoder.encode(s[0], [s[1]]), samples)
+    return {
+        "landmarks": encoder.landmark_model,
+        "jitters": encoder.num_jitters,
+        "mean_ms": latency["mean_ms"],
+        "p95_ms": latency["p95_ms"],
+        "accuracy": nearest_neighbor_accuracy(dataset),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=500, help="maximum number of photos")
+    parser.add_argument("--jitters", type=int, nargs="+", default=[1, 5], help="jitter counts")
+    args = parser.parse_args()
+
+    samples = detect_faces(args.limit)
+    print(f"Faces: {len(samples)}, persons: {len({name for _, _, name in samples})}\n")
+
+    rows = [
+        benchmark_encoder(FaceEncoder(landmark_model, num_jitters), samples)
+        for landmark_model in FaceEncoder.LANDMARK_MODELS
+        for num_jitters in args.jitters
+    ]
+    print_table(rows, ["landmarks", "jitters", "mean_ms", "p95_ms", "accuracy"])
+
+
+if __name__ == '__main__':
+    main()
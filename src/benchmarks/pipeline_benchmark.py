@@ -0,0 +1,141 @@
+"""End-to-end throughput and latency of ``predict_webcam`` on a reproducible frame source.
+
+``run`` feeds a video file, a directory of frames or synthetic frames through the same
+path as the live camera (BGR frame -> RGB -> ``predict_webcam``). Without ``--realtime``
+every frame is processed as fast as possible; with it the source plays at its own frame
+rate and frames the pipeline cannot keep up with are dropped, as with a webcam.
+``record`` captures a live camera session to a video file or a frame directory.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.pipeline_benchmark record --camera 0 --seconds 30 --out session
+    python -m benchmarks.pipeline_benchmark run --frames session --model "My model"
+    python -m benchmarks.pipeline_benchmark run --video entrance.mp4 --realtime
+    python -m benchmarks.pipeline_benchmark run --synthetic 300 --sprite face.jpg
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from benchmarks.common import print_table
+from services.frame_sources import FrameSource, ImageSequenceSource, SyntheticSource, VideoFileSource
+from utils.image_loader import load_image
+
+
+def load_algorithm(model_name: Optional[str]):
+    from algorithms import AlgorithmFactory
+    from services import model_service
+
+    models = model_service.get_all_models()
+    model = model_service.get_model(model_name) if model_name else (models[0] if models else None)
+    if model is None:
+        raise SystemExit(f"Model not found: {model_name or '(no models)'}")
+
+    algorithm = AlgorithmFactory.create(model)
+    if not algorithm.load_model():
+        raise SystemExit(f"Failed to load model file: {model.clf_path}")
+    return model.name, algorithm
+
+
+def create_source(args) -> FrameSource:
+    if args.video:
+        return VideoFileSource(args.video, realtime=args.realtime)
+    if args.frames:
+        return ImageSequenceSource(args.frames, fps=args.fps, realtime=args.realtime)
+
+    sprite = None
+    if args.sprite:
+        # sources deliver BGR like OpenCV captures
+        sprite = np.ascontiguousarray(load_image(args.sprite, max_dimension=args.sprite_size)[0][:, :, ::-1])
+    return SyntheticSource(fps=args.fps, frames=args.synthetic, sprite=sprite, realtime=args.realtime)
+
+
+def benchmark_pipeline(algorithm, source: FrameSource, max_frames: Optional[int] = None) -> dict:
+    latencies = []
+    source.start()
+    started = time.perf_counter()
+    try:
+        while max_frames is None or len(latencies) < max_frames:
+            ret, frame = source.read(timeout=5.0)
+            if not ret or frame is None:
+                if source.finished.is_set() or not source.is_running():
+                    break
+                continue
+
+            start = time.perf_counter()
+            algorithm.predict_webcam(frame[:, :, ::-1])
+            latencies.append((time.perf_counter() - start) * 1000.0)
+    finally:
+        elapsed = time.perf_counter() - started
+        source.stop()
+
+    samples = np.asarray(latencies) if latencies else np.zeros(1)
+    return {
+        "frames": len(latencies),
+        "produced": source.produced,
+        "dropped": source.dropped,
+        "fps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+    }
+
+
+def record(args) -> None:
+    from services import camera_discovery
+    from services.camera_service import CameraService
+
+    camera = CameraService(port=args.camera)
+    camera.start(args.camera, camera_discovery.profile_for(args.camera))
+    recorder = camera.start_recording(args.out)
+    try:
+        time.sleep(args.seconds)
+    finally:
+        camera.stop_recording()
+        camera.stop()
+    print(f"Recorded {recorder.written} frames to {args.out} ({recorder.dropped} dropped)")
+
+
+def run(args) -> None:
+    model_name, algorithm = load_algorithm(args.model)
+    source = create_source(args)
+    print(f"Model: {model_name}\nSource: {type(source).__name__}, realtime={args.realtime}\n")
+
+    row = benchmark_pipeline(algorithm, source, args.max_frames)
+    row["source"] = type(source).__name__
+    print_table([row], ["source", "frames", "produced", "dropped", "fps", "mean_ms", "p50_ms", "p95_ms"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark predict_webcam on a frame source")
+    sources = run_parser.add_mutually_exclusive_group(required=True)
+    sources.add_argument("--video", type=Path, help="video file")
+    sources.add_argument("--frames", type=Path, help="directory of frames, e.g. from 'record'")
+    sources.add_argument("--synthetic", type=int, metavar="N", help="N generated frames")
+    run_parser.add_argument("--sprite", type=Path, default=None, help="image moved across synthetic frames")
+    run_parser.add_argument("--sprite-size", type=int, default=200, help="longer side of the sprite")
+    run_parser.add_argument("--fps", type=float, default=30, help="frame rate of frame and synthetic sources")
+    run_parser.add_argument("--realtime", action="store_true", help="play at the source frame rate, drop late frames")
+    run_parser.add_argument("--max-frames", type=int, default=None)
+    run_parser.add_argument("--model", default=None, help="model name (default: first model)")
+    run_parser.set_defaults(func=run)
+
+    record_parser = commands.add_parser("record", help="record a live camera session")
+    record_parser.add_argument("--camera", type=int, default=0, help="camera port")
+    record_parser.add_argument("--seconds", type=float, default=30)
+    record_parser.add_argument("--out", type=Path, required=True,
+                               help="video file (.avi/.mp4) or directory for numbered frames")
+    record_parser.set_defaults(func=record)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
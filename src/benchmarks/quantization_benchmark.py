@@ -0,0 +1,99 @@
+"""Memory, load time and accuracy of compressed encoding storage.
+
+Builds an exact (single-list) index over the gallery for every storage kind and compares it
+with the float32 baseline and the pickled sklearn estimator.
+
+Usage (from ``src``)::
+
+    python -m benchmarks.quantization_benchmark
+    python -m benchmarks.quantization_benchmark --synthetic 100000
+"""
+import argparse
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from algorithms.ivf_index import IVFNeighborsClassifier
+from algorithms.quantization import STORES
+from benchmarks.ann_benchmark import synthetic_gallery
+from benchmarks.common import load_gallery_encodings, file_size_kib, print_table
+
+
+def split(x: np.ndarray, y: np.ndarray, test_size: float = 0.2, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(x))
+    n_test = int(len(x) * test_size)
+    test, train = order[:n_test], order[n_test:]
+    return x[train], y[train], x[test], y[test]
+
+
+def sklearn_row(x_train, y_train, x_test, y_test, tmp: Path) -> dict:
+    from sklearn.neighbors import KNeighborsClassifier
+
+    clf = KNeighborsClassifier(n_neighbors=1, algorithm="ball_tree").fit(x_train, y_train)
+    path = tmp / "model.clf"
+    with open(path, 'wb') as f:
+        pickle.dump(clf, f)
+
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        clf = pickle.load(f)
+    load_ms = (time.perf_counter() - start) * 1000.0
+
+    return {
+        "storage": "sklearn float64",
+        "file_kib": file_size_kib(path),
+        "load_ms": load_ms,
+        "accuracy": float(np.mean(clf.predict(x_test) == y_test)),
+        "recall@1": None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--synthetic", type=int, default=0, help="use N synthetic encodings")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        x, y = synthetic_gallery(args.synthetic, max(2, args.synthetic // 20))
+    else:
+        x, y = load_gallery_encodings()
+    x_train, y_train, x_test, y_test = split(x, y)
+    print(f"Train: {len(x_train)} encodings, test: {len(x_test)}\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        rows = [sklearn_row(x_train, y_train, x_test, y_test, tmp)]
+
+        baseline = None
+        for kind in STORES:
+            index = IVFNeighborsClassifier(n_neighbors=1, n_lists=1, storage=kind).fit(x_train, y_train)
+            path = tmp / f"model.{kind}.npz"
+            index.save_index(path)
+
+            start = time.perf_counter()
+            loaded = pickle.loads(pickle.dumps(index))
+            loaded.load_index(path)
+            load_ms = (time.perf_counter() - start) * 1000.0
+
+            _, nearest = loaded.kneighbors(x_test, n_neighbors=1)
+            if baseline is None:
+                baseline = nearest[:, 0]
+
+            rows.append({
+                "storage": kind,
+                "memory_kib": loaded.store.nbytes / 1024.0,
+                "file_kib": file_size_kib(path),
+                "load_ms": load_ms,
+                "accuracy": float(np.mean(loaded.predict(x_test) == y_test)),
+                "recall@1": float(np.mean(nearest[:, 0] == baseline)),
+            })
+
+    print_table(rows, ["storage", "memory_kib", "file_kib", "load_ms", "accuracy", "recall@1"])
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,11 @@
 from .config import config
-from .enums import Algorithm, Gender, CameraStatus, PhotoStatus
+from .enums import Algorithm, Detector, Gender, CameraStatus, PhotoStatus
 from .logger import AppLogger
 
 __all__ = [
     'config',
     'Algorithm',
+    'Detector',
     'Gender',
     'CameraStatus',
     'PhotoStatus',
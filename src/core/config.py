@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Set, Dict
+from typing import Set, Dict, List, Optional
 
 from pydantic import BaseModel, validator
 
@@ -15,6 +15,7 @@ class PathConfig(BaseModel):
     STATS_DIR: Path = BASE_DIR / "statistics"
     ASSETS_DIR: Path = SRC_DIR / "assets"
     LOGS_DIR: Path = BASE_DIR / "logs"
+    THUMBNAIL_DIR: Path = BASE_DIR / "cache" / "thumbnails"
 
     class Config:
         arbitrary_types_allowed = True
@@ -39,8 +40,20 @@ class UIConfig(BaseModel):
         "stop_webcam": "Turn off",
         "load_photo": "Load photo",
         "clear_photo": "Clear photo",
+        "no_cameras": "No cameras",
+        "searching_cameras": "Searching...",
+        "rescan_cameras": "Search again",
+        "all_cameras": "All cameras",
     }
 
+    # photo previews are shown from cached thumbnails decoded off the UI thread
+    THUMBNAIL_SIZE: int = 800
+    THUMBNAIL_WORKERS: int = 2
+    # thumbnails unused this long are deleted, then the oldest until the cache fits the size
+    THUMBNAIL_MAX_AGE_DAYS: int = 30
+    THUMBNAIL_CACHE_MB: int = 200
+    PREVIEW_TEXTURE_CACHE: int = 8
+
 
 class PersonConfig(BaseModel):
     ALLOWED_EXTENSIONS: Set[str] = {"png", "jpg", "jpeg", "bmp", "tiff"}
@@ -49,6 +62,16 @@ class PersonConfig(BaseModel):
     DEFAULT_COUNT_FRAME: int = 5
     MIN_PHOTOS_FOR_TRAINING: int = 1
 
+    # ingest: resolution-capped copy and aligned face chip stored next to each photo
+    INGEST_MAX_DIMENSION: int = 1024
+    INGEST_JPEG_QUALITY: int = 90
+    FACE_CHIP_SIZE: int = 150
+
+    PHOTO_COPY_WORKERS: int = 4
+    # opt-in: a hard-linked photo shares its inode with the picked original, so editing the
+    # original in place also changes the stored photo; off, a reflink is tried, then a copy
+    ALLOW_PHOTO_HARDLINKS: bool = False
+
     def validate_image(self, file_path: str) -> bool:
         ext = Path(file_path).suffix.lower().lstrip('.')
         return ext in self.ALLOWED_EXTENSIONS
@@ -58,16 +81,125 @@ class ModelConfig(BaseModel):
     DEFAULT_THRESHOLD: float = 0.5
     DEFAULT_N_NEIGHBORS: int = 5
     DEFAULT_WEIGHT: str = "distance"
+    DEFAULT_KNN_ALGO: str = "ball_tree"
+    DEFAULT_N_PROBE: int = 8
+    DEFAULT_ENCODING_STORAGE: str = "float32"
     DEFAULT_GAMMA: str = "scale"
+    DEFAULT_N_PROTOTYPES: int = 1
+    DEFAULT_DETECTOR: str = "HOG"
+    DEFAULT_DETECTOR_UPSAMPLE: int = 1
+    DEFAULT_LANDMARK_MODEL: str = "large"
+    DEFAULT_NUM_JITTERS: int = 1
+
+    # encode only the largest, most central face of a training photo
+    PRIMARY_FACE_ONLY: bool = True
+    SAVE_REJECTED_FACES: bool = False
+    REJECTED_FACES_FILE: str = "rejected_faces.json"
+
+    # training reads the ingested copy, re-decode the original for encoding
+    ENCODE_FULL_RESOLUTION: bool = False
+
+    # faces too small, blurred, dark, bright or turned away are not encoded, live or in training;
+    # sharpness is the Laplacian variance of the face scaled to 64 px, yaw the nose offset
+    # from the middle of the eyes in eye distances
+    QUALITY_GATE: bool = True
+    QUALITY_MIN_FACE_SIZE: int = 40
+    QUALITY_MIN_SHARPNESS: float = 30.0
+    QUALITY_MIN_BRIGHTNESS: float = 40.0
+    QUALITY_MAX_BRIGHTNESS: float = 220.0
+    QUALITY_CHECK_POSE: bool = True
+    QUALITY_MAX_YAW: float = 0.35
 
     ALGORITHM_KNN: str = "KNN Classification"
     ALGORITHM_SVM: str = "SVM Classification"
+    ALGORITHM_CENTROID: str = "Centroid Classification"
 
 
 class StatisticsConfig(BaseModel):
     FILE_STATS_PLOT: Path = PathConfig().STATS_DIR / "plot.png"
     FILE_STATS_CSV: Path = PathConfig().STATS_DIR / "basic_data.csv"
-    FILE_RESULT_PLOT: Path = PathConfig().STATS_DIR / "result.png"
+    RETENTION_HOURS: int = 24 * 90
+    RETENTION_DAYS: int = 2 * 366
+    RETENTION_MONTHS: int = 10 * 12
+    PLOT_HOURS: int = 12
+
+
+class CaptureProfile(BaseModel):
+    """Requested capture settings; ``None`` keeps the device default."""
+    backend: str = "auto"
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[int] = None
+    fourcc: Optional[str] = None
+    buffer_size: Optional[int] = 1
+
+
+class CameraConfig(BaseModel):
+    # last discovered cameras, listed at startup without opening any device
+    CAMERAS_FILE: Path = PathConfig().BASE_DIR / "cache" / "cameras.json"
+    MAX_PORTS: int = 10
+    PROBE_TIMEOUT: float = 3.0
+
+    # lower resolutions cut decode and detection time per frame, a one-frame driver buffer
+    # keeps the newest frame instead of a queued stale one
+    CAPTURE_PROFILES: Dict[str, CaptureProfile] = {
+        "default": CaptureProfile(),
+        "low latency": CaptureProfile(width=640, height=480, fps=30, fourcc="MJPG"),
+        "hd": CaptureProfile(width=1280, height=720, fps=30, fourcc="MJPG"),
+        "uncompressed": CaptureProfile(width=640, height=480, fps=30, fourcc="YUYV"),
+    }
+    DEFAULT_CAPTURE_PROFILE: str = "default"
+
+    # all cameras share one loaded model and this many recognition threads
+    INFERENCE_WORKERS: int = 2
+
+    # a face confirmed under the same name keeps it while its box overlaps the previous one,
+    # encoding runs again every TRACK_REVERIFY_SECONDS or when the box jumps
+    TRACK_FACES: bool = True
+    TRACK_MATCH_IOU: float = 0.3
+    TRACK_JUMP_IOU: float = 0.5
+    TRACK_CONFIRM_FRAMES: int = 3
+    TRACK_REVERIFY_SECONDS: float = 2.0
+    TRACK_MAX_MISSED: int = 5
+
+    # detection runs only when the scene changed (subsampled frame differencing), or at least
+    # every MOTION_REDETECT_SECONDS; without faces and motion for IDLE_AFTER_SECONDS a camera
+    # drops to IDLE_FPS and the UI polls every IDLE_POLL_INTERVAL until something moves
+    MOTION_GATE: bool = True
+    MOTION_WIDTH: int = 160
+    MOTION_PIXEL_THRESHOLD: int = 25
+    MOTION_MIN_AREA: float = 0.01
+    MOTION_REDETECT_SECONDS: float = 5.0
+    IDLE_AFTER_SECONDS: float = 10.0
+    IDLE_FPS: float = 5.0
+    IDLE_POLL_INTERVAL: float = 0.2
+
+    # frames cost at most what lets each camera reach TARGET_FPS on the recognition workers,
+    # and the app at most CPU_BUDGET of all cores (None: no limit); over budget, detection
+    # runs on smaller frames first, then only every n-th frame is recognized
+    ADAPTIVE_RATE: bool = True
+    TARGET_FPS: float = 15.0
+    CPU_BUDGET: Optional[float] = None
+    DETECTION_SCALES: List[float] = [1.0, 0.75, 0.5]
+    MAX_FRAME_SKIP: int = 4
+    ADAPT_INTERVAL: float = 1.0
+    MIN_POLL_INTERVAL: float = 1.0 / 30.0
+    MAX_POLL_INTERVAL: float = 0.25
+
+    # capture and recognition in their own processes, frames passed through shared memory;
+    # sidesteps the GIL when several cameras keep more than one core busy
+    CAPTURE_PROCESSES: bool = False
+    INFERENCE_PROCESSES: int = 2
+    FRAME_RING_SLOTS: int = 8
+
+
+class MetricsConfig(BaseModel):
+    # per-stage timings of the live pipeline, logged and written to SNAPSHOT_FILE
+    ENABLED: bool = False
+    SNAPSHOT_INTERVAL: float = 30.0
+    SNAPSHOT_FILE: Path = PathConfig().LOGS_DIR / "metrics.json"
+    # frame rate and latency drawn onto the camera image
+    OVERLAY: bool = False
 
 
 class ImageAssetConfig(BaseModel):
@@ -81,6 +213,8 @@ class MainConfig(BaseModel):
     model: ModelConfig = ModelConfig()
     person: PersonConfig = PersonConfig()
     stats: StatisticsConfig = StatisticsConfig()
+    camera: CameraConfig = CameraConfig()
+    metrics: MetricsConfig = MetricsConfig()
     images: ImageAssetConfig = ImageAssetConfig()
 
     @validator("paths", pre=False, always=True)
@@ -90,6 +224,7 @@ class MainConfig(BaseModel):
         os.makedirs(v.TEMP_DIR, exist_ok=True)
         os.makedirs(v.STATS_DIR, exist_ok=True)
         os.makedirs(v.LOGS_DIR, exist_ok=True)
+        os.makedirs(v.THUMBNAIL_DIR, exist_ok=True)
 
         return v
 
@@ -4,6 +4,12 @@ from enum import Enum, IntEnum
 class Algorithm(str, Enum):
     KNN = "KNN Classification"
     SVM = "SVM Classification"
+    CENTROID = "Centroid Classification"
+
+
+class Detector(str, Enum):
+    HOG = "HOG"
+    HAAR = "Haar cascade"
 
 
 class Gender(str, Enum):
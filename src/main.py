@@ -1,45 +1,72 @@
+from utils.startup_profiler import startup_profiler
+
+startup_profiler.track_imports()
+
+import importlib
 import shutil
 import threading
-
-from kivy.app import App
-from kivy.lang import Builder
-from kivy.properties import ObjectProperty
-from kivy.uix.gridlayout import GridLayout
-from kivy.uix.screenmanager import ScreenManager
-from kivy.core.window import Window
-
-from core import config, AppLogger
-from ui.screen_stack import ScreenStack
-from ui.screens.face_scanner.screen import FaceScanner
-from ui.screens.face_scanner.webcamera_view import WebCameraView
-from ui.screens.model.learn_screen import LearningMode
-from ui.screens.model.edit_screen import LearningEdit
-from ui.screens.model.create_screen import LearningCreate
-from ui.screens.model.recycleview_create import *
-from ui.screens.person.add_screen import AddPerson
-from ui.screens.person.edit_screen import EditPerson
-from ui.screens.person.screen import *
-from ui.screens.person.recycleview import *
-from ui.drop_button import DropButton
-from ui.popups.delete import *
-from ui.widget_styles import *
-
-# loading ui files
-Builder.load_file("assets/ui/app_ui.kv")
-Builder.load_file("assets/ui/widget_styles.kv")
-
-# screens
-Builder.load_file("assets/ui/facescanner_screen.kv")
-Builder.load_file("assets/ui/addperson_screen.kv")
-Builder.load_file("assets/ui/editperson_screen.kv")
-Builder.load_file("assets/ui/persons_screen.kv")
-Builder.load_file("assets/ui/learningmode_screen.kv")
-Builder.load_file("assets/ui/createmodel_screen.kv")
-Builder.load_file("assets/ui/editmodel_screen.kv")
-
-# popups
-Builder.load_file("assets/ui/my_popup.kv")
-Builder.load_file("assets/ui/plot_popup.kv")
+import time
+from typing import Dict, NamedTuple, Tuple
+
+with startup_profiler.phase("kivy"):
+    from kivy.app import App
+    from kivy.clock import Clock
+    from kivy.factory import Factory
+    from kivy.lang import Builder
+    from kivy.properties import ObjectProperty
+    from kivy.uix.gridlayout import GridLayout
+    from kivy.uix.screenmanager import ScreenManager
+    from kivy.core.window import Window
+
+with startup_profiler.phase("initial screen modules"):
+    from core import config, AppLogger
+    from ui.screen_stack import ScreenStack
+    from ui.screens.face_scanner.screen import FaceScanner
+    from ui.screens.face_scanner.webcamera_view import WebCameraView
+    from ui.widget_styles import *
+    from utils.metrics import metrics
+
+with startup_profiler.phase("initial kv files"):
+    # loading ui files
+    Builder.load_file("assets/ui/app_ui.kv")
+    Builder.load_file("assets/ui/widget_styles.kv")
+
+    # screens
+    Builder.load_file("assets/ui/facescanner_screen.kv")
+
+    # popups
+    Builder.load_file("assets/ui/my_popup.kv")
+    Builder.load_file("assets/ui/plot_popup.kv")
+
+
+class ScreenGroup(NamedTuple):
+    """Screens built together because their kv files share widget rules."""
+    modules: Tuple[str, ...]
+    kv_files: Tuple[str, ...]
+    screens: Dict[str, str]
+
+
+# every screen except the face scanner is built on first use or after the first frame
+LAZY_SCREEN_GROUPS = (
+    ScreenGroup(
+        modules=("ui.screens.person.screen", "ui.screens.person.recycleview",
+                 "ui.screens.person.add_screen", "ui.screens.person.edit_screen", "ui.drop_button"),
+        kv_files=("assets/ui/addperson_screen.kv", "assets/ui/editperson_screen.kv",
+                  "assets/ui/persons_screen.kv"),
+        screens={"persons": "PersonsScreen", "add_person": "AddPerson", "edit_person": "EditPerson"},
+    ),
+    ScreenGroup(
+        modules=("ui.screens.model.learn_screen", "ui.screens.model.edit_screen",
+                 "ui.screens.model.create_screen", "ui.screens.model.recycleview_create"),
+        kv_files=("assets/ui/learningmode_screen.kv", "assets/ui/createmodel_screen.kv",
+                  "assets/ui/editmodel_screen.kv"),
+        screens={"learning": "LearningMode", "learning_edit": "LearningEdit",
+                 "learning_create": "LearningCreate"},
+    ),
+)
+
+# imported on a worker thread after the first frame, the first recognition would pay for them
+BACKGROUND_IMPORTS = ("face_recognition", "sklearn.neighbors", "sklearn.svm", "sklearn.cluster")
 
 
 class Main(GridLayout, threading.Thread):
@@ -51,6 +78,38 @@ class WindowManager(ScreenManager):
         super().__init__(**kwargs)
         self.stack = ScreenStack()
         self.stack.add_screen("facescanner")
+        self.logger = AppLogger().get_logger(__name__)
+        self._pending_groups = list(LAZY_SCREEN_GROUPS)
+
+    def get_screen(self, name):
+        if not self.has_screen(name):
+            for group in self._pending_groups:
+                if name in group.screens:
+                    self.load_group(group)
+                    break
+        return super().get_screen(name)
+
+    def load_group(self, group: ScreenGroup) -> None:
+        if group not in self._pending_groups:
+            return
+        self._pending_groups.remove(group)
+
+        start = time.perf_counter()
+        for module in group.modules:
+            importlib.import_module(module)
+        for kv_file in group.kv_files:
+            Builder.load_file(kv_file)
+        for class_name in group.screens.values():
+            self.add_widget(Factory.get(class_name)())
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.logger.info(f"Built screens {', '.join(group.screens)} in {elapsed:.0f} ms")
+
+    def load_next_group(self) -> bool:
+        """Build one pending group; returns whether any remain."""
+        if self._pending_groups:
+            self.load_group(self._pending_groups[0])
+        return bool(self._pending_groups)
 
 
 class Application(App):
@@ -65,9 +124,11 @@ class Application(App):
         super().__init__()
         self.logger = AppLogger().get_logger(__name__)
 
-        from services import person_service, model_service
+        with startup_profiler.phase("services"):
+            from services import person_service, model_service, statistics_service
         self.person_service = person_service
         self.model_service = model_service
+        self.statistics_service = statistics_service
 
         self._initialize()
 
@@ -76,15 +137,43 @@ class Application(App):
             if config.paths.TEMP_DIR.exists():
                 shutil.rmtree(config.paths.TEMP_DIR)
             config.paths.TEMP_DIR.mkdir(parents=True, exist_ok=True)
-
-            config.stats.FILE_STATS_CSV.parent.mkdir(parents=True, exist_ok=True)
-            if not config.stats.FILE_STATS_CSV.exists():
-                config.stats.FILE_STATS_CSV.touch()
         except Exception as e:
             self.logger.exception(f"Error initializing main app: {e}")
 
     def build(self):
-        return Main()
+        with startup_profiler.phase("build"):
+            return Main()
+
+    def on_start(self):
+        Clock.schedule_once(self._on_first_frame, 0)
+
+    def _on_first_frame(self, dt) -> None:
+        startup_profiler.mark("first frame")
+        startup_profiler.stop_tracking_imports()
+        startup_profiler.report(self.logger)
+
+        metrics.start_reporting(self.logger, config.metrics.SNAPSHOT_INTERVAL, config.metrics.SNAPSHOT_FILE)
+        threading.Thread(target=self._import_in_background, name="warm-up", daemon=True).start()
+        Clock.schedule_once(self._preload_screens, 0.5)
+
+    def _preload_screens(self, dt) -> None:
+        # one group per frame keeps the window responsive while the rest is built
+        try:
+            if self.root.manager.load_next_group():
+                Clock.schedule_once(self._preload_screens, 0)
+        except Exception as e:
+            self.logger.exception(f"Error preloading screens: {e}")
+
+    def _import_in_background(self) -> None:
+        for module in BACKGROUND_IMPORTS:
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                self.logger.warning(f"Cannot preload {module}: {e}")
+
+    def on_stop(self):
+        self.statistics_service.flush()
+        metrics.stop_reporting(self.logger, config.metrics.SNAPSHOT_FILE)
 
 
 if __name__ == '__main__':
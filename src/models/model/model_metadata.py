@@ -4,7 +4,7 @@ from typing import Optional, List
 
 from pydantic import BaseModel, NonNegativeInt, NonNegativeFloat, Field
 
-from core import Algorithm, config, AppLogger
+from core import Algorithm, Detector, config, AppLogger
 
 logger = AppLogger().get_logger(__name__)
 
@@ -22,7 +22,16 @@ class ModelMetadata(BaseModel):
 
     n_neighbors: Optional[NonNegativeInt] = None
     weight: Optional[str] = None
+    knn_algo: Optional[str] = None
+    n_probe: Optional[NonNegativeInt] = None
+    encoding_storage: Optional[str] = None
     gamma: Optional[str] = None
+    n_prototypes: Optional[NonNegativeInt] = None
+
+    detector: Optional[Detector] = None
+    detector_upsample: Optional[NonNegativeInt] = None
+    landmark_model: Optional[str] = None
+    num_jitters: Optional[NonNegativeInt] = None
 
     train_dataset_Y: List = Field(default_factory=list)
     test_dataset_Y: List = Field(default_factory=list)
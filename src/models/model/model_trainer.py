@@ -1,5 +1,8 @@
 import time
 
+from algorithms.centroid_classifier import CentroidClassifier
+from algorithms.face_detectors import get_detector
+from algorithms.face_encoder import get_encoder
 from algorithms.knn_classifier import KNNClassifier
 from algorithms.svm_classifier import SVMClassifier
 from core import Algorithm
@@ -22,16 +25,32 @@ class ModelTrainer:
                 model_path=self.meta.clf_path,
                 n_neighbors=self.meta.n_neighbors,
                 weight=self.meta.weight,
+                knn_algo=self.meta.knn_algo,
+                n_probe=self.meta.n_probe,
+                storage=self.meta.encoding_storage,
             )
         elif algo == Algorithm.SVM:
             clf = SVMClassifier(
                 model_path=self.meta.clf_path,
                 gamma=self.meta.gamma,
             )
+        elif algo == Algorithm.CENTROID:
+            clf = CentroidClassifier(
+                model_path=self.meta.clf_path,
+                n_prototypes=self.meta.n_prototypes,
+                threshold=self.meta.threshold,
+            )
         else:
             logger.error(f"Chosen invalid algorithm: {algo}")
             return False
 
+        try:
+            clf.set_detector(get_detector(self.meta.detector, self.meta.detector_upsample))
+            clf.set_encoder(get_encoder(self.meta.landmark_model, self.meta.num_jitters))
+        except Exception as e:
+            logger.error(f"Cannot create face detector or encoder: {e}")
+            return False
+
         try:
             logger.info(f"Starting training for model: {self.meta.name}")
             ok = clf.train()
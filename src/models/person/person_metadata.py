@@ -6,6 +6,7 @@ from pydantic import BaseModel, NonNegativeInt
 
 from core import config, AppLogger
 from core.enums import Gender
+from models.person.photo_manifest import PhotoManifest
 
 logger = AppLogger().get_logger(__name__)
 
@@ -48,6 +49,33 @@ class PersonMetadata(BaseModel):
     def json_path(self) -> Path:
         return self.dir_path / "metadata.json"
 
+    @property
+    def resized_path(self) -> Path:
+        return self.dir_path / "resized"
+
+    @property
+    def chips_path(self) -> Path:
+        return self.dir_path / "chips"
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.dir_path / "manifest.json"
+
+    def preview_path(self, photo_path: Path) -> Path:
+        """Resolution-capped copy of ``photo_path`` when it was ingested, otherwise the original."""
+        return self.preview_paths([photo_path])[0]
+
+    def preview_paths(self, photo_paths: List[Path]) -> List[Path]:
+        manifest = PhotoManifest.load(self.manifest_path)
+        previews = []
+        for photo_path in map(Path, photo_paths):
+            record = manifest.get_fresh(photo_path)
+            if record is not None and (self.resized_path / record.resized).exists():
+                previews.append(self.resized_path / record.resized)
+            else:
+                previews.append(photo_path)
+        return previews
+
     def save(self):
         try:
             with open(self.json_path, "w") as f:
@@ -0,0 +1,129 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+from core import config, AppLogger
+from models.person.photo_manifest import PhotoManifest, PhotoRecord, file_sha1
+from utils.image_loader import load_image
+
+logger = AppLogger().get_logger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _shape_predictor():
+    import dlib
+    import face_recognition_models
+    return dlib.shape_predictor(face_recognition_models.pose_predictor_five_point_model_location())
+
+
+class PhotoIngestor:
+    """Stores a resolution-capped JPEG copy and an aligned face chip for each person photo.
+
+    Face boxes are recorded per detector in the person's ``manifest.json``, so every photo
+    is detected once per detector and training can pass ``known_face_locations``.
+    """
+
+    def __init__(self, max_dimension: Optional[int] = None, jpeg_quality: Optional[int] = None,
+                 chip_size: Optional[int] = None):
+        self.max_dimension = max_dimension or config.person.INGEST_MAX_DIMENSION
+        self.jpeg_quality = jpeg_quality or config.person.INGEST_JPEG_QUALITY
+        self.chip_size = chip_size or config.person.FACE_CHIP_SIZE
+
+    def scan(self, person, photo_path: Path, manifest: PhotoManifest, detector=None) -> Optional[PhotoRecord]:
+        """Fresh record for ``photo_path`` with boxes from ``detector``, computing only what is missing."""
+        detector = detector or self.default_detector()
+
+        record = manifest.get_fresh(photo_path)
+        if record is None:
+            return self.ingest(person, photo_path, manifest, detector)
+
+        if record.face_locations(detector.name) is None:
+            try:
+                image, _ = load_image(person.resized_path / record.resized)
+                record.faces[detector.name] = [list(box) for box in detector.detect(image)]
+                manifest.mark_dirty()
+            except Exception as e:
+                logger.warning(f"Cannot read resized copy of {photo_path}, ingesting again: {e}")
+                return self.ingest(person, photo_path, manifest, detector)
+
+        return record
+
+    def ingest(self, person, photo_path: Path, manifest: PhotoManifest, detector=None,
+               sha1: Optional[str] = None) -> Optional[PhotoRecord]:
+        from algorithms.face_detectors import select_primary_face
+
+        detector = detector or self.default_detector()
+        try:
+            with Image.open(photo_path) as probe:
+                width, height = probe.size
+            image, scale = load_image(photo_path, self.max_dimension)
+
+            person.resized_path.mkdir(parents=True, exist_ok=True)
+            resized_name = f"{photo_path.stem}.jpg"
+            Image.fromarray(image).save(
+                person.resized_path / resized_name, "JPEG", quality=self.jpeg_quality
+            )
+
+            stat = photo_path.stat()
+            face_locations = detector.detect(image)
+            record = PhotoRecord(
+                sha1=sha1 or file_sha1(photo_path),
+                source_size=stat.st_size,
+                source_mtime=stat.st_mtime,
+                width=width,
+                height=height,
+                resized=resized_name,
+                scale=scale,
+                faces={detector.name: [list(box) for box in face_locations]}
+            )
+
+            if face_locations:
+                location = select_primary_face(face_locations, image.shape)
+                record.location = list(location)
+                record.chip = self._save_chip(person, image, location, resized_name)
+            else:
+                logger.info(f"No face found while ingesting {photo_path}")
+
+            manifest.set_record(photo_path.name, record)
+            return record
+
+        except Exception as e:
+            logger.exception(f"Error ingesting photo {photo_path}: {e}")
+            return None
+
+    def remove(self, person, photo_path: Path, manifest: PhotoManifest) -> None:
+        record = manifest.remove_record(Path(photo_path).name)
+        if record is None:
+            return
+
+        derived = [person.resized_path / record.resized]
+        if record.chip:
+            derived.append(person.chips_path / record.chip)
+        for path in derived:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Cannot delete derived file {path}: {e}")
+
+    @staticmethod
+    def default_detector():
+        from algorithms.face_detectors import get_detector
+        return get_detector()
+
+    def _save_chip(self, person, image: np.ndarray, location, name: str) -> Optional[str]:
+        try:
+            import dlib
+            top, right, bottom, left = location
+            shape = _shape_predictor()(image, dlib.rectangle(left, top, right, bottom))
+            # same 5-point alignment dlib uses before computing the face descriptor
+            chip = dlib.get_face_chip(image, shape, size=self.chip_size, padding=0.25)
+
+            person.chips_path.mkdir(parents=True, exist_ok=True)
+            Image.fromarray(chip).save(person.chips_path / name, "JPEG", quality=self.jpeg_quality)
+            return name
+        except Exception as e:
+            logger.warning(f"Cannot create face chip for {name}: {e}")
+            return None
@@ -0,0 +1,114 @@
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, NonNegativeInt, PrivateAttr
+
+from core import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+FaceLocation = Tuple[int, int, int, int]
+
+
+def file_sha1(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PhotoRecord(BaseModel):
+    """Everything derived from one person photo, keyed in the manifest by the file name."""
+
+    sha1: str
+    source_size: NonNegativeInt
+    source_mtime: float
+    width: NonNegativeInt
+    height: NonNegativeInt
+
+    resized: str
+    # resized -> original coordinates
+    scale: float = 1.0
+    chip: Optional[str] = None
+    # (top, right, bottom, left) of the primary face in the resized copy
+    location: Optional[List[int]] = None
+    # all face boxes in the resized copy, per detector name
+    faces: Dict[str, List[List[int]]] = Field(default_factory=dict)
+
+    def face_locations(self, detector_name: str) -> Optional[List[FaceLocation]]:
+        """Boxes found by ``detector_name`` or ``None`` when that detector never ran."""
+        boxes = self.faces.get(detector_name)
+        return None if boxes is None else [tuple(box) for box in boxes]
+
+    def is_fresh(self, photo_path: Path) -> bool:
+        try:
+            stat = photo_path.stat()
+        except OSError:
+            return False
+
+        if stat.st_size != self.source_size:
+            return False
+        if stat.st_mtime == self.source_mtime:
+            return True
+
+        # touched or copied with a new mtime: only the content decides
+        if file_sha1(photo_path) != self.sha1:
+            return False
+        self.source_mtime = stat.st_mtime
+        return True
+
+
+class PhotoManifest(BaseModel):
+    records: Dict[str, PhotoRecord] = Field(default_factory=dict)
+
+    _dirty: bool = PrivateAttr(default=False)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def set_record(self, photo_name: str, record: PhotoRecord) -> None:
+        self.records[photo_name] = record
+        self._dirty = True
+
+    def remove_record(self, photo_name: str) -> Optional[PhotoRecord]:
+        record = self.records.pop(photo_name, None)
+        self._dirty = self._dirty or record is not None
+        return record
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    @classmethod
+    def load(cls, path: Path) -> "PhotoManifest":
+        if not path.exists():
+            return cls()
+        try:
+            return cls.parse_file(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable photo manifest {path}: {e}")
+            return cls()
+
+    def save(self, path: Path) -> bool:
+        try:
+            with open(path, "w") as f:
+                f.write(self.json(indent=4))
+            self._dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save photo manifest {path}: {e}")
+            return False
+
+    def get_fresh(self, photo_path: Path) -> Optional[PhotoRecord]:
+        record = self.records.get(photo_path.name)
+        if record is None:
+            return None
+
+        mtime = record.source_mtime
+        if not record.is_fresh(photo_path):
+            return None
+        if record.source_mtime != mtime:
+            self._dirty = True
+        return record
@@ -0,0 +1,140 @@
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from core import config, AppLogger
+from models.person.photo_manifest import PhotoManifest, file_sha1
+
+logger = AppLogger().get_logger(__name__)
+
+# linux/fs.h: clone the whole source file into the destination (btrfs, xfs, ...)
+FICLONE = 0x40049409
+
+
+class StoreMethod(str, Enum):
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    COPY = "copy"
+    DUPLICATE = "duplicate"
+    FAILED = "failed"
+
+
+class StoreResult(BaseModel):
+    source: Path
+    destination: Optional[Path] = None
+    sha1: str = ""
+    method: StoreMethod
+    error: str = ""
+
+    @property
+    def stored(self) -> bool:
+        return self.method in (StoreMethod.REFLINK, StoreMethod.HARDLINK, StoreMethod.COPY)
+
+
+class _Batch:
+    """Hashes already in the person's folder, shared by the jobs of one ``store`` call."""
+
+    def __init__(self, known: Dict[str, Path]):
+        self.known = known
+        self.lock = threading.Lock()
+
+
+class PhotoStore:
+    """Puts photos into a person's folder without storing the same picture twice.
+
+    Files are deduplicated by SHA-1 against the person's manifest and within the batch.
+    A new file is cloned (reflink) when source and destination share a filesystem, otherwise
+    copied; all files of a batch are handled in parallel. With ``ALLOW_PHOTO_HARDLINKS`` a
+    hard link is tried before copying; it shares the inode with the source, edits to the
+    source are caught by the manifest's freshness check.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, allow_hardlinks: Optional[bool] = None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.person.PHOTO_COPY_WORKERS,
+            thread_name_prefix="PhotoStore"
+        )
+        self.allow_hardlinks = (
+            config.person.ALLOW_PHOTO_HARDLINKS if allow_hardlinks is None else allow_hardlinks
+        )
+
+    def store(self, person, sources: List[Path]) -> List[Future]:
+        """Start storing ``sources``; every future resolves to the ``StoreResult`` of one file."""
+        person.photos_path.mkdir(parents=True, exist_ok=True)
+
+        manifest = PhotoManifest.load(person.manifest_path)
+        batch = _Batch({record.sha1: person.photos_path / name for name, record in manifest.records.items()})
+
+        # names are reserved in input order so photos keep the order they were picked in
+        next_index = self._next_index(person.photos_path)
+        return [
+            self.executor.submit(
+                self._store_one, Path(source), person.photos_path / f"{next_index + i}{Path(source).suffix}", batch
+            )
+            for i, source in enumerate(sources)
+        ]
+
+    @staticmethod
+    def _next_index(photos_path: Path) -> int:
+        indices = [int(p.stem) for p in photos_path.iterdir() if p.is_file() and p.stem.isdigit()]
+        return max(indices, default=0) + 1
+
+    def _store_one(self, source: Path, destination: Path, batch: _Batch) -> StoreResult:
+        try:
+            sha1 = file_sha1(source)
+            with batch.lock:
+                existing = batch.known.get(sha1)
+                if existing is None:
+                    batch.known[sha1] = destination
+
+            if existing is not None:
+                logger.info(f"Skipped duplicate photo {source} (same as {existing.name})")
+                return StoreResult(source=source, destination=existing, sha1=sha1, method=StoreMethod.DUPLICATE)
+
+            method = self._transfer(source, destination)
+            logger.info(f"Stored photo {source} -> {destination} ({method.value})")
+            return StoreResult(source=source, destination=destination, sha1=sha1, method=method)
+
+        except Exception as e:
+            logger.exception(f"Error storing photo {source}: {e}")
+            return StoreResult(source=source, method=StoreMethod.FAILED, error=str(e))
+
+    def _transfer(self, source: Path, destination: Path) -> StoreMethod:
+        if source.stat().st_dev == destination.parent.stat().st_dev:
+            try:
+                self._reflink(source, destination)
+                return StoreMethod.REFLINK
+            except OSError:
+                pass
+
+            if self.allow_hardlinks:
+                try:
+                    os.link(source, destination)
+                    return StoreMethod.HARDLINK
+                except OSError:
+                    pass
+
+        shutil.copy2(str(source), str(destination))
+        return StoreMethod.COPY
+
+    @staticmethod
+    def _reflink(source: Path, destination: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("reflink is only supported on Linux")
+
+        import fcntl
+        with open(source, "rb") as src, open(destination, "xb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError:
+                dst.close()
+                destination.unlink()
+                raise
+        shutil.copystat(str(source), str(destination))
@@ -1,9 +1,13 @@
+from .camera_discovery import CameraDiscovery
 from .camera_service import CameraService
 from .model_service import ModelService
 from .person_service import PersonService
+from .statistics_service import StatisticsService
 
 person_service = PersonService()
 model_service = ModelService()
 camera_service = CameraService()
+camera_discovery = CameraDiscovery()
+statistics_service = StatisticsService()
 
-__all__ = ['person_service', 'model_service', 'camera_service']
+__all__ = ['person_service', 'model_service', 'camera_service', 'camera_discovery', 'statistics_service']
@@ -0,0 +1,186 @@
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import cv2
+from pydantic import BaseModel
+
+from core import config
+from core.config import CaptureProfile
+from core.logger import AppLogger
+from services.camera_service import get_capture_profile
+
+logger = AppLogger().get_logger(__name__)
+
+
+class CameraInfo(BaseModel):
+    port: int
+    width: int
+    height: int
+    fps: float = 0.0
+    backend: str = ""
+    # name of the capture profile chosen for this camera, the configured default when None
+    profile: Optional[str] = None
+
+
+class CameraList(BaseModel):
+    """Last discovery result, persisted so the next start can list cameras without probing."""
+
+    probed_at: Optional[datetime] = None
+    cameras: List[CameraInfo] = []
+
+    @classmethod
+    def load(cls, path: Path) -> "CameraList":
+        if not path.exists():
+            return cls()
+        try:
+            return cls.parse_file(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable camera list {path}: {e}")
+            return cls()
+
+    def save(self, path: Path) -> bool:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                f.write(self.json(indent=4))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save camera list {path}: {e}")
+            return False
+
+
+def probe_port(port: int) -> Optional[CameraInfo]:
+    """Open ``port``, grab one frame and report what the device delivered."""
+    capture = cv2.VideoCapture(port)
+    try:
+        if not capture.isOpened():
+            return None
+        ret, frame = capture.read()
+        if not ret or frame is None:
+            return None
+        return CameraInfo(
+            port=port,
+            width=frame.shape[1],
+            height=frame.shape[0],
+            fps=capture.get(cv2.CAP_PROP_FPS) or 0.0,
+            backend=capture.getBackendName(),
+        )
+    finally:
+        capture.release()
+
+
+class CameraDiscovery:
+    """Finds cameras on a background thread and remembers them between runs.
+
+    ``cameras`` is available immediately from the persisted list. ``probe`` re-scans the
+    ports one by one; a port that does not answer within the timeout is skipped (its probe
+    thread is left to finish on its own, OpenCV cannot cancel an open). Listeners are called
+    on the discovery thread with the new list.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, max_ports: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        self.cache_path = cache_path or config.camera.CAMERAS_FILE
+        self.max_ports = max_ports or config.camera.MAX_PORTS
+        self.timeout = timeout or config.camera.PROBE_TIMEOUT
+
+        self._known = CameraList.load(self.cache_path)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[List[CameraInfo]], None]] = []
+
+    @property
+    def cameras(self) -> List[CameraInfo]:
+        return list(self._known.cameras)
+
+    @property
+    def ports(self) -> List[int]:
+        return [camera.port for camera in self._known.cameras]
+
+    @property
+    def is_known(self) -> bool:
+        """Whether any discovery has completed, now or in an earlier run."""
+        return self._known.probed_at is not None
+
+    def get_camera(self, port: int) -> Optional[CameraInfo]:
+        return next((camera for camera in self._known.cameras if camera.port == port), None)
+
+    def set_profile(self, port: int, profile: Optional[str]) -> bool:
+        if profile is not None and profile not in config.camera.CAPTURE_PROFILES:
+            logger.warning(f"Unknown capture profile: {profile}")
+            return False
+
+        camera = self.get_camera(port)
+        if camera is None:
+            return False
+        camera.profile = profile
+        return self._known.save(self.cache_path)
+
+    def profile_for(self, port: int) -> CaptureProfile:
+        camera = self.get_camera(port)
+        return get_capture_profile(camera.profile if camera else None)
+
+    def is_probing(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def bind(self, callback: Callable[[List[CameraInfo]], None]) -> None:
+        self._listeners.append(callback)
+
+    def unbind(self, callback: Callable[[List[CameraInfo]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def probe(self, skip_ports: Optional[List[int]] = None) -> bool:
+        """Start a re-scan unless one is running. ``skip_ports`` are kept as known (e.g. in use)."""
+        with self._lock:
+            if self.is_probing():
+                return False
+            self._thread = threading.Thread(
+                target=self._run, args=(set(skip_ports or ()),), name="CameraDiscovery", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def _run(self, skip_ports) -> None:
+        try:
+            cameras = []
+            for port in range(self.max_ports):
+                if port in skip_ports:
+                    known = self.get_camera(port)
+                    if known:
+                        cameras.append(known)
+                    continue
+
+                camera = self._probe_with_timeout(port)
+                if camera:
+                    known = self.get_camera(port)
+                    camera.profile = known.profile if known else None
+                    cameras.append(camera)
+
+            self._known = CameraList(probed_at=datetime.now(), cameras=cameras)
+            self._known.save(self.cache_path)
+            logger.info(f"Found {len(cameras)} cameras: {', '.join(str(c.port) for c in cameras) or 'none'}")
+
+            for callback in list(self._listeners):
+                callback(self.cameras)
+        except Exception as e:
+            logger.exception(f"Error discovering cameras: {e}")
+
+    def _probe_with_timeout(self, port: int) -> Optional[CameraInfo]:
+        result: List[Optional[CameraInfo]] = [None]
+
+        def probe():
+            try:
+                result[0] = probe_port(port)
+            except Exception as e:
+                logger.debug(f"Probing camera port {port} failed: {e}")
+
+        thread = threading.Thread(target=probe, name=f"CameraProbe-{port}", daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        if thread.is_alive():
+            logger.warning(f"Camera port {port} did not answer within {self.timeout:.1f} s")
+            return None
+        return result[0]
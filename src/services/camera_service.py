@@ -1,120 +1,131 @@
-import queue
-import threading
-import time
-from functools import lru_cache
-from typing import Optional, Tuple
+import sys
+from typing import Optional
 
 import cv2
 
+from core import config
+from core.config import CaptureProfile
 from core.logger import AppLogger
+from services.frame_sources import Frame, FrameSource, NegotiatedCapture
 
 logger = AppLogger().get_logger(__name__)
 
+BACKENDS = {
+    "any": cv2.CAP_ANY,
+    "dshow": cv2.CAP_DSHOW,
+    "msmf": cv2.CAP_MSMF,
+    "v4l2": cv2.CAP_V4L2,
+    "avfoundation": cv2.CAP_AVFOUNDATION,
+    "gstreamer": cv2.CAP_GSTREAMER,
+}
+
 
 class CameraError(Exception):
     pass
 
 
-class CameraService:
+def platform_backend() -> int:
+    if sys.platform.startswith("win"):
+        return cv2.CAP_DSHOW
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def resolve_backend(name: str) -> int:
+    if name == "auto":
+        return platform_backend()
+    if name not in BACKENDS:
+        raise CameraError(f"Unknown capture backend: {name}")
+    return BACKENDS[name]
+
+
+def decode_fourcc(value: float) -> str:
+    code = int(value)
+    return "".join(chr((code >> 8 * i) & 0xFF) for i in range(4)).strip("\x00 ")
+
+
+def get_capture_profile(name: Optional[str] = None) -> CaptureProfile:
+    name = name or config.camera.DEFAULT_CAPTURE_PROFILE
+    if name not in config.camera.CAPTURE_PROFILES:
+        logger.warning(f"Unknown capture profile {name}, using {config.camera.DEFAULT_CAPTURE_PROFILE}")
+        name = config.camera.DEFAULT_CAPTURE_PROFILE
+    return config.camera.CAPTURE_PROFILES[name]
+
+
+class CameraService(FrameSource):
     def __init__(self, port: int = 0, fps: int = 30, queue_size: int = 2):
+        super().__init__(fps=fps, queue_size=queue_size, realtime=True)
         self.port = port
-        self.fps = fps
         self._capture: Optional[cv2.VideoCapture] = None
-        self._thread: Optional[threading.Thread] = None
-        self._running = threading.Event()
-        self.frames: "queue.Queue[Tuple[bool, Optional[object]]]" = queue.Queue(maxsize=queue_size)
-        self._lock = threading.Lock()
-
-    def start(self, port) -> None:
-        with self._lock:
-            if self._running.is_set():
-                logger.debug("CameraService already running")
-                return
-
-            logger.debug("Opening VideoCapture on port %s", port or self.port)
-            self._capture = cv2.VideoCapture(self.port, cv2.CAP_DSHOW)
-            if not self._capture.isOpened():
-                raise CameraError(f"Unable to open camera on port {port or self.port}")
-
-            self._running.set()
-            self._thread = threading.Thread(target=self._run, name="CameraReadThread", daemon=True)
-            self._thread.start()
-            logger.info("CameraService started")
-
-    def stop(self) -> None:
-        with self._lock:
-            self._running.clear()
-            if self._thread and self._thread.is_alive():
-                logger.debug("Waiting for camera thread to finish")
-                self._thread.join(timeout=1.0)
-
-            if self._capture:
-                try:
-                    self._capture.release()
-                except Exception:
-                    logger.exception("Error releasing capture")
-                finally:
-                    self._capture = None
-
-            # empty queue
-            while not self.frames.empty():
-                try:
-                    self.frames.get_nowait()
-                except queue.Empty:
-                    break
-
-            logger.info("CameraService stopped")
-
-    def _run(self) -> None:
-        target_dt = 1.0 / max(1, self.fps)
-        logger.debug("Camera thread running with target dt=%s", target_dt)
-        while self._running.is_set():
-            start = time.time()
-            try:
-                ret, frame = self._capture.read()  # type: ignore[attr-defined]
-            except Exception as exc:
-                logger.exception("Exception reading frame: %s", exc)
-                ret, frame = False, None
 
+    def _open(self, port: Optional[int], profile: Optional[CaptureProfile]) -> NegotiatedCapture:
+        port = self.port if port is None else port
+        profile = profile or get_capture_profile()
+
+        logger.debug("Opening VideoCapture on port %s", port)
+        self._capture = self._open_capture(port, profile)
+        self.port = port
+        if profile.fps:
+            self.fps = profile.fps
+        return self._configure(port, profile)
+
+    @staticmethod
+    def _open_capture(port: int, profile: CaptureProfile) -> cv2.VideoCapture:
+        backend = resolve_backend(profile.backend)
+        capture = cv2.VideoCapture(port, backend)
+        if not capture.isOpened() and backend != cv2.CAP_ANY:
+            # the preferred backend may be missing from this OpenCV build
+            logger.warning(f"Backend {profile.backend} cannot open camera {port}, falling back to any backend")
+            capture.release()
+            capture = cv2.VideoCapture(port, cv2.CAP_ANY)
+
+        if not capture.isOpened():
+            raise CameraError(f"Unable to open camera on port {port}")
+        return capture
+
+    def _configure(self, port: int, profile: CaptureProfile) -> NegotiatedCapture:
+        capture = self._capture
+        # the pixel format has to be set before the size, V4L2 picks sizes per format
+        if profile.fourcc:
+            capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*profile.fourcc))
+        if profile.width and profile.height:
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, profile.width)
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.height)
+        if profile.fps:
+            capture.set(cv2.CAP_PROP_FPS, profile.fps)
+
+        buffer_size = None
+        if profile.buffer_size and capture.set(cv2.CAP_PROP_BUFFERSIZE, profile.buffer_size):
+            buffer_size = int(capture.get(cv2.CAP_PROP_BUFFERSIZE)) or None
+
+        negotiated = NegotiatedCapture(
+            port=port,
+            backend=capture.getBackendName(),
+            width=int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=capture.get(cv2.CAP_PROP_FPS) or 0.0,
+            fourcc=decode_fourcc(capture.get(cv2.CAP_PROP_FOURCC)),
+            buffer_size=buffer_size,
+        )
+
+        if profile.width and profile.height and (negotiated.width, negotiated.height) != (profile.width, profile.height):
+            logger.warning(
+                f"Camera {port} runs at {negotiated.width}x{negotiated.height} "
+                f"instead of {profile.width}x{profile.height}"
+            )
+        if profile.fourcc and negotiated.fourcc and negotiated.fourcc != profile.fourcc:
+            logger.warning(f"Camera {port} delivers {negotiated.fourcc} instead of {profile.fourcc}")
+        return negotiated
+
+    def _grab(self) -> Frame:
+        return self._capture.read()  # type: ignore[attr-defined]
+
+    def _release(self) -> None:
+        if self._capture:
             try:
-                # non-blocking put; if queue full, drop oldest and put again
-                if not self.frames.full():
-                    self.frames.put_nowait((ret, frame))
-                else:
-                    try:
-                        _ = self.frames.get_nowait()
-                    except queue.Empty:
-                        pass
-                    try:
-                        self.frames.put_nowait((ret, frame))
-                    except queue.Full:
-                        logger.warning("Frame queue full, dropping frame")
-            except Exception:
-                logger.exception("Failed to enqueue frame")
-
-            elapsed = time.time() - start
-            to_sleep = target_dt - elapsed
-            if to_sleep > 0:
-                time.sleep(to_sleep)
-
-    def read_now(self) -> Tuple[bool, Optional[object]]:
-        try:
-            return self.frames.get_nowait()
-        except queue.Empty:
-            return False, None
-
-    def is_running(self) -> bool:
-        return self._running.is_set()
-
-    @lru_cache(maxsize=None)
-    def get_all_cameras(self, max_tests=10):
-        available = []
-        for index in range(max_tests):
-            cap = cv2.VideoCapture(index)
-            if cap is None or not cap.isOpened():
-                continue
-            ret, _ = cap.read()
-            if ret:
-                available.append(index)
-            cap.release()
-        return available
+                self._capture.release()
+            finally:
+                self._capture = None
@@ -0,0 +1,133 @@
+import os
+import threading
+import time
+from typing import List, Optional
+
+from core import config
+from core.logger import AppLogger
+from utils.metrics import metrics
+
+logger = AppLogger().get_logger(__name__)
+
+
+class FrameRateController:
+    """Trades detection resolution and frame rate for a per-frame cost or CPU budget.
+
+    Recognition threads report how long each frame took. Every ``ADAPT_INTERVAL`` seconds
+    the smoothed cost is compared with the budget that lets every stream reach
+    ``TARGET_FPS`` on the available workers, and the process CPU share with ``CPU_BUDGET``.
+    Over either budget, detection runs on a smaller copy of the frame, down to the smallest
+    ``DETECTION_SCALES`` step. Still over the CPU budget after that, only every ``skip``-th
+    frame is recognized; skipping does not make a frame cheaper, so the cost budget alone
+    never triggers it. Well under both budgets, the steps are undone in reverse order. The UI
+    poll interval follows the rate results actually arrive at.
+    """
+
+    SMOOTHING = 0.2
+    # over budget above this fraction, under budget below the second
+    HIGH_WATER = 1.0
+    LOW_WATER = 0.6
+
+    def __init__(self, workers: int, streams: int = 1):
+        self.workers = max(1, workers)
+        self.streams = max(1, streams)
+        self.enabled = config.camera.ADAPTIVE_RATE
+
+        self.scales: List[float] = sorted(config.camera.DETECTION_SCALES, reverse=True) or [1.0]
+        self.scale_step = 0
+        self.skip = 1
+        self.poll_interval = config.camera.MIN_POLL_INTERVAL
+
+        self.cost_ms = 0.0
+        self.cpu = 0.0
+        self.fps = 0.0
+        self.decisions = 0
+
+        self._lock = threading.Lock()
+        self._frames = 0
+        self._window_started = time.monotonic()
+        self._cpu_started = time.process_time()
+
+    @property
+    def detection_scale(self) -> float:
+        return self.scales[self.scale_step]
+
+    @property
+    def budget_ms(self) -> float:
+        """Per-frame cost that still allows ``TARGET_FPS`` on every stream."""
+        return 1000.0 * self.workers / (config.camera.TARGET_FPS * self.streams)
+
+    def set_streams(self, streams: int) -> None:
+        self.streams = max(1, streams)
+
+    def observe(self, cost_ms: float) -> None:
+        with self._lock:
+            self.cost_ms = cost_ms if self.cost_ms == 0.0 else \
+                self.cost_ms + self.SMOOTHING * (cost_ms - self.cost_ms)
+            self._frames += 1
+
+    def adapt(self, now: Optional[float] = None) -> bool:
+        """Re-evaluate once per ``ADAPT_INTERVAL``; ``True`` when a setting changed."""
+        now = time.monotonic() if now is None else now
+        elapsed = now - self._window_started
+        if elapsed < config.camera.ADAPT_INTERVAL:
+            return False
+
+        with self._lock:
+            frames, self._frames = self._frames, 0
+        cpu_time = time.process_time()
+        self.cpu = (cpu_time - self._cpu_started) / (elapsed * (os.cpu_count() or 1))
+        self.fps = frames / elapsed / self.streams
+        self._window_started, self._cpu_started = now, cpu_time
+        if not self.enabled or frames == 0:
+            return False
+
+        before = (self.scale_step, self.skip)
+        cpu_budget = config.camera.CPU_BUDGET
+        cpu_over = bool(cpu_budget) and self.cpu > cpu_budget
+        over = cpu_over or self.cost_ms > self.HIGH_WATER * self.budget_ms
+        under = self.cost_ms < self.LOW_WATER * self.budget_ms and \
+            (not cpu_budget or self.cpu < self.LOW_WATER * cpu_budget)
+
+        if over:
+            if self.scale_step < len(self.scales) - 1:
+                self.scale_step += 1
+            elif cpu_over and self.skip < config.camera.MAX_FRAME_SKIP:
+                self.skip += 1
+        elif under:
+            if self.skip > 1:
+                self.skip -= 1
+            elif self.scale_step > 0:
+                self.scale_step -= 1
+
+        # poll twice per expected result so none waits for long, all streams share the poll;
+        # small changes are ignored so the UI timer is not rescheduled every second
+        result_rate = max(self.fps * self.streams, 1e-3)
+        poll_interval = min(max(0.5 / result_rate, config.camera.MIN_POLL_INTERVAL),
+                            config.camera.MAX_POLL_INTERVAL)
+        poll_changed = abs(poll_interval - self.poll_interval) > 0.2 * self.poll_interval
+        if poll_changed:
+            self.poll_interval = poll_interval
+
+        changed = before != (self.scale_step, self.skip)
+        for name, value in self.snapshot().items():
+            metrics.gauge(f"rate.{name}", value)
+        if changed:
+            self.decisions += 1
+            logger.info(
+                f"Frame rate: {self.cost_ms:.0f}/{self.budget_ms:.0f} ms per frame, cpu {self.cpu:.0%}, "
+                f"{self.fps:.1f} fps -> detection scale {self.detection_scale:g}, 1 of {self.skip} frames"
+            )
+        return changed or poll_changed
+
+    def snapshot(self) -> dict:
+        return {
+            "detection_scale": self.detection_scale,
+            "skip": self.skip,
+            "poll_interval": self.poll_interval,
+            "cost_ms": self.cost_ms,
+            "budget_ms": self.budget_ms,
+            "cpu": self.cpu,
+            "fps": self.fps,
+            "decisions": self.decisions,
+        }
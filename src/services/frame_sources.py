@@ -0,0 +1,435 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+from pydantic import BaseModel
+
+from core import config
+from core.config import CaptureProfile
+from core.logger import AppLogger
+from utils.metrics import metrics
+
+logger = AppLogger().get_logger(__name__)
+
+Frame = Tuple[bool, Optional[np.ndarray]]
+
+VIDEO_EXTENSIONS = {".avi", ".mp4", ".mkv", ".mov"}
+TIMESTAMPS_FILE = "timestamps.txt"
+
+
+class NegotiatedCapture(BaseModel):
+    """What the driver actually accepted from a ``CaptureProfile``."""
+    port: int
+    backend: str
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+    buffer_size: Optional[int] = None
+
+
+class FrameSource(ABC):
+    """Producer thread feeding BGR frames into a small queue, the interface of ``CameraService``.
+
+    A ``realtime`` source is paced to its frame interval and drops the oldest queued frame
+    when the consumer falls behind, like a live camera. Otherwise every frame is delivered and
+    the producer waits for the consumer, which makes benchmark runs reproducible. ``finished``
+    is set when a finite source runs out of frames.
+    """
+
+    def __init__(self, fps: float = 30, queue_size: int = 2, realtime: bool = True):
+        self.fps = fps
+        self.realtime = realtime
+        # frames with the time they were queued at
+        self.frames: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.negotiated: Optional[NegotiatedCapture] = None
+        self.recorder: Optional["FrameRecorder"] = None
+        self.finished = threading.Event()
+        self.produced = 0
+        self.dropped = 0
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self._lock = threading.Lock()
+        self._max_fps: Optional[float] = None
+        self._wake = threading.Event()
+
+    @abstractmethod
+    def _open(self, port: Optional[int], profile: Optional[CaptureProfile]) -> NegotiatedCapture:
+        pass
+
+    @abstractmethod
+    def _grab(self) -> Frame:
+        """Next frame; ``(False, None)`` with ``finished`` set ends the stream."""
+        pass
+
+    @abstractmethod
+    def _release(self) -> None:
+        pass
+
+    def _frame_interval(self) -> float:
+        return 1.0 / max(1e-3, self.fps)
+
+    def throttle(self, max_fps: Optional[float]) -> None:
+        """Cap the frame rate of a realtime source, e.g. while nobody is in view.
+
+        ``None`` lifts the cap and cuts short the wait for the next frame.
+        """
+        self._max_fps = max_fps
+        if max_fps is None:
+            self._wake.set()
+
+    @property
+    def throttled(self) -> bool:
+        return self._max_fps is not None
+
+    def start(self, port: Optional[int] = None, profile: Optional[CaptureProfile] = None) -> NegotiatedCapture:
+        with self._lock:
+            if self._running.is_set():
+                logger.debug(f"{type(self).__name__} already running")
+                return self.negotiated
+
+            self.finished.clear()
+            self.produced = self.dropped = 0
+            self._max_fps = None
+            self.negotiated = self._open(port, profile)
+
+            self._running.set()
+            self._thread = threading.Thread(target=self._run, name=f"{type(self).__name__}Thread", daemon=True)
+            self._thread.start()
+            logger.info(f"{type(self).__name__} started: {self.negotiated}")
+            return self.negotiated
+
+    def stop(self) -> None:
+        with self._lock:
+            self._running.clear()
+            if self._thread and self._thread.is_alive():
+                logger.debug("Waiting for frame thread to finish")
+                self._thread.join(timeout=1.0)
+
+            try:
+                self._release()
+            except Exception:
+                logger.exception("Error releasing frame source")
+
+            # empty queue
+            while not self.frames.empty():
+                try:
+                    self.frames.get_nowait()
+                except queue.Empty:
+                    break
+
+            logger.info(f"{type(self).__name__} stopped")
+
+    def _run(self) -> None:
+        logger.debug(f"Frame thread running, realtime={self.realtime}")
+        while self._running.is_set():
+            start = time.perf_counter()
+            try:
+                with metrics.timer("capture.grab"):
+                    ret, frame = self._grab()
+            except Exception as exc:
+                logger.exception("Exception reading frame: %s", exc)
+                ret, frame = False, None
+
+            if not ret and self.finished.is_set():
+                break
+
+            if ret:
+                self.produced += 1
+                if self.recorder is not None:
+                    self.recorder.write(frame)
+
+            try:
+                self._enqueue((ret, frame, time.perf_counter()))
+            except Exception:
+                logger.exception("Failed to enqueue frame")
+
+            if self.realtime:
+                interval = self._frame_interval()
+                if self._max_fps:
+                    interval = max(interval, 1.0 / self._max_fps)
+                to_sleep = interval - (time.perf_counter() - start)
+                if to_sleep > 0:
+                    self._wake.wait(to_sleep)
+                    self._wake.clear()
+
+    def _enqueue(self, item: Tuple[bool, Optional[np.ndarray], float]) -> None:
+        if not self.realtime:
+            while self._running.is_set():
+                try:
+                    self.frames.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            return
+
+        # non-blocking put; if queue full, drop oldest and put again
+        if self.frames.full():
+            try:
+                self.frames.get_nowait()
+                self.dropped += 1
+                metrics.count("capture.dropped")
+            except queue.Empty:
+                pass
+        try:
+            self.frames.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            metrics.count("capture.dropped")
+            logger.warning("Frame queue full, dropping frame")
+
+    @staticmethod
+    def _dequeued(item: Tuple[bool, Optional[np.ndarray], float]) -> Frame:
+        ret, frame, enqueued_at = item
+        metrics.observe("capture.queue_wait", (time.perf_counter() - enqueued_at) * 1000.0)
+        return ret, frame
+
+    def read_now(self) -> Frame:
+        try:
+            return self._dequeued(self.frames.get_nowait())
+        except queue.Empty:
+            return False, None
+
+    def read(self, timeout: Optional[float] = None) -> Frame:
+        """Wait for the next frame; ``(False, None)`` on timeout or once a finished source is drained."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            try:
+                return self._dequeued(self.frames.get(timeout=0.05))
+            except queue.Empty:
+                if self.finished.is_set() or not self._running.is_set():
+                    return False, None
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return False, None
+
+    def is_running(self) -> bool:
+        return self._running.is_set()
+
+    def start_recording(self, path: Path) -> "FrameRecorder":
+        self.stop_recording()
+        self.recorder = FrameRecorder(path, fps=self.negotiated.fps if self.negotiated and self.negotiated.fps else self.fps)
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
+
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path: Path, loop: bool = False, realtime: bool = True, queue_size: int = 2):
+        super().__init__(queue_size=queue_size, realtime=realtime)
+        self.path = Path(path)
+        self.loop = loop
+        self._capture: Optional[cv2.VideoCapture] = None
+
+    def _open(self, port, profile) -> NegotiatedCapture:
+        self._capture = cv2.VideoCapture(str(self.path))
+        if not self._capture.isOpened():
+            raise FileNotFoundError(f"Cannot open video {self.path}")
+
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS) or self.fps
+        return NegotiatedCapture(
+            port=-1,
+            backend=self._capture.getBackendName(),
+            width=int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps=self.fps,
+            fourcc=self.path.suffix.lstrip(".").upper(),
+        )
+
+    def _grab(self) -> Frame:
+        ret, frame = self._capture.read()
+        if not ret and self.loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self._capture.read()
+        if not ret:
+            self.finished.set()
+        return ret, frame
+
+    def _release(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+
+class ImageSequenceSource(FrameSource):
+    """Frames of a directory in name order; ``timestamps.txt`` from ``FrameRecorder`` sets the pacing."""
+
+    def __init__(self, directory: Path, fps: float = 30, loop: bool = False, realtime: bool = True,
+                 queue_size: int = 2):
+        super().__init__(fps=fps, queue_size=queue_size, realtime=realtime)
+        self.directory = Path(directory)
+        self.loop = loop
+        self.paths: List[Path] = []
+        self.timestamps: Optional[List[float]] = None
+        self._index = 0
+
+    def _open(self, port, profile) -> NegotiatedCapture:
+        self.paths = sorted(
+            p for p in self.directory.iterdir()
+            if p.is_file() and config.person.validate_image(str(p))
+        )
+        if not self.paths:
+            raise FileNotFoundError(f"No images in {self.directory}")
+
+        self.timestamps = self._load_timestamps()
+        self._index = 0
+
+        first = cv2.imread(str(self.paths[0]))
+        return NegotiatedCapture(
+            port=-1,
+            backend="images",
+            width=first.shape[1],
+            height=first.shape[0],
+            fps=self.fps,
+            fourcc=self.paths[0].suffix.lstrip(".").upper(),
+        )
+
+    def _load_timestamps(self) -> Optional[List[float]]:
+        path = self.directory / TIMESTAMPS_FILE
+        if not path.exists():
+            return None
+        try:
+            timestamps = [float(line) for line in path.read_text().split()]
+            return timestamps if len(timestamps) == len(self.paths) else None
+        except ValueError:
+            return None
+
+    def _frame_interval(self) -> float:
+        # the index has already moved past the frame just delivered
+        i = self._index
+        if self.timestamps and 0 < i < len(self.timestamps):
+            return max(0.0, self.timestamps[i] - self.timestamps[i - 1])
+        return super()._frame_interval()
+
+    def _grab(self) -> Frame:
+        if self._index >= len(self.paths):
+            if not self.loop:
+                self.finished.set()
+                return False, None
+            self._index = 0
+
+        frame = cv2.imread(str(self.paths[self._index]))
+        self._index += 1
+        return frame is not None, frame
+
+    def _release(self) -> None:
+        self._index = 0
+
+
+class SyntheticSource(FrameSource):
+    """Generated frames: a noisy background with an optional image (e.g. a face) moving across it."""
+
+    def __init__(self, width: int = 640, height: int = 480, fps: float = 30, frames: Optional[int] = None,
+                 sprite: Optional[np.ndarray] = None, realtime: bool = True, queue_size: int = 2, seed: int = 42):
+        super().__init__(fps=fps, queue_size=queue_size, realtime=realtime)
+        self.width = width
+        self.height = height
+        self.frames_total = frames
+        self.sprite = sprite
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._index = 0
+        self._background: Optional[np.ndarray] = None
+
+    def _open(self, port, profile) -> NegotiatedCapture:
+        self._rng = np.random.default_rng(self.seed)
+        self._index = 0
+        self._background = self._rng.integers(0, 256, (self.height, self.width, 3), dtype=np.uint8)
+        return NegotiatedCapture(port=-1, backend="synthetic", width=self.width, height=self.height,
+                                 fps=self.fps, fourcc="BGR3")
+
+    def _grab(self) -> Frame:
+        if self.frames_total is not None and self._index >= self.frames_total:
+            self.finished.set()
+            return False, None
+
+        frame = np.roll(self._background, self._index * 2, axis=1)
+        if self.sprite is not None:
+            frame = frame.copy()
+            h, w = self.sprite.shape[:2]
+            span_x, span_y = max(1, self.width - w), max(1, self.height - h)
+            x = abs((self._index * 4) % (2 * span_x) - span_x)
+            y = abs((self._index * 2) % (2 * span_y) - span_y)
+            frame[y:y + h, x:x + w] = self.sprite[:self.height - y, :self.width - x]
+
+        self._index += 1
+        return True, frame
+
+    def _release(self) -> None:
+        self._background = None
+
+
+class FrameRecorder:
+    """Writes frames to a video file or, for any other path, to numbered PNGs plus ``timestamps.txt``.
+
+    Encoding runs on its own thread so recording does not slow the capture loop; frames are
+    dropped (and counted) when the writer falls behind.
+    """
+
+    def __init__(self, path: Path, fps: float = 30, queue_size: int = 64):
+        self.path = Path(path)
+        self.fps = fps
+        self.written = 0
+        self.dropped = 0
+
+        self._is_video = self.path.suffix.lower() in VIDEO_EXTENSIONS
+        self._writer: Optional[cv2.VideoWriter] = None
+        self._timestamps: List[float] = []
+        self._started = time.perf_counter()
+        self._queue: "queue.Queue[Optional[Tuple[float, np.ndarray]]]" = queue.Queue(maxsize=queue_size)
+
+        if not self._is_video:
+            self.path.mkdir(parents=True, exist_ok=True)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._thread = threading.Thread(target=self._run, name="FrameRecorder", daemon=True)
+        self._thread.start()
+        logger.info(f"Recording frames to {self.path}")
+
+    def write(self, frame: np.ndarray) -> None:
+        try:
+            self._queue.put_nowait((time.perf_counter() - self._started, frame))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._writer is not None:
+            self._writer.release()
+        if not self._is_video:
+            (self.path / TIMESTAMPS_FILE).write_text("\n".join(f"{t:.6f}" for t in self._timestamps))
+        logger.info(f"Recorded {self.written} frames to {self.path} ({self.dropped} dropped)")
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            timestamp, frame = item
+            try:
+                if self._is_video:
+                    self._write_video(frame)
+                else:
+                    cv2.imwrite(str(self.path / f"frame_{self.written:06d}.png"), frame)
+                    self._timestamps.append(timestamp)
+                self.written += 1
+            except Exception as e:
+                logger.exception(f"Error recording frame: {e}")
+
+    def _write_video(self, frame: np.ndarray) -> None:
+        if self._writer is None:
+            fourcc = "mp4v" if self.path.suffix.lower() in {".mp4", ".mov"} else "MJPG"
+            self._writer = cv2.VideoWriter(
+                str(self.path), cv2.VideoWriter_fourcc(*fourcc), self.fps, (frame.shape[1], frame.shape[0])
+            )
+        self._writer.write(frame)
@@ -1,10 +1,13 @@
-import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from core.logger import AppLogger
 from models.person.person_metadata import PersonMetadata, ImageValidator
 from models.person.person_registry import PersonRegistry
+from models.person.photo_ingestor import PhotoIngestor
+from models.person.photo_manifest import PhotoManifest
+from models.person.photo_store import PhotoStore, StoreMethod, StoreResult
 
 logger = AppLogger().get_logger(__name__)
 
@@ -12,9 +15,15 @@ logger = AppLogger().get_logger(__name__)
 class PersonService:
     def __init__(self, registry: Optional[PersonRegistry] = None):
         self.registry = registry or PersonRegistry()
+        self.ingestor = PhotoIngestor()
+        self.photo_store = PhotoStore()
+        # one worker, so manifest writes of a person never overlap
+        self.ingest_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PhotoIngest")
 
     def create_person(
-            self, person: PersonMetadata, photo_paths: List[str], **kwargs
+            self, person: PersonMetadata, photo_paths: List[str],
+            on_stored: Optional[Callable[[StoreResult], None]] = None,
+            on_ingested: Optional[Callable[[int, int], None]] = None, **kwargs
     ) -> Optional[PersonMetadata]:
         try:
             photo_paths: List[Path] = ImageValidator.validate_images(photo_paths)
@@ -24,12 +33,7 @@ class PersonService:
             if self.registry.add(person):
                 logger.info(f"Created person: {person.name}")
 
-                for i, photo_path in enumerate(photo_paths, start=1):
-                    photo_path = Path(photo_path)
-                    dst = person.photos_path / f"{i}{photo_path.suffix}"
-                    shutil.copy2(str(photo_path), str(dst))
-                    logger.info(f"Copied photo to: {dst}")
-
+                self._store_photos(person, photo_paths, on_stored, on_ingested)
                 person.save()
                 return person
             else:
@@ -103,7 +107,9 @@ class PersonService:
             logger.exception(f"Error deleting person {name}: {e}")
             return False
 
-    def add_photos_to_person(self, name: str, photo_paths: List[str]) -> List[str]:
+    def add_photos_to_person(self, name: str, photo_paths: List[str],
+                             on_stored: Optional[Callable[[StoreResult], None]] = None,
+                             on_ingested: Optional[Callable[[int, int], None]] = None) -> List[Future]:
         try:
             person = self.registry.get(name)
             if not person:
@@ -115,34 +121,11 @@ class PersonService:
                 logger.warning(f"No valid photos to add for {name}")
                 return []
 
-            person.photos_path.mkdir(parents=True, exist_ok=True)
-
-            existing_photos = list(person.photos_path.glob("*"))
-            photo_count = len(existing_photos)
-
-            added_photos = []
-            for photo_path in valid_photos:
-                try:
-                    src = Path(photo_path)
-                    if not src.exists():
-                        logger.warning(f"Source photo not found: {photo_path}")
-                        continue
-
-                    photo_count += 1
-                    dst = person.photos_path / f"{photo_count}{src.suffix}"
-
-                    shutil.copy2(str(src), str(dst))
-                    added_photos.append(str(dst))
-                    logger.info(f"Added photo to {name}: {dst}")
-
-                except Exception as e:
-                    logger.exception(f"Error copying photo {photo_path}: {e}")
-                    continue
-
+            futures = self._store_photos(person, valid_photos, on_stored, on_ingested)
             person.save()
 
-            logger.info(f"Added {len(added_photos)} photos to {name}")
-            return added_photos
+            logger.info(f"Adding {len(futures)} photos to {name}")
+            return futures
 
         except Exception as e:
             logger.exception(f"Error adding photos to {name}: {e}")
@@ -163,6 +146,11 @@ class PersonService:
             photo_p.unlink()
             logger.info(f"Deleted photo from disk: {photo_path}")
 
+            manifest = PhotoManifest.load(person.manifest_path)
+            self.ingestor.remove(person, photo_p, manifest)
+            if manifest.dirty:
+                manifest.save(person.manifest_path)
+
             person.save()
 
             return True
@@ -171,6 +159,98 @@ class PersonService:
             logger.exception(f"Error removing photo from {name}: {e}")
             return False
 
+    def _store_photos(self, person: PersonMetadata, photo_paths: List[Path],
+                      on_stored: Optional[Callable[[StoreResult], None]] = None,
+                      on_ingested: Optional[Callable[[int, int], None]] = None) -> List[Future]:
+        """Start storing the photos and ingest them in the background, one future per photo.
+
+        ``on_stored(result)`` is called from the store workers as each photo is stored,
+        ``on_ingested(stored, ingested)`` from the ingest thread once all stored photos are
+        processed; photos it could not ingest are retried by ``ingestor.scan``.
+        """
+        futures = self.photo_store.store(person, photo_paths)
+        if on_stored is not None:
+            for future in futures:
+                future.add_done_callback(lambda f: on_stored(f.result()))
+
+        self.ingest_executor.submit(self._ingest_stored, person, futures, on_ingested)
+        return futures
+
+    def _ingest_stored(self, person: PersonMetadata, futures: List[Future],
+                       on_ingested: Optional[Callable[[int, int], None]]) -> None:
+        stored, ingested = [], 0
+        try:
+            results = [future.result() for future in futures]
+            stored = [r for r in results if r.stored]
+            duplicates = sum(1 for r in results if r.method == StoreMethod.DUPLICATE)
+            logger.info(
+                f"Stored {len(stored)}/{len(results)} photos for {person.name}"
+                f" ({duplicates} duplicates skipped)"
+            )
+
+            if stored:
+                manifest = PhotoManifest.load(person.manifest_path)
+                ingested = sum(
+                    1 for r in stored
+                    if self.ingestor.ingest(person, r.destination, manifest, sha1=r.sha1) is not None
+                )
+                manifest.save(person.manifest_path)
+                logger.info(f"Ingested {ingested}/{len(stored)} photos for {person.name}")
+        except Exception as e:
+            logger.exception(f"Error ingesting photos of {person.name}: {e}")
+        finally:
+            if on_ingested is not None:
+                on_ingested(len(stored), ingested)
+
+    def get_face_locations(self, photo_path: str) -> List[Tuple[int, int, int, int]]:
+        """Face boxes of a photo, read from its person's manifest when it is a stored photo.
+
+        Stored photos are detected once and the result is kept in the manifest; any other
+        file is detected directly.
+        """
+        photo_path = Path(photo_path)
+        person = self._owner_of(photo_path)
+
+        if person is None:
+            from algorithms.face_detectors import get_detector
+            from utils.image_loader import load_image
+            image, _ = load_image(photo_path, self.ingestor.max_dimension)
+            return get_detector().detect(image)
+
+        manifest = PhotoManifest.load(person.manifest_path)
+        record = self.ingestor.scan(person, photo_path, manifest)
+        if manifest.dirty:
+            manifest.save(person.manifest_path)
+        if record is None:
+            return []
+        return record.face_locations(self.ingestor.default_detector().name) or []
+
+    def get_photos_without_faces(self) -> Dict[str, List[Path]]:
+        """Stored photos where the default detector finds no face, per person name."""
+        detector_name = self.ingestor.default_detector().name
+        report = {}
+
+        for person in self.get_persons_with_photos(min_photos=1):
+            manifest = PhotoManifest.load(person.manifest_path)
+            faceless = []
+            for photo_path in person.photo_paths:
+                record = self.ingestor.scan(person, photo_path, manifest)
+                if record is not None and not record.face_locations(detector_name):
+                    faceless.append(photo_path)
+
+            if manifest.dirty:
+                manifest.save(person.manifest_path)
+            if faceless:
+                report[person.name] = faceless
+
+        return report
+
+    def _owner_of(self, photo_path: Path) -> Optional[PersonMetadata]:
+        person = self.registry.get(photo_path.parent.parent.name)
+        if person is not None and photo_path.parent.resolve() == person.photos_path.resolve():
+            return person
+        return None
+
     def refresh(self) -> None:
         try:
             self.registry.refresh()
@@ -0,0 +1,283 @@
+import multiprocessing
+import queue
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from algorithms.base import ClassifierBase, WebcamState
+from core import config
+from core.config import CaptureProfile
+from core.logger import AppLogger
+from models.model.model_metadata import ModelMetadata
+from services.frame_sources import NegotiatedCapture
+from services.recognition_pool import StreamResult, StreamStats
+from services.shared_frames import SharedFrameRing
+
+logger = AppLogger().get_logger(__name__)
+
+READY_TIMEOUT = 10.0
+IDLE_WAIT = 0.002
+
+
+def _capture_main(port: int, profile: CaptureProfile, slots: int, ready, stop) -> None:
+    """Capture process: camera frames into a ``SharedFrameRing`` until ``stop`` is set."""
+    from services.camera_service import CameraService
+
+    camera = CameraService(port=port)
+    ring: Optional[SharedFrameRing] = None
+    try:
+        negotiated = camera.start(port, profile)
+        while not stop.is_set():
+            ret, frame = camera.read(timeout=0.5)
+            if not ret or frame is None:
+                continue
+
+            if ring is None:
+                # the ring is sized by the first real frame, not by what the driver reported
+                ring = SharedFrameRing.create(slots, frame.shape)
+                ready.put(("ready", ring.name, frame.shape, negotiated.dict()))
+            if frame.shape == ring.shape:
+                ring.write(frame)
+    except Exception as e:
+        logger.exception(f"Capture process for camera {port} failed: {e}")
+        ready.put(("error", str(e)))
+    finally:
+        camera.stop()
+        if ring is not None:
+            ring.close()
+
+
+def _inference_main(model: ModelMetadata, streams: List[Tuple[Hashable, str, int, tuple]], claims,
+                    results, stop) -> None:
+    """Inference process: newest unclaimed frame of each stream in turn, predictions to ``results``."""
+    from algorithms import AlgorithmFactory
+
+    algorithm = AlgorithmFactory.create(model)
+    if not algorithm.load_model():
+        results.put(("error", f"Failed to load model file: {model.clf_path}"))
+        return
+
+    rings = [
+        (stream_id, SharedFrameRing.attach(name, slots, shape), claims[stream_id])
+        for stream_id, name, slots, shape in streams
+    ]
+    # each worker sees every stream, frames it skips just age its tracks a little
+    states = {stream_id: WebcamState() for stream_id, *_ in streams}
+    try:
+        turn = 0
+        while not stop.is_set():
+            worked = False
+            for i in range(len(rings)):
+                stream_id, ring, claim = rings[(turn + i) % len(rings)]
+                seq = ring.sequence
+                with claim.get_lock():
+                    if seq <= claim.value:
+                        continue
+                    claim.value = seq
+
+                # the colour conversion is the only copy, made straight from shared memory
+                found = ring.copy(seq, rgb=True)
+                if found is None:
+                    continue
+                rgb, captured_at = found
+
+                predictions = algorithm.recognize_stream(rgb, states[stream_id])
+                results.put((
+                    stream_id, seq,
+                    [(name, tuple(int(v) for v in location)) for name, location in predictions],
+                    captured_at, time.monotonic(),
+                ))
+                worked = True
+
+            turn += 1
+            if not worked:
+                time.sleep(IDLE_WAIT)
+    except Exception as e:
+        logger.exception(f"Inference process failed: {e}")
+    finally:
+        for _, ring, _ in rings:
+            ring.close()
+
+
+@contextmanager
+def _without_main_script():
+    """Keep spawned children from re-running the Kivy entry script.
+
+    ``spawn`` re-imports ``__main__`` from its file in every child; without a file the child
+    only imports the modules its target needs.
+    """
+    main = sys.modules.get("__main__")
+    main_file = getattr(main, "__file__", None)
+    if main_file is not None and getattr(main, "__spec__", None) is None:
+        del main.__file__
+    try:
+        yield
+    finally:
+        if main_file is not None and not hasattr(main, "__file__"):
+            main.__file__ = main_file
+
+
+class ProcessStream:
+    def __init__(self, stream_id: Hashable, process, ring: SharedFrameRing, negotiated: NegotiatedCapture):
+        self.stream_id = stream_id
+        self.process = process
+        self.ring = ring
+        self.negotiated = negotiated
+        self.claim = None
+        self.state = WebcamState()
+        self.stats = StreamStats()
+        self.last_seq = 0
+        self.stale = 0
+        self.captured = 0
+
+
+class ProcessRecognitionPool:
+    """Capture, recognition and UI in separate processes, frames shared through ``SharedFrameRing``.
+
+    Every camera gets a capture process writing into its own ring; ``workers`` inference
+    processes claim the newest unprocessed frame of each ring in turn and send back only
+    names and boxes. The UI process draws those onto the frame read from the same ring, so
+    frames are never pickled. Offers the ``take_results``/``stats`` side of ``RecognitionPool``.
+    """
+
+    def __init__(self, model: ModelMetadata, workers: Optional[int] = None, slots: Optional[int] = None):
+        self.model = model
+        self.workers = workers or config.camera.INFERENCE_PROCESSES
+        self.slots = slots or config.camera.FRAME_RING_SLOTS
+
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._results = self._context.Queue()
+        self._streams: Dict[Hashable, ProcessStream] = {}
+        self._workers: List = []
+        self._streams_closed = False
+
+    @property
+    def stream_ids(self) -> List[Hashable]:
+        return list(self._streams)
+
+    def add_camera(self, stream_id: Hashable, port: int, profile: CaptureProfile) -> NegotiatedCapture:
+        ready = self._context.Queue()
+        process = self._context.Process(
+            target=_capture_main, args=(port, profile, self.slots, ready, self._stop),
+            name=f"Capture-{port}", daemon=True,
+        )
+        with _without_main_script():
+            process.start()
+
+        try:
+            message = ready.get(timeout=READY_TIMEOUT)
+        except queue.Empty:
+            message = ("error", f"camera {port} sent no frame within {READY_TIMEOUT:.0f} s")
+        if message[0] != "ready":
+            process.terminate()
+            raise RuntimeError(f"Unable to capture from camera {port}: {message[1]}")
+
+        _, name, shape, negotiated = message
+        stream = ProcessStream(stream_id, process, SharedFrameRing.attach(name, self.slots, shape),
+                               NegotiatedCapture(**negotiated))
+        stream.claim = self._context.Value("q", 0)
+        self._streams[stream_id] = stream
+        return stream.negotiated
+
+    def start(self) -> None:
+        streams = [(s.stream_id, s.ring.name, self.slots, s.ring.shape) for s in self._streams.values()]
+        claims = {s.stream_id: s.claim for s in self._streams.values()}
+        for i in range(self.workers):
+            process = self._context.Process(
+                target=_inference_main, args=(self.model, streams, claims, self._results, self._stop),
+                name=f"Inference-{i}", daemon=True,
+            )
+            with _without_main_script():
+                process.start()
+            self._workers.append(process)
+        logger.info(f"Process pool started: {len(self._streams)} capture, {self.workers} inference processes")
+
+    def stop(self) -> None:
+        self._stop.set()
+        for process in self._workers + [s.process for s in self._streams.values()]:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self._workers = []
+
+        for stream in self._streams.values():
+            stream.captured = stream.ring.sequence
+            stream.ring.close()
+        self._streams_closed = True
+        logger.info("Process pool stopped")
+
+    @property
+    def poll_interval(self) -> float:
+        return config.camera.MIN_POLL_INTERVAL
+
+    def take_results(self) -> Dict[Hashable, StreamResult]:
+        results: Dict[Hashable, StreamResult] = {}
+        while True:
+            try:
+                message = self._results.get_nowait()
+            except queue.Empty:
+                return results
+
+            if message[0] == "error":
+                logger.error(f"Inference process: {message[1]}")
+                continue
+
+            stream_id, seq, predictions, captured_at, done = message
+            stream = self._streams.get(stream_id)
+            # workers finish out of order, an older frame never replaces a newer one
+            if stream is None or seq <= stream.last_seq:
+                continue
+
+            frame = self._frame_for(stream, seq)
+            if frame is None:
+                continue
+            if predictions:
+                frame = ClassifierBase.draw_predictions(frame, predictions)
+
+            if predictions:
+                counter, name = stream.state.update(predictions, ClassifierBase.UNKNOWN_LABEL)
+            else:
+                stream.state.counter_frame = 0
+                counter, name = 0, ""
+
+            latency_ms = (done - captured_at) * 1000.0
+            stream.stats.update(done, latency_ms)
+            stream.last_seq = seq
+            results[stream_id] = StreamResult(frame, name, counter, latency_ms)
+
+    @staticmethod
+    def _frame_for(stream: ProcessStream, seq: int) -> Optional[np.ndarray]:
+        """RGB copy of frame ``seq``, or of the newest frame once the capture process lapped it.
+
+        Slow recognition easily outlasts the ring, the boxes are then drawn a few frames late
+        rather than the result being lost.
+        """
+        found = stream.ring.copy(seq, rgb=True)
+        if found is None:
+            for _ in range(3):
+                found = stream.ring.copy(stream.ring.sequence, rgb=True)
+                if found is not None:
+                    stream.stale += 1
+                    break
+        return found[0] if found is not None else None
+
+    def stats(self) -> Dict[Hashable, dict]:
+        if not self._streams_closed:
+            for stream in self._streams.values():
+                stream.captured = stream.ring.sequence
+        return {
+            stream.stream_id: {
+                "frames": stream.stats.frames,
+                "fps": stream.stats.fps,
+                "latency_ms": stream.stats.latency_ms,
+                # captured frames no worker got to before a newer one arrived
+                "dropped": max(0, stream.captured - stream.stats.frames),
+                # results drawn onto a newer frame because theirs was overwritten
+                "stale": stream.stale,
+            }
+            for stream in self._streams.values()
+        }
@@ -0,0 +1,215 @@
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional
+
+import numpy as np
+
+from algorithms.base import WebcamState
+from core import config
+from core.logger import AppLogger
+from services.frame_rate_controller import FrameRateController
+from services.frame_sources import FrameSource
+from utils.metrics import metrics
+
+logger = AppLogger().get_logger(__name__)
+
+
+class StreamResult(NamedTuple):
+    frame: np.ndarray
+    name: str
+    counter: int
+    latency_ms: float
+    idle: bool = False
+
+
+class StreamStats:
+    """Smoothed throughput and latency of one stream."""
+
+    SMOOTHING = 0.1
+
+    def __init__(self):
+        self.frames = 0
+        self.fps = 0.0
+        self.latency_ms = 0.0
+        self._last_done: Optional[float] = None
+
+    def update(self, done: float, latency_ms: float) -> None:
+        if self._last_done is not None and done > self._last_done:
+            fps = 1.0 / (done - self._last_done)
+            self.fps = fps if self.frames <= 1 else self.fps + self.SMOOTHING * (fps - self.fps)
+        self.latency_ms = latency_ms if self.frames == 0 else \
+            self.latency_ms + self.SMOOTHING * (latency_ms - self.latency_ms)
+        self._last_done = done
+        self.frames += 1
+
+
+class Stream:
+    def __init__(self, stream_id: Hashable, source: FrameSource):
+        self.stream_id = stream_id
+        self.source = source
+        self.state = WebcamState()
+        self.stats = StreamStats()
+        self.in_flight = False
+        self.seen = 0
+        self.skipped = 0
+
+
+class RecognitionPool:
+    """One loaded classifier serving several frame sources.
+
+    A scheduler thread visits the streams round-robin, starting one stream later on every
+    pass, and hands the newest frame of a stream to the worker pool whenever a worker is
+    free. A stream never has more than one frame in flight, so a fast camera cannot take
+    every worker while another waits, and a slow pipeline skips to the newest frame instead
+    of queueing old ones. Each stream keeps its own confirmation state and stats.
+
+    A stream without a face for ``IDLE_AFTER_SECONDS`` is throttled to ``IDLE_FPS``; the
+    first frame showing a face again lifts the cap and calls ``on_wake``. A
+    ``FrameRateController`` sets the detection scale of all streams and how many of their
+    frames are skipped.
+    """
+
+    IDLE_WAIT = 0.002
+
+    def __init__(self, algorithm, workers: Optional[int] = None, on_wake: Optional[Callable[[], None]] = None):
+        self.algorithm = algorithm
+        self.workers = workers or config.camera.INFERENCE_WORKERS
+        self.on_wake = on_wake
+        self.controller = FrameRateController(self.workers)
+
+        self._streams: Dict[Hashable, Stream] = {}
+        self._results: Dict[Hashable, StreamResult] = {}
+        self._lock = threading.Lock()
+        self._free = threading.Semaphore(self.workers)
+        self._running = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
+        self._turn = itertools.count()
+
+    @property
+    def stream_ids(self) -> List[Hashable]:
+        return list(self._streams)
+
+    def add_stream(self, stream_id: Hashable, source: FrameSource) -> None:
+        with self._lock:
+            self._streams[stream_id] = Stream(stream_id, source)
+            self.controller.set_streams(len(self._streams))
+
+    def remove_stream(self, stream_id: Hashable) -> Optional[FrameSource]:
+        with self._lock:
+            stream = self._streams.pop(stream_id, None)
+            self._results.pop(stream_id, None)
+            self.controller.set_streams(len(self._streams))
+        return stream.source if stream else None
+
+    def start(self) -> None:
+        if self._running.is_set():
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="recognition")
+        self._running.set()
+        self._scheduler = threading.Thread(target=self._schedule, name="RecognitionScheduler", daemon=True)
+        self._scheduler.start()
+        logger.info(f"Recognition pool started: {len(self._streams)} streams, {self.workers} workers")
+
+    def stop(self) -> None:
+        self._running.clear()
+        if self._scheduler and self._scheduler.is_alive():
+            self._scheduler.join(timeout=1.0)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        logger.info("Recognition pool stopped")
+
+    @property
+    def poll_interval(self) -> float:
+        return self.controller.poll_interval
+
+    def take_results(self) -> Dict[Hashable, StreamResult]:
+        """Results completed since the previous call, newest per stream."""
+        with self._lock:
+            results, self._results = self._results, {}
+        return results
+
+    def stats(self) -> Dict[Hashable, dict]:
+        with self._lock:
+            streams = list(self._streams.values())
+        return {
+            stream.stream_id: {
+                "frames": stream.stats.frames,
+                "fps": stream.stats.fps,
+                "latency_ms": stream.stats.latency_ms,
+                "dropped": stream.source.dropped,
+                "skipped": stream.skipped,
+            }
+            for stream in streams
+        }
+
+    def _schedule(self) -> None:
+        while self._running.is_set():
+            with self._lock:
+                streams = list(self._streams.values())
+
+            if self.controller.adapt():
+                for stream in streams:
+                    stream.state.detection_scale = self.controller.detection_scale
+
+            submitted = False
+            if streams:
+                first = next(self._turn) % len(streams)
+                for stream in streams[first:] + streams[:first]:
+                    if stream.in_flight:
+                        continue
+                    if not self._free.acquire(blocking=False):
+                        break
+
+                    ret, frame = stream.source.read_now()
+                    if not ret or frame is None:
+                        self._free.release()
+                        continue
+
+                    stream.seen += 1
+                    if stream.seen % self.controller.skip:
+                        stream.skipped += 1
+                        metrics.count("pool.skipped")
+                        self._free.release()
+                        continue
+
+                    stream.in_flight = True
+                    self._executor.submit(self._process, stream, frame, time.perf_counter())
+                    submitted = True
+
+            if not submitted:
+                time.sleep(self.IDLE_WAIT)
+
+    def _update_idle(self, stream: Stream) -> bool:
+        idle = stream.state.idle
+        if idle and not stream.source.throttled:
+            stream.source.throttle(config.camera.IDLE_FPS)
+            logger.info(f"Stream {stream.stream_id} idle, throttled to {config.camera.IDLE_FPS} fps")
+        elif not idle and stream.source.throttled:
+            stream.source.throttle(None)
+            logger.info(f"Stream {stream.stream_id} active again")
+            if self.on_wake:
+                self.on_wake()
+        return idle
+
+    def _process(self, stream: Stream, frame: np.ndarray, started: float) -> None:
+        try:
+            annotated, counter, name = self.algorithm.predict_webcam(frame[:, :, ::-1], stream.state)
+            done = time.perf_counter()
+            latency_ms = (done - started) * 1000.0
+
+            stream.stats.update(done, latency_ms)
+            self.controller.observe(latency_ms)
+            metrics.observe("pool.frame", latency_ms)
+            idle = self._update_idle(stream)
+            with self._lock:
+                if stream.stream_id in self._streams:
+                    self._results[stream.stream_id] = StreamResult(annotated, name, counter, latency_ms, idle)
+        except Exception as e:
+            logger.exception(f"Error recognizing frame of stream {stream.stream_id}: {e}")
+        finally:
+            stream.in_flight = False
+            self._free.release()
@@ -0,0 +1,117 @@
+import time
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.logger import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+EMPTY = -1
+WRITING = -2
+
+
+class SharedFrameRing:
+    """Fixed-size ring of frames in one ``SharedMemory`` block, one writer and any number of readers.
+
+    Layout: ``int64`` write sequence, ``int64`` sequence per slot, ``float64`` capture time
+    per slot (``time.monotonic``, comparable across processes), then ``slots`` frames.
+    The writer marks a slot as being written, copies the frame, then publishes the slot's
+    sequence and finally the ring's. Readers get zero-copy views and call ``is_current``
+    after using one to detect that the writer has lapped the slot meanwhile.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, slots: int, shape: Tuple[int, ...], owner: bool):
+        self.shm = shm
+        self.slots = slots
+        self.shape = tuple(shape)
+        self.owner = owner
+
+        header_bytes = 8 * (1 + slots)
+        self._write_seq = np.ndarray((1,), dtype=np.int64, buffer=shm.buf, offset=0)
+        self._slot_seq = np.ndarray((slots,), dtype=np.int64, buffer=shm.buf, offset=8)
+        self._slot_time = np.ndarray((slots,), dtype=np.float64, buffer=shm.buf, offset=header_bytes)
+        self._frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=shm.buf,
+                                  offset=header_bytes + 8 * slots)
+
+    @staticmethod
+    def nbytes(slots: int, shape: Tuple[int, ...]) -> int:
+        return 8 * (1 + slots) + 8 * slots + slots * int(np.prod(shape))
+
+    @classmethod
+    def create(cls, slots: int, shape: Tuple[int, ...], name: Optional[str] = None) -> "SharedFrameRing":
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls.nbytes(slots, shape))
+        ring = cls(shm, slots, shape, owner=True)
+        ring._write_seq[0] = 0
+        ring._slot_seq[:] = EMPTY
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, slots: int, shape: Tuple[int, ...]) -> "SharedFrameRing":
+        # processes started by one parent share its resource tracker, so attaching adds nothing
+        # to unregister and the owner's unlink is the only cleanup
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, slots, shape, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Sequence of the newest complete frame, 0 before the first."""
+        return int(self._write_seq[0])
+
+    def write(self, frame: np.ndarray, captured_at: Optional[float] = None) -> int:
+        seq = self.sequence + 1
+        slot = seq % self.slots
+        self._slot_seq[slot] = WRITING
+        self._frames[slot] = frame
+        self._slot_time[slot] = captured_at if captured_at is not None else time.monotonic()
+        self._slot_seq[slot] = seq
+        self._write_seq[0] = seq
+        return seq
+
+    def view(self, seq: int) -> Optional[Tuple[np.ndarray, float]]:
+        """Zero-copy frame ``seq`` and its capture time, ``None`` when it has been overwritten."""
+        if seq <= 0:
+            return None
+        slot = seq % self.slots
+        if self._slot_seq[slot] != seq:
+            return None
+        return self._frames[slot], float(self._slot_time[slot])
+
+    def copy(self, seq: int, rgb: bool = False) -> Optional[Tuple[np.ndarray, float]]:
+        """Private copy of frame ``seq``, ``None`` when it was overwritten before or during the copy.
+
+        ``rgb`` swaps the channels while copying.
+        """
+        found = self.view(seq)
+        if found is None:
+            return None
+        frame, captured_at = found
+        frame = np.ascontiguousarray(frame[:, :, ::-1]) if rgb else frame.copy()
+        if not self.is_current(seq):
+            return None
+        return frame, captured_at
+
+    def latest(self) -> Tuple[int, Optional[np.ndarray], float]:
+        seq = self.sequence
+        found = self.view(seq)
+        if found is None:
+            return seq, None, 0.0
+        return seq, found[0], found[1]
+
+    def is_current(self, seq: int) -> bool:
+        return self._slot_seq[seq % self.slots] == seq
+
+    def close(self) -> None:
+        # views into the buffer have to go before the block can be closed
+        self._write_seq = self._slot_seq = self._slot_time = self._frames = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
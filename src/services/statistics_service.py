@@ -0,0 +1,166 @@
+import csv
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from core import config
+from core.logger import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+# one row per time bucket: its key and the three counters shown in the plot
+BUCKET_DTYPE = np.dtype([("key", "<i8"), ("ok", "<i4"), ("nok", "<i4"), ("no_id", "<i4")])
+COUNTERS = ("ok", "nok", "no_id")
+
+
+class CounterRing:
+    """Fixed-size ring of counter buckets in a memory-mapped file.
+
+    Bucket ``key`` lives in slot ``key % capacity``; a slot holding an older key is reset
+    before it is reused, which is also how retention works. Recording touches one slot.
+    """
+
+    def __init__(self, path: Path, capacity: int):
+        self.path = path
+        self.capacity = capacity
+
+        expected_size = capacity * BUCKET_DTYPE.itemsize
+        if not path.exists() or path.stat().st_size != expected_size:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            empty = np.zeros(capacity, dtype=BUCKET_DTYPE)
+            empty["key"] = -1
+            empty.tofile(path)
+
+        self.buckets = np.memmap(path, dtype=BUCKET_DTYPE, mode="r+", shape=(capacity,))
+
+    def add(self, key: int, counter: str, value: int = 1) -> None:
+        slot = key % self.capacity
+        if self.buckets["key"][slot] != key:
+            self.buckets[slot] = (key, 0, 0, 0)
+        self.buckets[counter][slot] += value
+
+    def series(self, keys: List[int]) -> np.ndarray:
+        """``(len(keys), 3)`` counters for ``keys``, zero for buckets that were never or no longer kept."""
+        keys = np.asarray(keys, dtype=np.int64)
+        rows = self.buckets[keys % self.capacity]
+        valid = rows["key"] == keys
+        out = np.zeros((len(keys), len(COUNTERS)), dtype=np.int64)
+        for column, counter in enumerate(COUNTERS):
+            out[valid, column] = rows[counter][valid]
+        return out
+
+    def clear(self) -> None:
+        self.buckets["key"] = -1
+        for counter in COUNTERS:
+            self.buckets[counter] = 0
+
+    def flush(self) -> None:
+        self.buckets.flush()
+
+
+def hour_key(moment: datetime) -> int:
+    return moment.toordinal() * 24 + moment.hour
+
+
+def day_key(moment: date) -> int:
+    return moment.toordinal()
+
+
+def month_key(moment: date) -> int:
+    return moment.year * 12 + moment.month - 1
+
+
+class StatisticsService:
+    """Identification counters pre-aggregated per hour, with day and month rollups."""
+
+    def __init__(self, stats_dir: Optional[Path] = None):
+        stats_dir = stats_dir or config.paths.STATS_DIR
+        is_new = not (stats_dir / "hourly.bin").exists()
+
+        self._lock = threading.Lock()
+        self.hourly = CounterRing(stats_dir / "hourly.bin", config.stats.RETENTION_HOURS)
+        self.daily = CounterRing(stats_dir / "daily.bin", config.stats.RETENTION_DAYS)
+        self.monthly = CounterRing(stats_dir / "monthly.bin", config.stats.RETENTION_MONTHS)
+
+        if is_new:
+            self._import_legacy_csv(config.stats.FILE_STATS_CSV)
+
+    def record_identification(self, success: bool) -> None:
+        self._record("ok" if success else "nok")
+
+    def record_attempt(self) -> None:
+        self._record("no_id")
+
+    def _record(self, counter: str, moment: Optional[datetime] = None, value: int = 1) -> None:
+        moment = moment or datetime.now()
+        with self._lock:
+            self.hourly.add(hour_key(moment), counter, value)
+            self.daily.add(day_key(moment), counter, value)
+            self.monthly.add(month_key(moment), counter, value)
+
+    def last_hours(self, hours: int = 12, now: Optional[datetime] = None) -> Tuple[List[int], np.ndarray]:
+        """Hours of day and ``(hours, 3)`` ok/nok/no-id counts, oldest first, ending with the current hour."""
+        now = now or datetime.now()
+        moments = [now - timedelta(hours=hours - 1 - i) for i in range(hours)]
+        with self._lock:
+            counts = self.hourly.series([hour_key(m) for m in moments])
+        return [m.hour for m in moments], counts
+
+    def last_days(self, days: int = 30, today: Optional[date] = None) -> Tuple[List[date], np.ndarray]:
+        today = today or date.today()
+        moments = [today - timedelta(days=days - 1 - i) for i in range(days)]
+        with self._lock:
+            counts = self.daily.series([day_key(m) for m in moments])
+        return moments, counts
+
+    def last_months(self, months: int = 12, today: Optional[date] = None) -> Tuple[List[int], np.ndarray]:
+        """Month keys (``year * 12 + month - 1``) and their counts."""
+        current = month_key(today or date.today())
+        keys = list(range(current - months + 1, current + 1))
+        with self._lock:
+            counts = self.monthly.series(keys)
+        return keys, counts
+
+    def clear(self) -> None:
+        with self._lock:
+            for ring in (self.hourly, self.daily, self.monthly):
+                ring.clear()
+                ring.flush()
+        logger.info("Statistics cleared")
+
+    def flush(self) -> None:
+        with self._lock:
+            for ring in (self.hourly, self.daily, self.monthly):
+                ring.flush()
+
+    def _import_legacy_csv(self, csv_path: Path) -> None:
+        """One-time import of ``hour,day,month,no_id,ok,nok`` rows; the CSV has no year."""
+        if not csv_path.exists():
+            return
+
+        now = datetime.now()
+        imported = 0
+        try:
+            with open(csv_path, "r") as f:
+                for row in csv.reader(f, delimiter=","):
+                    try:
+                        hour, day, month, no_id, ok, nok = map(int, row[:6])
+                        moment = datetime(now.year, month, day, hour)
+                        if moment > now:
+                            moment = moment.replace(year=now.year - 1)
+                    except (ValueError, IndexError):
+                        continue
+
+                    for counter, value in (("ok", ok), ("nok", nok), ("no_id", no_id)):
+                        if value:
+                            self._record(counter, moment, value)
+                    imported += 1
+
+            self.flush()
+            if imported:
+                logger.info(f"Imported {imported} rows from {csv_path}")
+        except Exception as e:
+            logger.exception(f"Error importing legacy statistics from {csv_path}: {e}")
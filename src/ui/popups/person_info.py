@@ -5,6 +5,7 @@ from kivy.uix.popup import Popup
 
 from core import config
 from models.person.person_metadata import PersonMetadata
+from ui.preview_loader import adjacent, preview_loader
 
 
 class PersonInfoPopup(Popup):
@@ -30,8 +31,11 @@ class PersonInfoPopup(Popup):
     @mainthread
     def show_preview_photo(self, photo_index=0):
         if len(self.current_person.photo_paths) > 0:
-            image = self.current_person.photo_paths[photo_index]
-            self.ids.preview_photo.source = str(image)
+            photos = self.current_person.photo_paths
+            image = photos[photo_index]
+            neighbours = adjacent(photos, photo_index)
+            preview_loader.show(self.ids.preview_photo, image, neighbours,
+                                resolve=self.current_person.preview_path)
             photo_name = os.path.basename(image)
             self.ids.preview_photo_name.text = photo_name + ' (' + str(photo_index + 1) + '/' + str(
                 len(self.current_person.photo_paths)) + ')'
@@ -58,7 +62,8 @@ class PersonInfoPopup(Popup):
         if self.current_person is not None and len(self.current_person.photo_paths):
             from ui.popups.plot import PlotPopup
             try:
-                PlotPopup(self.ids.preview_photo.source).open()
+                photo = self.current_person.photo_paths[self.preview_photo_index]
+                PlotPopup(str(self.current_person.preview_path(photo))).open()
             except Exception:
                 PlotPopup(self.current_person.photo_paths[self.preview_photo_index]).open()
 
@@ -1,7 +1,10 @@
 import logging
 
+from kivy.clock import mainthread
+
 from core import AppLogger, Gender
 from models.person.person_metadata import PersonMetadata
+from models.person.photo_store import StoreResult
 from services import person_service
 from ui.presenters.base_presenter import BasePresenter
 
@@ -64,7 +67,11 @@ class AddPersonPresenter(BasePresenter):
             return
 
         try:
-            created = person_service.create_person(new, photo_paths=self.view.form_presenter.photos)
+            created = person_service.create_person(
+                new, photo_paths=self.view.form_presenter.photos,
+                on_stored=self._on_photo_stored,
+                on_ingested=lambda stored, ingested: self._on_photos_ingested(new.name, stored, ingested)
+            )
             if created:
                 self.view.form_presenter.clear_inputs()
                 self.show_info(title="Success", message="Person has been added to a registry")
@@ -73,3 +80,15 @@ class AddPersonPresenter(BasePresenter):
         except Exception as e:
             logger.exception(f"Error adding person {new.name}: {e}")
             self.show_error(title="Error", message=str(e))
+
+    @mainthread
+    def _on_photo_stored(self, result: StoreResult) -> None:
+        if result.error:
+            self.show_error(title="Warning", message=f"Photo {result.source.name} was not saved: {result.error}")
+
+    @mainthread
+    def _on_photos_ingested(self, name: str, stored: int, ingested: int) -> None:
+        logger.info(f"Photos of {name} processed: {ingested}/{stored}")
+        if ingested < stored:
+            self.show_error(title="Warning",
+                            message=f"{stored - ingested} photos of {name} could not be processed")
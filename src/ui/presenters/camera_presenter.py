@@ -1,11 +1,18 @@
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
 from kivy.clock import Clock, mainthread
 
 from algorithms import AlgorithmFactory
+from core import config
 from core.logger import AppLogger
 from models.model.model_metadata import ModelMetadata
+from services import camera_discovery
+from services.camera_service import CameraService
+from services.process_pipeline import ProcessRecognitionPool
+from services.recognition_pool import RecognitionPool, StreamResult
+from utils.frame_tiles import tile_frames
+from utils.metrics import metrics
 
 logger = AppLogger().get_logger(__name__)
 
@@ -18,7 +25,14 @@ class WebCameraPresenter:
         self.camera_service = camera_svc
         self.algorithm = None
         self._poll_event = None
+        self._poll_interval = self.POLL_INTERVAL
         self._is_running = False
+        self.negotiated = {}
+
+        self.pool: Union[RecognitionPool, ProcessRecognitionPool, None] = None
+        # capture processes own their cameras, their ports map to None
+        self.cameras: Dict[int, Optional[CameraService]] = {}
+        self._latest: Dict[int, StreamResult] = {}
 
     def start(self) -> None:
         logger.info("WebCameraPresenter started")
@@ -30,53 +44,120 @@ class WebCameraPresenter:
         except Exception as e:
             logger.exception("Error stopping WebCameraPresenter")
 
-    def toggle_camera(self, camera_port: int, model: Optional[ModelMetadata]) -> None:
+    def toggle_camera(self, camera_ports: Union[int, List[int], None], model: Optional[ModelMetadata]) -> None:
         try:
             if self._is_running:
                 self._stop_camera_impl()
             else:
-                self._start_camera_impl(camera_port, model)
+                self._start_camera_impl(camera_ports, model)
         except Exception as e:
             logger.exception("Error toggling camera")
             self.view.on_camera_error(str(e))
 
-    def _start_camera_impl(self, camera_port: int, model: Optional[ModelMetadata]) -> None:
+    def _start_camera_impl(self, camera_ports: Union[int, List[int], None], model: Optional[ModelMetadata]) -> None:
         try:
             if not model:
                 raise ValueError("No model selected")
 
-            if camera_port is None:
+            ports = [camera_ports] if isinstance(camera_ports, int) else list(camera_ports or [])
+            if not ports:
                 raise ValueError("No camera port selected")
 
             self._load_algorithm(model)
             if not self.algorithm:
                 raise RuntimeError("Failed to load algorithm")
 
-            self.camera_service.start(camera_port)
+            if config.camera.CAPTURE_PROCESSES:
+                self.pool = ProcessRecognitionPool(model)
+            else:
+                self.pool = RecognitionPool(self.algorithm, on_wake=self._on_stream_wake)
+            self._latest = {}
+            for port in ports:
+                self._open_camera(port)
+            if not self.cameras:
+                raise RuntimeError(f"Unable to open camera on port {', '.join(map(str, ports))}")
+
+            self.pool.start()
             self._is_running = True
-
-            if self._poll_event:
-                Clock.unschedule(self._poll_event)
-            self._poll_event = Clock.schedule_interval(
-                self._poll_frame_impl,
-                self.POLL_INTERVAL
-            )
+            self._schedule_poll(self.POLL_INTERVAL)
 
             self.view.on_camera_started()
-            logger.info(f"Camera started on port {camera_port}")
 
         except Exception as e:
             logger.exception("Error starting camera")
+            self._close_cameras()
             self._is_running = False
             self.view.on_camera_error(str(e))
 
+    def _schedule_poll(self, interval: float) -> None:
+        if self._poll_event:
+            Clock.unschedule(self._poll_event)
+        self._poll_interval = interval
+        self._poll_event = Clock.schedule_interval(self._poll_frame_impl, interval)
+
+    @mainthread
+    def _on_stream_wake(self) -> None:
+        if self._is_running and self.pool and self._poll_interval != self.pool.poll_interval:
+            self._schedule_poll(self.pool.poll_interval)
+
+    def _open_camera(self, port: int) -> None:
+        if isinstance(self.pool, ProcessRecognitionPool):
+            try:
+                negotiated = self.pool.add_camera(port, port, camera_discovery.profile_for(port))
+            except Exception as e:
+                logger.error(f"Skipping camera {port}: {e}")
+                return
+            self.cameras[port] = None
+        else:
+            negotiated = self._open_camera_thread(port)
+            if negotiated is None:
+                return
+
+        self.negotiated[port] = negotiated
+        logger.info(
+            f"Camera started on port {port}: {negotiated.width}x{negotiated.height} "
+            f"{negotiated.fourcc or '?'} @ {negotiated.fps:.0f} fps via {negotiated.backend}"
+        )
+
+    def _open_camera_thread(self, port: int):
+        # the shared service drives the first camera, further cameras get their own
+        camera = self.camera_service if not self.cameras else CameraService(port=port)
+        try:
+            negotiated = camera.start(port, camera_discovery.profile_for(port))
+        except Exception as e:
+            logger.error(f"Skipping camera {port}: {e}")
+            return None
+
+        self.cameras[port] = camera
+        self.pool.add_stream(port, camera)
+        return negotiated
+
+    def _close_cameras(self) -> None:
+        if self.pool:
+            self.pool.stop()
+            for port, stats in self.pool.stats().items():
+                logger.info(
+                    f"Camera {port}: {stats['frames']} frames, {stats['fps']:.1f} fps, "
+                    f"{stats['latency_ms']:.0f} ms latency, {stats['dropped']} dropped, "
+                    f"{stats.get('skipped', 0)} skipped"
+                )
+            self.pool = None
+        if self.algorithm and self.algorithm.quality.checked:
+            logger.info(f"Live face quality: {self.algorithm.quality.summary()}")
+
+        for camera in self.cameras.values():
+            if camera:
+                camera.stop()
+        self.cameras = {}
+        self.negotiated = {}
+
     def _stop_camera_impl(self) -> None:
         try:
             if self._poll_event:
                 Clock.unschedule(self._poll_event)
                 self._poll_event = None
 
-            self.camera_service.stop()
+            self._close_cameras()
 
             self.algorithm = None
             self._is_running = False
@@ -90,34 +171,54 @@ class WebCameraPresenter:
 
     def _poll_frame_impl(self, dt) -> None:
         try:
-            if not self._is_running or not self.algorithm:
+            if not self._is_running or not self.pool:
                 return
 
-            ret, frame = self.camera_service.read_now()
-            if not ret or frame is None:
+            results = self.pool.take_results()
+            if not results:
                 return
+            self._latest.update(results)
 
-            self.last_frame = frame.copy()
-
-            rgb_frame = frame[:, :, ::-1]
-            try:
-                annotated, counter, name = self.algorithm.predict_webcam(rgb_frame)
-
-                prediction_data = {
-                    'frame': annotated,
-                    'name': name,
-                    'counter': counter,
-                    'confidence': 0.0
-                }
+            # poll slowly while every camera is idle, otherwise as often as results arrive
+            idle = all(result.idle for result in self._latest.values())
+            interval = config.camera.IDLE_POLL_INTERVAL if idle else self.pool.poll_interval
+            if interval != self._poll_interval:
+                self._schedule_poll(interval)
 
-                self.view.on_frame_received(prediction_data)
-
-            except Exception as e:
-                logger.exception("Error running prediction")
+            ports = [port for port in self.cameras if port in self._latest]
+            if len(self.cameras) == 1:
+                frame = self._latest[ports[0]].frame
+            else:
+                stats = self.pool.stats()
+                labels = [
+                    f"Port {port}  {stats[port]['fps']:.1f} fps  {stats[port]['latency_ms']:.0f} ms"
+                    for port in ports
+                ]
+                with metrics.timer("ui.tile"):
+                    frame = tile_frames([self._latest[port].frame for port in ports], labels)
+
+            # the most confirmed name of all cameras drives the identification button
+            best = max((self._latest[port] for port in ports), key=lambda result: result.counter)
+            prediction_data = {
+                'frame': frame,
+                'name': best.name,
+                'counter': best.counter,
+                'confidence': 0.0
+            }
+
+            self.view.on_frame_received(prediction_data)
 
         except Exception as e:
             logger.exception("Error in frame polling")
 
+    def get_stream_stats(self) -> dict:
+        return self.pool.stats() if self.pool else {}
+
+    def get_rate_decisions(self) -> dict:
+        """Current choices of the frame-rate controller, empty without one."""
+        controller = getattr(self.pool, "controller", None)
+        return controller.snapshot() if controller else {}
+
     def _load_algorithm(self, model: ModelMetadata) -> bool:
         try:
             if not model:
@@ -1,9 +1,11 @@
 from pathlib import Path
 from typing import Optional, List
-import shutil
+
+from kivy.clock import mainthread
 
 from core import AppLogger, Gender
 from models.person.person_metadata import PersonMetadata
+from models.person.photo_store import StoreResult
 from services import person_service
 from ui.presenters.base_presenter import BasePresenter
 
@@ -110,27 +112,12 @@ class EditPersonPresenter(BasePresenter):
                 logger.error(f"Person not found: {person_name}")
                 return False
 
-            person.photos_path.mkdir(parents=True, exist_ok=True)
-
-            existing_photos = list(person.photos_path.glob("*"))
-            photo_count = len(existing_photos)
-
-            for photo_path in self.photos_to_add:
-                try:
-                    src = Path(photo_path)
-                    if not src.exists():
-                        logger.warning(f"Source photo not found: {photo_path}")
-                        continue
-
-                    photo_count += 1
-                    dst = person.photos_path / f"{photo_count}{src.suffix}"
-
-                    shutil.copy2(str(src), str(dst))
-                    logger.info(f"Saved photo: {dst}")
-
-                except Exception as e:
-                    logger.exception(f"Error saving photo {photo_path}: {e}")
-                    continue
+            futures = person_service.add_photos_to_person(
+                person_name, self.photos_to_add,
+                on_stored=self._on_photo_stored,
+                on_ingested=lambda stored, ingested: self._on_photos_ingested(person_name, stored, ingested)
+            )
+            logger.info(f"Saving {len(futures)} new photos for {person_name}")
 
             self.photos_to_add.clear()
             return True
@@ -139,6 +126,18 @@ class EditPersonPresenter(BasePresenter):
             logger.exception("Error saving new photos")
             return False
 
+    @mainthread
+    def _on_photo_stored(self, result: StoreResult) -> None:
+        if result.error:
+            self.show_error(title="Warning", message=f"Photo {result.source.name} was not saved: {result.error}")
+
+    @mainthread
+    def _on_photos_ingested(self, name: str, stored: int, ingested: int) -> None:
+        logger.info(f"Photos of {name} processed: {ingested}/{stored}")
+        if ingested < stored:
+            self.show_error(title="Warning",
+                            message=f"{stored - ingested} photos of {name} could not be processed")
+
     def _delete_marked_photos(self, person_name: str) -> bool:
         try:
             if not self.photos_to_delete:
@@ -150,15 +149,8 @@ class EditPersonPresenter(BasePresenter):
                 return False
 
             for photo_path in self.photos_to_delete:
-                try:
-                    p = Path(photo_path)
-                    if p.exists():
-                        p.unlink()
-                        logger.info(f"Deleted photo: {photo_path}")
-
-                except Exception as e:
-                    logger.exception(f"Error deleting photo {photo_path}: {e}")
-                    continue
+                if Path(photo_path).exists():
+                    person_service.remove_photo_from_person(person_name, photo_path)
 
             self.photos_to_delete.clear()
             return True
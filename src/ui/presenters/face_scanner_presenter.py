@@ -1,15 +1,10 @@
-import csv
-from datetime import datetime
-
-import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.ticker import MaxNLocator
+from kivy.clock import mainthread
 
 from core import config
 from core.logger import AppLogger
-from services import person_service, model_service, camera_service
+from services import person_service, model_service, camera_discovery, statistics_service
 from ui.presenters.base_presenter import BasePresenter
-from utils.TimeUtils import TimeUtils
+from ui.stats_plot import StatisticsPlot
 
 logger = AppLogger().get_logger(__name__)
 
@@ -18,7 +13,12 @@ class FaceScannerPresenter(BasePresenter):
     def __init__(self, view):
         super().__init__(view)
         self.selected_camera = None
+        self.all_cameras = False
         self.selected_model = None
+        # set while the profile spinner follows the camera selection, which is not a user choice
+        self._showing_profile = False
+        self.plot = StatisticsPlot(lambda: statistics_service.last_hours(config.stats.PLOT_HOURS),
+                                   config.stats.PLOT_HOURS)
         self._initialize_data()
 
     def _initialize_data(self) -> None:
@@ -30,10 +30,15 @@ class FaceScannerPresenter(BasePresenter):
             if models:
                 self.selected_model = models[0]
 
-            cameras = camera_service.get_all_cameras()
+            # the persisted list is shown right away, devices are only probed when nothing is known
+            cameras = camera_discovery.ports
             if cameras:
                 self.selected_camera = cameras[0]
 
+            camera_discovery.bind(self._on_cameras_discovered)
+            if not camera_discovery.is_known:
+                camera_discovery.probe()
+
             logger.info("FaceScannerPresenter initialized")
         except Exception as e:
             logger.exception("Error initializing FaceScannerPresenter")
@@ -82,6 +87,8 @@ class FaceScannerPresenter(BasePresenter):
                 logger.info("Updating model spinner values")
                 self.view.ids.model_spinner.values = self.get_available_models()
                 self.view.ids.model_spinner.text = self.get_selected_model_name()
+
+            self._update_camera_spinner()
         except Exception as e:
             logger.exception("Error updating view")
 
@@ -95,16 +102,94 @@ class FaceScannerPresenter(BasePresenter):
 
     def get_available_cameras(self) -> list:
         try:
-            return [f"Port {p}" for p in camera_service.get_all_cameras()]
+            if camera_discovery.is_probing():
+                return []
+            values = [f"Port {p}" for p in camera_discovery.ports]
+            if len(values) > 1:
+                values.append(config.ui.TEXTS["all_cameras"])
+            return values + [config.ui.TEXTS["rescan_cameras"]]
         except Exception as e:
-            logger.exception("Error getting model names")
+            logger.exception("Error getting camera ports")
             return []
 
+    def rescan_cameras(self) -> None:
+        try:
+            # a running camera cannot be opened twice, keep it as it is
+            camera_presenter = getattr(self.view, 'camera_presenter', None)
+            in_use = list(camera_presenter.cameras) if camera_presenter and camera_presenter.is_camera_running() else []
+
+            camera_discovery.probe(skip_ports=in_use)
+            self._update_camera_spinner()
+        except Exception as e:
+            logger.exception("Error searching for cameras")
+
+    def get_capture_profiles(self) -> list:
+        return list(config.camera.CAPTURE_PROFILES)
+
+    def get_selected_profile(self) -> str:
+        ports = self.get_selected_ports()
+        camera = camera_discovery.get_camera(ports[0]) if ports else None
+        return (camera.profile if camera else None) or config.camera.DEFAULT_CAPTURE_PROFILE
+
+    def select_profile(self, profile: str) -> bool:
+        """Capture profile for the selected camera(s), used the next time they are turned on."""
+        try:
+            if self._showing_profile or profile not in config.camera.CAPTURE_PROFILES:
+                return False
+            ports = self.get_selected_ports()
+            for port in ports:
+                camera = camera_discovery.get_camera(port)
+                if camera and (camera.profile or config.camera.DEFAULT_CAPTURE_PROFILE) != profile:
+                    camera_discovery.set_profile(port, profile)
+                    logger.info(f"Camera {port} capture profile: {profile}")
+            return bool(ports)
+        except Exception as e:
+            logger.exception(f"Error selecting capture profile {profile}")
+            return False
+
+    def get_selected_ports(self) -> list:
+        if self.all_cameras:
+            return camera_discovery.ports
+        return [self.selected_camera] if self.selected_camera is not None else []
+
+    @mainthread
+    def _on_cameras_discovered(self, cameras) -> None:
+        ports = [camera.port for camera in cameras]
+        if self.selected_camera not in ports:
+            self.selected_camera = ports[0] if ports else None
+        if len(ports) < 2:
+            self.all_cameras = False
+        self._update_camera_spinner()
+
+    def _update_camera_spinner(self) -> None:
+        try:
+            if hasattr(self.view.ids, 'camera_port'):
+                self.view.ids.camera_port.values = self.get_available_cameras()
+                self.view.ids.camera_port.text = self.get_selected_camera_port()
+            self._update_profile_spinner()
+        except Exception as e:
+            logger.exception("Error updating camera spinner")
+
+    def _update_profile_spinner(self) -> None:
+        try:
+            if hasattr(self.view.ids, 'capture_profile'):
+                self._showing_profile = True
+                self.view.ids.capture_profile.disabled = not self.get_selected_ports()
+                self.view.ids.capture_profile.text = self.get_selected_profile()
+        except Exception as e:
+            logger.exception("Error updating capture profile spinner")
+        finally:
+            self._showing_profile = False
+
     def get_selected_model_name(self) -> str:
         return self.selected_model.name if self.selected_model else "No models"
 
     def get_selected_camera_port(self) -> str:
-        return f"Port {self.selected_camera}" if self.selected_camera is not None else "No cameras"
+        if camera_discovery.is_probing():
+            return config.ui.TEXTS["searching_cameras"]
+        if self.all_cameras:
+            return config.ui.TEXTS["all_cameras"]
+        return f"Port {self.selected_camera}" if self.selected_camera is not None else config.ui.TEXTS["no_cameras"]
 
     def select_model(self, model_name: str) -> bool:
         try:
@@ -123,7 +208,15 @@ class FaceScannerPresenter(BasePresenter):
 
     def select_camera(self, camera_port: str) -> bool:
         try:
-            self.selected_camera = int(camera_port.split()[-1])
+            if camera_port == config.ui.TEXTS["rescan_cameras"]:
+                self.rescan_cameras()
+                return False
+            if camera_port == config.ui.TEXTS["all_cameras"]:
+                self.all_cameras = True
+            else:
+                self.selected_camera = int(camera_port.split()[-1])
+                self.all_cameras = False
+            self._update_profile_spinner()
             return True
         except:
             return False
@@ -135,18 +228,7 @@ class FaceScannerPresenter(BasePresenter):
 
     def record_identification(self, success: bool) -> None:
         try:
-            hour = TimeUtils.get_hour()
-            day = TimeUtils.get_day()
-            month = TimeUtils.get_month()
-
-            ok_val = 1 if success else 0
-            nok_val = 0 if success else 1
-            data = [hour, day, month, 0, ok_val, nok_val]
-
-            with open(config.stats.FILE_STATS_CSV, "a", newline='') as f:
-                writer = csv.writer(f, delimiter=',')
-                writer.writerow(data)
-
+            statistics_service.record_identification(success)
             logger.info(f"Recorded identification: {'OK' if success else 'NOK'}")
 
         except Exception as e:
@@ -154,144 +236,21 @@ class FaceScannerPresenter(BasePresenter):
 
     def record_attempt(self) -> None:
         try:
-            hour = TimeUtils.get_hour()
-            day = TimeUtils.get_day()
-            month = TimeUtils.get_month()
-            data = [hour, day, month, 1, 0, 0]
-
-            with open(config.stats.FILE_STATS_CSV, "a", newline='') as f:
-                writer = csv.writer(f, delimiter=',')
-                writer.writerow(data)
+            statistics_service.record_attempt()
 
         except Exception as e:
             logger.exception("Error recording attempt")
 
     def clear_statistics(self) -> None:
         try:
-            current_hour = TimeUtils.get_hour()
-            current_day = TimeUtils.get_day()
-            current_month = TimeUtils.get_month()
-
-            first_hour = (current_hour - 11) % 24
-            range_hours = [(first_hour + i) % 24 for i in range(12)]
-
-            with open(config.stats.FILE_STATS_CSV, "w", newline='') as f:
-                writer = csv.writer(f, delimiter=',')
-                for hour in range_hours:
-                    day = current_day - 1 if hour > current_hour else current_day
-                    data = [hour, day, current_month, 0, 0, 0]
-                    writer.writerow(data)
-
-            self._create_blank_plot()
-            logger.info("Statistics cleared")
+            statistics_service.clear()
+            self.plot.request()
 
         except Exception as e:
             logger.exception("Error clearing statistics")
 
-    def get_plot_path(self) -> str:
-        try:
-            data_csv = []
-            if config.stats.FILE_STATS_CSV.exists():
-                with open(config.stats.FILE_STATS_CSV, 'r') as f:
-                    reader = csv.reader(f, delimiter=',')
-                    for row in reader:
-                        if row:
-                            data_csv.append(row)
-
-            if not data_csv:
-                self._create_blank_plot()
-                return str(config.stats.FILE_RESULT_PLOT)
-
-            ok_y, nok_y, no_id_y, x = self._process_stats_data(data_csv)
-
-            if x:
-                self._create_plot(x, ok_y, nok_y, no_id_y)
-            else:
-                self._create_blank_plot()
-
-            return str(config.stats.FILE_RESULT_PLOT)
-
-        except Exception as e:
-            logger.exception("Error getting plot")
-            self._create_blank_plot()
-            return str(config.stats.FILE_RESULT_PLOT)
-
-    def _process_stats_data(self, data_csv: list) -> tuple:
-        now = datetime.now()
-        current_hour = now.hour
-
-        first_hour = (current_hour - 11) % 24
-        range_hours = [(first_hour + i) % 24 for i in range(12)]
-
-        x, ok_y, nok_y, no_id_y = [], [], [], []
-
-        for hour in range_hours:
-            ok, nok, no_id = 0, 0, 0
-
-            for element in data_csv:
-                try:
-                    if len(element) >= 6 and int(element[0]) == hour:
-                        no_id += int(element[3])
-                        ok += int(element[4])
-                        nok += int(element[5])
-                except (ValueError, IndexError):
-                    continue
-
-            x.append(hour)
-            ok_y.append(ok)
-            nok_y.append(nok)
-            no_id_y.append(no_id)
-
-        return ok_y, nok_y, no_id_y, x
-
-    def _create_plot(self, x: list, ok_y: list, nok_y: list, no_id_y: list) -> None:
-        try:
-            series_ok = np.array(ok_y)
-            series_nok = np.array(nok_y)
-            series_no_id = np.array(no_id_y)
-
-            index = np.arange(len(x))
-            plt.figure(figsize=(10, 6))
-            plt.title('Result of identification (per hour)', fontsize=14, fontweight='bold')
-            plt.ylabel('Count of identifications', fontsize=11)
-            plt.xlabel('Hour', fontsize=11)
-
-            color_correct = "#A8E6CF"
-            color_incorrect = "#FFB3BA"
-            color_no_id = "#BAD7FF"
-
-            plt.bar(index, series_ok, color=color_correct, label="Correct", edgecolor='white', linewidth=1)
-            plt.bar(index, series_nok, color=color_incorrect, bottom=series_ok, label="Incorrect", edgecolor='white', linewidth=1)
-            plt.bar(index, series_no_id, color=color_no_id, bottom=(series_ok + series_nok), label="No ID", edgecolor='white', linewidth=1)
-
-            plt.xticks(index, x)
-            ax = plt.gca()
-            ax.yaxis.set_major_locator(MaxNLocator(integer=True))
-            ax.grid(axis='y', alpha=0.4, linestyle='--')
-            ax.set_facecolor('#F8F9FA')
-
-            plt.legend(loc='upper left', framealpha=0.9)
-            plt.tight_layout()
-
-            plt.savefig(config.stats.FILE_RESULT_PLOT, dpi=100, bbox_inches='tight', facecolor='white')
-            plt.close()
-
-        except Exception as e:
-            logger.exception("Error creating plot")
-
-    def _create_blank_plot(self) -> None:
+    def refresh_plot(self) -> None:
         try:
-            plt.figure(figsize=(10, 6))
-            plt.title('Result of identification (per hour)', fontsize=14, fontweight='bold')
-            plt.ylabel('Count of identifications', fontsize=11)
-            plt.xlabel('Hour', fontsize=11)
-
-            ax = plt.gca()
-            ax.set_facecolor('#F8F9FA')
-            ax.grid(axis='y', alpha=0.4, linestyle='--')
-
-            plt.tight_layout()
-            plt.savefig(config.stats.FILE_RESULT_PLOT, dpi=100, bbox_inches='tight', facecolor='white')
-            plt.close()
+            self.plot.request()
         except Exception as e:
-            logger.exception("Error creating blank plot")
+            logger.exception("Error refreshing plot")
@@ -5,11 +5,12 @@ from pathlib import Path
 from tkinter import filedialog
 
 import cv2
-import dlib
 from kivy.clock import mainthread
 
 from core import config, AppLogger, Gender
+from services import person_service
 from ui.presenters.base_presenter import BasePresenter
+from ui.preview_loader import adjacent, preview_loader
 from utils.get_image_dimensions import get_crop_dims
 
 logger = AppLogger().get_logger(__name__)
@@ -20,6 +21,7 @@ class FormPersonPresenter(BasePresenter):
         super().__init__(view)
         self.photos = []
         self.preview_photo_index = 0
+        self.preview_photo_path = ""
         self.is_edit_mode = False
         self._initialize_data()
 
@@ -98,6 +100,7 @@ class FormPersonPresenter(BasePresenter):
 
     def set_default_image(self) -> None:
         try:
+            self.preview_photo_path = ""
             self.view.ids.preview_photo.source = str(config.images.DEFAULT_USER_IMAGE)
             self.view.ids.preview_photo_name.text = '(0/0)'
             self.view.ids.num_files.opacity = 0
@@ -176,7 +179,10 @@ class FormPersonPresenter(BasePresenter):
 
                 image_path = str(all_photos[index])
                 if os.path.exists(image_path):
-                    self.view.ids.preview_photo.source = image_path
+                    self.preview_photo_path = image_path
+                    preview_loader.show(
+                        self.view.ids.preview_photo, image_path, adjacent(all_photos, index)
+                    )
                 else:
                     if self.is_edit_mode:
                         self.view.presenter.delete_current_photo(image_path)
@@ -201,7 +207,7 @@ class FormPersonPresenter(BasePresenter):
                 self.show_error("Error", "No photo loaded")
                 return
 
-            image_path = str(self.view.ids.preview_photo.source)
+            image_path = self.preview_photo_path
             if not image_path or not os.path.exists(image_path):
                 self.show_error("Error", "Photo not found")
                 return
@@ -262,20 +268,17 @@ class FormPersonPresenter(BasePresenter):
                 self.show_error("Error", "No photo loaded")
                 return
 
-            image_path = str(self.view.ids.preview_photo.source)
+            image_path = self.preview_photo_path
             if not os.path.exists(image_path):
                 self.show_error("Error", "Photo not found")
                 return
 
-            detector = dlib.get_frontal_face_detector()
-            image = cv2.imread(image_path)
+            face_locations = person_service.get_face_locations(image_path)
 
-            rects = detector(image, 1)
-
-            self.view.ids.count_face_text.text = f"Number of faces found: {len(rects)}"
+            self.view.ids.count_face_text.text = f"Number of faces found: {len(face_locations)}"
             self.view.ids.count_face_text.opacity = 1
 
-            logger.info(f"Face detection: {len(rects)} faces found")
+            logger.info(f"Face detection: {len(face_locations)} faces found")
         except Exception as e:
             logger.exception("Error in face detection")
             self.show_error("Error", f"Face detection failed: {str(e)}")
@@ -4,7 +4,8 @@ from typing import Optional, List
 
 from kivy.clock import mainthread
 
-from core import AppLogger, Algorithm, config
+from algorithms.knn_classifier import KNNClassifier
+from core import AppLogger, Algorithm, Detector, config
 from models.model.model_metadata import ModelMetadata
 from models.model.model_trainer import ModelTrainer
 from services import model_service, person_service
@@ -18,7 +19,11 @@ class LearningCreatePresenter(BasePresenter):
         super().__init__(view)
         self.selected_algorithm: Algorithm = Algorithm.KNN
         self.selected_weight: str = "distance"
+        self.selected_knn_algo: str = config.model.DEFAULT_KNN_ALGO
+        self.selected_n_probe: int = config.model.DEFAULT_N_PROBE
         self.selected_gamma: str = "scale"
+        self.selected_n_prototypes: int = config.model.DEFAULT_N_PROTOTYPES
+        self.selected_detector: Detector = Detector(config.model.DEFAULT_DETECTOR)
         self.n_neighbors: Optional[int] = None
         self.use_auto_neighbors: bool = True
         self.is_training = False
@@ -63,7 +68,7 @@ class LearningCreatePresenter(BasePresenter):
             logger.exception("Error updating view")
 
     def get_algorithms(self) -> List[str]:
-        return [Algorithm.KNN.value, Algorithm.SVM.value]
+        return [Algorithm.KNN.value, Algorithm.SVM.value, Algorithm.CENTROID.value]
 
     def select_algorithm(self, algorithm_name: str) -> None:
         try:
@@ -75,6 +80,10 @@ class LearningCreatePresenter(BasePresenter):
                 self.selected_algorithm = Algorithm.SVM
                 self._show_svm_controls()
                 logger.info("Selected SVM algorithm")
+            elif algorithm_name == Algorithm.CENTROID.value:
+                self.selected_algorithm = Algorithm.CENTROID
+                self._show_centroid_controls()
+                logger.info("Selected Centroid algorithm")
         except Exception as e:
             logger.exception(f"Error selecting algorithm: {e}")
 
@@ -88,10 +97,20 @@ class LearningCreatePresenter(BasePresenter):
                 self.view.ids.weights_box.height = 30
                 self.view.ids.weights_box.opacity = 1
 
+            if hasattr(self.view.ids, 'index_box'):
+                self.view.ids.index_box.height = 30
+                self.view.ids.index_box.opacity = 1
+
+            self._show_probe_control(self.selected_knn_algo == "ivf")
+
             if hasattr(self.view.ids, 'gamma_box'):
                 self.view.ids.gamma_box.height = 0
                 self.view.ids.gamma_box.opacity = 0
 
+            if hasattr(self.view.ids, 'prototypes_box'):
+                self.view.ids.prototypes_box.height = 0
+                self.view.ids.prototypes_box.opacity = 0
+
             logger.info("KNN controls shown")
         except Exception as e:
             logger.exception("Error showing KNN controls")
@@ -106,28 +125,91 @@ class LearningCreatePresenter(BasePresenter):
                 self.view.ids.neighbor_box.height = 0
                 self.view.ids.neighbor_box.opacity = 0
 
-            if hasattr(self.view.ids, 'weights_box'):
-                self.view.ids.weights_box.height = 0
-                self.view.ids.weights_box.opacity = 0
+            for box in ('weights_box', 'index_box', 'probe_box', 'prototypes_box'):
+                if hasattr(self.view.ids, box):
+                    getattr(self.view.ids, box).height = 0
+                    getattr(self.view.ids, box).opacity = 0
 
             logger.info("SVM controls shown")
         except Exception as e:
             logger.exception("Error showing SVM controls")
 
+    def _show_centroid_controls(self) -> None:
+        try:
+            if hasattr(self.view.ids, 'prototypes_box'):
+                self.view.ids.prototypes_box.height = 30
+                self.view.ids.prototypes_box.opacity = 1
+
+            for box in ('neighbor_box', 'weights_box', 'index_box', 'probe_box', 'gamma_box'):
+                if hasattr(self.view.ids, box):
+                    getattr(self.view.ids, box).height = 0
+                    getattr(self.view.ids, box).opacity = 0
+
+            logger.info("Centroid controls shown")
+        except Exception as e:
+            logger.exception("Error showing Centroid controls")
+
+    def _show_probe_control(self, visible: bool) -> None:
+        if hasattr(self.view.ids, 'probe_box'):
+            self.view.ids.probe_box.height = 30 if visible else 0
+            self.view.ids.probe_box.opacity = 1 if visible else 0
+
+    def get_detectors(self) -> List[str]:
+        return [detector.value for detector in Detector]
+
+    def get_default_detector(self) -> str:
+        return Detector(config.model.DEFAULT_DETECTOR).value
+
     def get_weights(self) -> List[str]:
         return ["distance", "uniform"]
 
+    def get_knn_algos(self) -> List[str]:
+        return list(KNNClassifier.KNN_ALGOS)
+
+    def get_probe_counts(self) -> List[str]:
+        return ["1", "2", "4", "8", "16", "32"]
+
     def get_gammas(self) -> List[str]:
         return ["scale", "auto"]
 
+    def get_prototype_counts(self) -> List[str]:
+        return ["1", "2", "3", "5"]
+
     def on_weight_selected(self, weight: str) -> None:
         self.selected_weight = weight
         logger.info(f"Selected weight: {weight}")
 
+    def on_knn_algo_selected(self, knn_algo: str) -> None:
+        self.selected_knn_algo = knn_algo if knn_algo in KNNClassifier.KNN_ALGOS else config.model.DEFAULT_KNN_ALGO
+        if self.selected_algorithm == Algorithm.KNN:
+            self._show_probe_control(self.selected_knn_algo == "ivf")
+        logger.info(f"Selected KNN index: {self.selected_knn_algo}")
+
+    def on_probe_selected(self, value: str) -> None:
+        try:
+            self.selected_n_probe = max(1, int(value))
+        except ValueError:
+            self.selected_n_probe = config.model.DEFAULT_N_PROBE
+        logger.info(f"Selected IVF lists to probe: {self.selected_n_probe}")
+
     def on_gamma_selected(self, gamma: str) -> None:
         self.selected_gamma = gamma
         logger.info(f"Selected gamma: {gamma}")
 
+    def on_detector_selected(self, detector_name: str) -> None:
+        try:
+            self.selected_detector = Detector(detector_name)
+        except ValueError:
+            self.selected_detector = Detector(config.model.DEFAULT_DETECTOR)
+        logger.info(f"Selected face detector: {self.selected_detector.value}")
+
+    def on_prototypes_selected(self, value: str) -> None:
+        try:
+            self.selected_n_prototypes = max(1, int(value))
+        except ValueError:
+            self.selected_n_prototypes = config.model.DEFAULT_N_PROTOTYPES
+        logger.info(f"Selected prototypes per person: {self.selected_n_prototypes}")
+
     def on_neighbor_checkbox_active(self, is_active: bool) -> None:
         try:
             self.use_auto_neighbors = not is_active
@@ -304,7 +386,23 @@ class LearningCreatePresenter(BasePresenter):
                 threshold=config.model.DEFAULT_THRESHOLD,
                 n_neighbors=self.n_neighbors if self.selected_algorithm == Algorithm.KNN else None,
                 weight=self.selected_weight if self.selected_algorithm == Algorithm.KNN else None,
+                knn_algo=self.selected_knn_algo if self.selected_algorithm == Algorithm.KNN else None,
+                n_probe=(
+                    self.selected_n_probe
+                    if self.selected_algorithm == Algorithm.KNN and self.selected_knn_algo == "ivf" else None
+                ),
+                encoding_storage=(
+                    config.model.DEFAULT_ENCODING_STORAGE
+                    if self.selected_algorithm == Algorithm.KNN else None
+                ),
                 gamma=self.selected_gamma if self.selected_algorithm == Algorithm.SVM else None,
+                n_prototypes=(
+                    self.selected_n_prototypes if self.selected_algorithm == Algorithm.CENTROID else None
+                ),
+                detector=self.selected_detector,
+                detector_upsample=config.model.DEFAULT_DETECTOR_UPSAMPLE,
+                landmark_model=config.model.DEFAULT_LANDMARK_MODEL,
+                num_jitters=config.model.DEFAULT_NUM_JITTERS,
             )
 
             if not model_service.registry.add(model):
@@ -417,6 +515,21 @@ class LearningCreatePresenter(BasePresenter):
 
             self.use_auto_neighbors = True
             self.n_neighbors = None
+            self.selected_n_prototypes = config.model.DEFAULT_N_PROTOTYPES
+            if hasattr(self.view.ids, 'spinner_prototypes'):
+                self.view.ids.spinner_prototypes.text = str(self.selected_n_prototypes)
+
+            self.selected_knn_algo = config.model.DEFAULT_KNN_ALGO
+            if hasattr(self.view.ids, 'spinner_knn_algo'):
+                self.view.ids.spinner_knn_algo.text = self.selected_knn_algo
+
+            self.selected_n_probe = config.model.DEFAULT_N_PROBE
+            if hasattr(self.view.ids, 'spinner_probe'):
+                self.view.ids.spinner_probe.text = str(self.selected_n_probe)
+
+            self.selected_detector = Detector(config.model.DEFAULT_DETECTOR)
+            if hasattr(self.view.ids, 'spinner_detector'):
+                self.view.ids.spinner_detector.text = self.selected_detector.value
 
             self._show_knn_controls()
 
@@ -58,7 +58,7 @@ class LearningEditPresenter(BasePresenter):
             self.view.ids.author.text = model.author or "Unknown"
             self.view.ids.description.text = model.comment or ""
 
-            if model.algorithm == Algorithm.KNN:
+            if model.algorithm in (Algorithm.KNN, Algorithm.CENTROID):
                 self.view.ids.threshold_box.height = 30
                 self.view.ids.threshold_box.opacity = 1
                 self.view.ids.threshold.text = f"{model.threshold:.4f}"
@@ -128,7 +128,7 @@ class LearningEditPresenter(BasePresenter):
 
             self.selected_model.comment = description
 
-            if (self.selected_model.algorithm == Algorithm.KNN and
+            if (self.selected_model.algorithm in (Algorithm.KNN, Algorithm.CENTROID) and
                     self.view.ids.manual_checkbox.active):
                 try:
                     threshold = float(self.view.ids.threshold.text)
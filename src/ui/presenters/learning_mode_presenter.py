@@ -108,6 +108,8 @@ class LearningModePresenter(BasePresenter):
                 self._show_knn_params(model)
             elif model.algorithm == Algorithm.SVM:
                 self._show_svm_params(model)
+            elif model.algorithm == Algorithm.CENTROID:
+                self._show_centroid_params(model)
 
             self.view.ids.learning_time.text = f"{model.learning_time}s"
             self.view.ids.accuracy.text = f"{model.accuracy:.2%}"
@@ -136,6 +138,8 @@ class LearningModePresenter(BasePresenter):
 
             self.view.ids.gamma_box.height = 0
             self.view.ids.gamma_box.opacity = 0
+            self.view.ids.prototypes_box.height = 0
+            self.view.ids.prototypes_box.opacity = 0
 
             self.view.ids.num_neighbors.text = str(model.n_neighbors or "auto")
             self.view.ids.weight.text = model.weight or "distance"
@@ -155,12 +159,34 @@ class LearningModePresenter(BasePresenter):
             self.view.ids.weight_box.opacity = 0
             self.view.ids.threshold_box.height = 0
             self.view.ids.threshold_box.opacity = 0
+            self.view.ids.prototypes_box.height = 0
+            self.view.ids.prototypes_box.opacity = 0
 
             self.view.ids.gamma.text = model.gamma or "scale"
 
         except Exception as e:
             logger.exception("Error showing SVM params")
 
+    def _show_centroid_params(self, model: ModelMetadata) -> None:
+        try:
+            self.view.ids.prototypes_box.height = 30
+            self.view.ids.prototypes_box.opacity = 1
+            self.view.ids.threshold_box.height = 30
+            self.view.ids.threshold_box.opacity = 1
+
+            self.view.ids.neighbor_box.height = 0
+            self.view.ids.neighbor_box.opacity = 0
+            self.view.ids.weight_box.height = 0
+            self.view.ids.weight_box.opacity = 0
+            self.view.ids.gamma_box.height = 0
+            self.view.ids.gamma_box.opacity = 0
+
+            self.view.ids.num_prototypes.text = str(model.n_prototypes or 1)
+            self.view.ids.threshold.text = f"{model.threshold:.4f}"
+
+        except Exception as e:
+            logger.exception("Error showing Centroid params")
+
     def show_model_persons(self) -> None:
         try:
             if not self.selected_model:
@@ -202,6 +228,7 @@ class LearningModePresenter(BasePresenter):
             self.view.ids.weight.text = "N/A"
             self.view.ids.threshold.text = "N/A"
             self.view.ids.gamma.text = "N/A"
+            self.view.ids.num_prototypes.text = "N/A"
 
             self.view.ids.neighbor_box.height = 0
             self.view.ids.neighbor_box.opacity = 0
@@ -211,6 +238,8 @@ class LearningModePresenter(BasePresenter):
             self.view.ids.threshold_box.opacity = 0
             self.view.ids.gamma_box.height = 0
             self.view.ids.gamma_box.opacity = 0
+            self.view.ids.prototypes_box.height = 0
+            self.view.ids.prototypes_box.opacity = 0
 
             self._set_empty_persons_list()
 
@@ -0,0 +1,102 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image as PILImage
+from kivy.clock import mainthread
+from kivy.core.image import Texture
+
+from core import config, AppLogger
+from utils.thumbnail_cache import ThumbnailCache, thumbnail_cache
+
+logger = AppLogger().get_logger(__name__)
+
+DecodedImage = Tuple[int, int, bytes]
+
+
+def adjacent(items: Sequence, index: int) -> List:
+    """Next and previous item, the ones worth prefetching while ``items[index]`` is shown."""
+    return [items[i] for i in (index + 1, index - 1) if 0 <= i < len(items)]
+
+
+class PreviewLoader:
+    """Shows photos in a Kivy ``Image`` from cached thumbnails decoded on a worker thread.
+
+    Only the texture upload runs on the UI thread. Decoded neighbours are kept in a small
+    LRU, so stepping to the next or previous photo is served from memory. ``resolve`` maps a
+    photo to the file to decode (e.g. ``PersonMetadata.preview_path``) and runs in the pool.
+    """
+
+    def __init__(self, cache: Optional[ThumbnailCache] = None, capacity: Optional[int] = None):
+        self.cache = cache or thumbnail_cache
+        self.capacity = capacity or config.ui.PREVIEW_TEXTURE_CACHE
+        self._decoded: "OrderedDict[str, DecodedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._requested = {}
+
+    def show(self, widget, source: Union[str, Path], neighbours: Iterable[Union[str, Path]] = (),
+             resolve: Optional[Callable[[Path], Path]] = None) -> None:
+        source = str(source)
+        self._requested[widget] = source
+        # clears the previous texture, any later assignment of ``source`` wins over this request
+        widget.source = ""
+
+        decoded = self._get_decoded(source)
+        if decoded is not None:
+            self._apply(widget, source, decoded)
+        else:
+            self.cache.executor.submit(self._decode, source, resolve).add_done_callback(
+                lambda future: self._on_decoded(widget, source, future)
+            )
+
+        for neighbour in neighbours:
+            if self._get_decoded(str(neighbour)) is None:
+                self.cache.executor.submit(self._decode, str(neighbour), resolve)
+
+    def _get_decoded(self, source: str) -> Optional[DecodedImage]:
+        with self._lock:
+            decoded = self._decoded.get(source)
+            if decoded is not None:
+                self._decoded.move_to_end(source)
+            return decoded
+
+    def _decode(self, source: str, resolve: Optional[Callable[[Path], Path]] = None) -> DecodedImage:
+        thumbnail = self.cache.get_or_create(resolve(Path(source)) if resolve else source)
+        with PILImage.open(thumbnail) as image:
+            # Kivy textures start at the bottom row
+            pixels = np.flipud(np.asarray(image.convert("RGB")))
+        decoded = (pixels.shape[1], pixels.shape[0], pixels.tobytes())
+
+        with self._lock:
+            self._decoded[source] = decoded
+            self._decoded.move_to_end(source)
+            while len(self._decoded) > self.capacity:
+                self._decoded.popitem(last=False)
+        return decoded
+
+    def _on_decoded(self, widget, source: str, future) -> None:
+        if future.exception() is not None:
+            logger.warning(f"Cannot load preview of {source}: {future.exception()}")
+            self._fallback(widget, source)
+            return
+        self._apply(widget, source, future.result())
+
+    @mainthread
+    def _fallback(self, widget, source: str) -> None:
+        if self._requested.get(widget) == source and not widget.source:
+            widget.source = source
+
+    @mainthread
+    def _apply(self, widget, source: str, decoded: DecodedImage) -> None:
+        if self._requested.get(widget) != source or widget.source:
+            return
+
+        width, height, data = decoded
+        texture = Texture.create(size=(width, height), colorfmt="rgb")
+        texture.blit_buffer(data, colorfmt="rgb", bufferfmt="ubyte")
+        widget.texture = texture
+
+
+preview_loader = PreviewLoader()
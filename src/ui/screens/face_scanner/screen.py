@@ -12,6 +12,7 @@ from ui.base_screen import BaseScreen
 from ui.popups.warn import WarnPopup
 from ui.presenters import FaceScannerPresenter
 from ui.presenters.camera_presenter import WebCameraPresenter
+from utils.metrics import metrics
 
 
 class FaceScanner(BaseScreen):
@@ -36,6 +37,9 @@ class FaceScanner(BaseScreen):
             self.presenter.start()
             self.camera_presenter.start()
 
+            self.presenter.plot.bind(self._on_plot_rendered)
+            self.presenter.refresh_plot()
+
             self._reset_identification()
 
             self.logger.info("FaceScanner initialized successfully")
@@ -54,6 +58,11 @@ class FaceScanner(BaseScreen):
             self.presenter.select_camera(camera_port)
         self.logger.debug(f"Selected camera: {camera_port}")
 
+    def on_spinner_profile_select(self, profile: str) -> None:
+        if self.presenter:
+            self.presenter.select_profile(profile)
+        self.logger.debug(f"Selected capture profile: {profile}")
+
     def get_ui_text_camera_button(self) -> str:
         return config.ui.TEXTS.get("start_webcam", "Turn on")
 
@@ -63,7 +72,7 @@ class FaceScanner(BaseScreen):
                 self._clear_photo()
 
             self.camera_presenter.toggle_camera(
-                self.presenter.selected_camera,
+                self.presenter.get_selected_ports(),
                 self.presenter.selected_model
             )
 
@@ -100,7 +109,7 @@ class FaceScanner(BaseScreen):
 
             if self.camera_presenter and self.camera_presenter.is_camera_running():
                 self.camera_presenter.toggle_camera(
-                    self.presenter.selected_camera,
+                    self.presenter.get_selected_ports(),
                     self.presenter.selected_model
                 )
                 from kivy.clock import Clock
@@ -162,18 +171,14 @@ class FaceScanner(BaseScreen):
         except Exception as e:
             self.logger.exception("Error clearing photo")
 
-    def read_plot(self) -> str:
-        if self.presenter:
-            return self.presenter.get_plot_path()
-        return ""
-
     def clear_stats(self) -> None:
         if self.presenter:
             self.presenter.clear_statistics()
             self.show_info("Statistics cleared")
 
     def on_plot_updated(self) -> None:
-        self._update_plot()
+        if self.presenter:
+            self.presenter.refresh_plot()
 
     def its_ok(self) -> None:
         try:
@@ -264,17 +269,37 @@ class FaceScanner(BaseScreen):
             if not hasattr(self.ids, 'camera'):
                 return
 
-            buf = cv2.flip(frame, 0).tobytes()
-            texture = Texture.create(
-                size=(frame.shape[1], frame.shape[0]),
-                colorfmt="rgb"
-            )
-            texture.blit_buffer(buf, colorfmt="rgb", bufferfmt="ubyte")
-            self.ids.camera.texture = texture
+            if config.metrics.OVERLAY and self.is_camera_mode:
+                frame = self._draw_overlay(frame)
+
+            with metrics.timer("ui.blit"):
+                buf = cv2.flip(frame, 0).tobytes()
+                texture = Texture.create(
+                    size=(frame.shape[1], frame.shape[0]),
+                    colorfmt="rgb"
+                )
+                texture.blit_buffer(buf, colorfmt="rgb", bufferfmt="ubyte")
+                self.ids.camera.texture = texture
 
         except Exception as e:
             self.logger.exception("Error displaying frame")
 
+    def _draw_overlay(self, frame: np.ndarray) -> np.ndarray:
+        stats = self.camera_presenter.get_stream_stats() if self.camera_presenter else {}
+        if not stats:
+            return frame
+
+        fps = sum(s['fps'] for s in stats.values()) / len(stats)
+        latency = sum(s['latency_ms'] for s in stats.values()) / len(stats)
+        text = f"{fps:.1f} fps  {latency:.0f} ms"
+        scale = self.camera_presenter.get_rate_decisions().get('detection_scale')
+        if scale and scale < 1.0:
+            text += f"  detect x{scale:g}"
+
+        frame = frame.copy()
+        cv2.putText(frame, text, (8, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1, cv2.LINE_AA)
+        return frame
+
     @mainthread
     def _handle_prediction(self, counter: int, name: str) -> None:
         try:
@@ -356,14 +381,16 @@ class FaceScanner(BaseScreen):
         except:
             return False
 
-    @mainthread
-    def _update_plot(self) -> None:
+    def _on_plot_rendered(self, texture: Texture) -> None:
         try:
-            plot_path = self.read_plot()
-            if hasattr(self.ids, 'plot') and plot_path:
-                self.ids.plot.source = str(plot_path)
-                if hasattr(self.ids.plot, 'reload'):
-                    self.ids.plot.reload()
+            if not hasattr(self.ids, 'plot'):
+                return
+
+            if self.ids.plot.texture is texture:
+                # same texture with new pixels, only the canvas needs a redraw
+                self.ids.plot.canvas.ask_update()
+            else:
+                self.ids.plot.texture = texture
         except Exception as e:
             self.logger.exception("Error updating plot")
 
@@ -378,9 +405,9 @@ class FaceScanner(BaseScreen):
 
     def popup_photo(self) -> None:
         try:
-            if config.stats.FILE_RESULT_PLOT.exists():
+            if self.presenter and self.presenter.plot.texture is not None:
                 from ui.popups.plot import PlotPopup
-                popup = PlotPopup(str(config.stats.FILE_RESULT_PLOT))
+                popup = PlotPopup(texture=self.presenter.plot.texture)
                 popup.open()
         except Exception as e:
             self.logger.exception("Error showing popup")
@@ -33,16 +33,41 @@ class LearningCreate(BaseScreen):
             return self.presenter.get_algorithms()
         return []
 
+    def get_detectors(self):
+        if self.presenter:
+            return self.presenter.get_detectors()
+        return []
+
+    def get_default_detector(self):
+        if self.presenter:
+            return self.presenter.get_default_detector()
+        return ""
+
     def get_weights(self):
         if self.presenter:
             return self.presenter.get_weights()
         return []
 
+    def get_knn_algos(self):
+        if self.presenter:
+            return self.presenter.get_knn_algos()
+        return []
+
+    def get_probe_counts(self):
+        if self.presenter:
+            return self.presenter.get_probe_counts()
+        return []
+
     def get_gammas(self):
         if self.presenter:
             return self.presenter.get_gammas()
         return []
 
+    def get_prototype_counts(self):
+        if self.presenter:
+            return self.presenter.get_prototype_counts()
+        return []
+
     def on_algorithm_selected(self, algorithm_name: str) -> None:
         try:
             if self.presenter:
@@ -50,6 +75,13 @@ class LearningCreate(BaseScreen):
         except Exception as e:
             self.logger.exception("Error selecting algorithm")
 
+    def on_detector_selected(self, detector_name: str) -> None:
+        try:
+            if self.presenter:
+                self.presenter.on_detector_selected(detector_name)
+        except Exception as e:
+            self.logger.exception("Error selecting detector")
+
     def on_weight_selected(self, weight: str) -> None:
         try:
             if self.presenter:
@@ -57,6 +89,20 @@ class LearningCreate(BaseScreen):
         except Exception as e:
             self.logger.exception("Error selecting weight")
 
+    def on_knn_algo_selected(self, knn_algo: str) -> None:
+        try:
+            if self.presenter:
+                self.presenter.on_knn_algo_selected(knn_algo)
+        except Exception as e:
+            self.logger.exception("Error selecting KNN index")
+
+    def on_probe_selected(self, value: str) -> None:
+        try:
+            if self.presenter:
+                self.presenter.on_probe_selected(value)
+        except Exception as e:
+            self.logger.exception("Error selecting probes")
+
     def on_gamma_selected(self, gamma: str) -> None:
         try:
             if self.presenter:
@@ -64,6 +110,13 @@ class LearningCreate(BaseScreen):
         except Exception as e:
             self.logger.exception("Error selecting gamma")
 
+    def on_prototypes_selected(self, value: str) -> None:
+        try:
+            if self.presenter:
+                self.presenter.on_prototypes_selected(value)
+        except Exception as e:
+            self.logger.exception("Error selecting prototypes")
+
     def on_neighbor_checkbox_changed(self, is_active: bool) -> None:
         try:
             if self.presenter:
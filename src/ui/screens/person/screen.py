@@ -8,6 +8,7 @@ from models.person.person_metadata import PersonMetadata
 from services import person_service
 from ui.base_screen import BaseScreen
 from ui.presenters.persons_presenter import PersonsPresenter
+from ui.preview_loader import adjacent, preview_loader
 
 logger = AppLogger().get_logger(__name__)
 
@@ -100,9 +101,11 @@ class PersonsScreen(BaseScreen):
 
             photo_index = max(0, min(photo_index, len(person.photo_paths) - 1))
 
-            image = person.photo_paths[photo_index]
+            photos = person.photo_paths
+            image = photos[photo_index]
             if os.path.exists(str(image)):
-                self.ids.preview_photo.source = str(image)
+                neighbours = adjacent(photos, photo_index)
+                preview_loader.show(self.ids.preview_photo, image, neighbours, resolve=person.preview_path)
             else:
                 self._delete_preview_photo()
                 return
@@ -155,7 +158,10 @@ class PersonsScreen(BaseScreen):
                     len(self.presenter.selected_person.photo_paths)):
                 try:
                     from ui.popups.plot import PlotPopup
-                    popup_window = PlotPopup(self.ids.preview_photo.source)
+                    person = self.presenter.selected_person
+                    popup_window = PlotPopup(
+                        str(person.preview_path(person.photo_paths[self.preview_photo_index]))
+                    )
                     popup_window.open()
                 except Exception as e:
                     photo_path = self.presenter.selected_person.photo_paths[
@@ -0,0 +1,142 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from kivy.clock import mainthread
+from kivy.core.image import Texture
+
+from core import AppLogger
+
+logger = AppLogger().get_logger(__name__)
+
+RenderedPlot = Tuple[int, int, bytes]
+
+SERIES = (
+    ("Correct", "#A8E6CF"),
+    ("Incorrect", "#FFB3BA"),
+    ("No ID", "#BAD7FF"),
+)
+
+
+class StatisticsChart:
+    """Stacked hourly bar chart drawn off-screen into an RGBA buffer.
+
+    The figure and its bars are built once for a fixed number of buckets; ``render`` only
+    moves bar heights and tick labels. Not thread-safe, ``StatisticsPlot`` keeps it on one
+    worker thread.
+    """
+
+    def __init__(self, buckets: int = 12, figsize: Tuple[float, float] = (10, 6), dpi: int = 100):
+        # matplotlib is imported here, on the render thread, to keep it off the app start
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import MaxNLocator
+
+        self.buckets = buckets
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+        self.canvas = FigureCanvasAgg(self.figure)
+
+        ax = self.figure.add_subplot()
+        ax.set_title('Result of identification (per hour)', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Count of identifications', fontsize=11)
+        ax.set_xlabel('Hour', fontsize=11)
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.grid(axis='y', alpha=0.4, linestyle='--')
+        ax.set_axisbelow(True)
+        ax.set_facecolor('#F8F9FA')
+
+        index = np.arange(buckets)
+        zeros = np.zeros(buckets)
+        self.bars = [
+            ax.bar(index, zeros, color=color, label=label, edgecolor='white', linewidth=1)
+            for label, color in SERIES
+        ]
+        ax.set_xticks(index)
+        ax.set_xticklabels(["00"] * buckets)
+        self.legend = ax.legend(loc='upper left', framealpha=0.9)
+        self.ax = ax
+
+        self.figure.tight_layout()
+
+    def render(self, x: Sequence, counts: np.ndarray) -> RenderedPlot:
+        """Draw ``counts`` of shape ``(buckets, 3)`` (ok, nok, no id) and return ``(width, height, rgba)``."""
+        counts = np.asarray(counts, dtype=np.float64).reshape(self.buckets, len(SERIES))
+        bottoms = np.zeros(self.buckets)
+        for bars, heights in zip(self.bars, counts.T):
+            for rect, bottom, height in zip(bars.patches, bottoms, heights):
+                rect.set_y(bottom)
+                rect.set_height(height)
+            bottoms += heights
+
+        top = bottoms.max()
+        self.ax.set_ylim(0, top * 1.05 if top > 0 else 1)
+        self.ax.set_xticklabels([str(label) for label in x])
+        self.legend.set_visible(top > 0)
+
+        self.canvas.draw()
+        width, height = self.canvas.get_width_height()
+        # Kivy textures start at the bottom row
+        pixels = np.flipud(np.asarray(self.canvas.buffer_rgba()))
+        return width, height, pixels.tobytes()
+
+
+class StatisticsPlot:
+    """Renders a ``StatisticsChart`` on a background thread and uploads it to one reused texture.
+
+    ``request`` may be called for every recorded event: while a render is queued or running
+    further requests only mark the plot stale, so a burst of clicks costs at most one extra
+    render, which reads the latest counters.
+    """
+
+    def __init__(self, query: Callable[[], Tuple[Sequence, np.ndarray]], buckets: int = 12):
+        self.query = query
+        self.buckets = buckets
+        self.texture: Optional[Texture] = None
+
+        self._chart: Optional[StatisticsChart] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stats-plot")
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._stale = False
+        self._listeners: List[Callable[[Texture], None]] = []
+
+    def bind(self, callback: Callable[[Texture], None]) -> None:
+        """Call ``callback(texture)`` on the UI thread after every render."""
+        self._listeners.append(callback)
+        if self.texture is not None:
+            callback(self.texture)
+
+    def request(self) -> None:
+        with self._lock:
+            self._stale = True
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._executor.submit(self._run)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._stale:
+                    self._scheduled = False
+                    return
+                self._stale = False
+
+            try:
+                if self._chart is None:
+                    self._chart = StatisticsChart(self.buckets)
+                x, counts = self.query()
+                self._upload(self._chart.render(x, counts))
+            except Exception as e:
+                logger.exception(f"Error rendering statistics plot: {e}")
+
+    @mainthread
+    def _upload(self, rendered: RenderedPlot) -> None:
+        width, height, data = rendered
+        if self.texture is None or tuple(self.texture.size) != (width, height):
+            self.texture = Texture.create(size=(width, height), colorfmt="rgba")
+        self.texture.blit_buffer(data, colorfmt="rgba", bufferfmt="ubyte")
+
+        for callback in self._listeners:
+            callback(self.texture)
@@ -0,0 +1,31 @@
+import math
+from typing import Optional, Sequence
+
+import cv2
+import numpy as np
+
+
+def tile_frames(frames: Sequence[np.ndarray], labels: Optional[Sequence[str]] = None,
+                max_width: int = 1280) -> np.ndarray:
+    """Lay frames out on a near-square grid, every tile the size of the first frame scaled to fit."""
+    if len(frames) == 1 and not labels:
+        return frames[0]
+
+    cols = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / cols)
+    height, width = frames[0].shape[:2]
+    scale = min(1.0, max_width / (cols * width))
+    tile_w, tile_h = max(1, int(width * scale)), max(1, int(height * scale))
+
+    canvas = np.zeros((rows * tile_h, cols * tile_w, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        row, col = divmod(i, cols)
+        tile = frame if frame.shape[:2] == (tile_h, tile_w) else \
+            cv2.resize(frame, (tile_w, tile_h), interpolation=cv2.INTER_AREA)
+        canvas[row * tile_h:(row + 1) * tile_h, col * tile_w:(col + 1) * tile_w] = tile
+
+        if labels and i < len(labels) and labels[i]:
+            origin = (col * tile_w + 8, row * tile_h + 22)
+            cv2.putText(canvas, labels[i], origin, cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 3, cv2.LINE_AA)
+            cv2.putText(canvas, labels[i], origin, cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1, cv2.LINE_AA)
+    return canvas
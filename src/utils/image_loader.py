@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+FaceLocation = Tuple[int, int, int, int]
+
+
+def _open_rgb(image_path: Union[str, Path], min_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+    image = Image.open(image_path)
+    if min_size is not None:
+        # JPEG only: let libjpeg decode at 1/2, 1/4 or 1/8 scale, never below min_size
+        image.draft("RGB", min_size)
+    return image.convert("RGB")
+
+
+def load_image(image_path: Union[str, Path], max_dimension: Optional[int] = None) -> Tuple[np.ndarray, float]:
+    """Decode an RGB image whose longer side is at most ``max_dimension``.
+
+    Returns the image and the factor that maps its pixel coordinates back to the original
+    resolution (``1.0`` when the photo was not reduced).
+    """
+    with Image.open(image_path) as probe:
+        full_size = probe.size
+
+    if not max_dimension or max(full_size) <= max_dimension:
+        return np.array(_open_rgb(image_path)), 1.0
+
+    ratio = max_dimension / max(full_size)
+    target = (max(1, int(full_size[0] * ratio)), max(1, int(full_size[1] * ratio)))
+
+    image = _open_rgb(image_path, target)
+    if max(image.size) > max_dimension:
+        image.thumbnail((max_dimension, max_dimension), Image.BILINEAR)
+
+    return np.array(image), full_size[0] / image.size[0]
+
+
+def load_image_min_side(image_path: Union[str, Path], min_side: int) -> np.ndarray:
+    """Decode at the smallest JPEG scale whose shorter side is still at least ``min_side``."""
+    with Image.open(image_path) as probe:
+        w, h = probe.size
+
+    ratio = min_side / min(w, h)
+    if ratio >= 1:
+        return np.array(_open_rgb(image_path))
+    return np.array(_open_rgb(image_path, (int(np.ceil(w * ratio)), int(np.ceil(h * ratio)))))
+
+
+def scale_locations(face_locations: Sequence[FaceLocation], scale: float) -> List[FaceLocation]:
+    """Map ``(top, right, bottom, left)`` boxes from a reduced image to full resolution."""
+    if scale == 1.0:
+        return list(face_locations)
+    return [tuple(int(round(v * scale)) for v in location) for location in face_locations]
@@ -0,0 +1,196 @@
+import bisect
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core import config
+
+# upper bounds of the latency buckets in ms, the last one catches everything slower
+BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, float("inf"))
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; percentiles are reported as bucket upper bounds."""
+
+    def __init__(self, bounds=BUCKETS_MS):
+        self.bounds = bounds
+        self.buckets = [0] * len(bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max,
+            "buckets": {str(bound): n for bound, n in zip(self.bounds, self.buckets) if n},
+        }
+
+
+class _Timer:
+    __slots__ = ("registry", "name", "start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Per-stage timers, counters and gauges of the live pipeline.
+
+    Stages are dotted names (``capture.grab``, ``recognize.detect``, ``ui.blit``); each gets a
+    ``Histogram``. While disabled every call returns right away and ``timer`` hands out one
+    shared no-op context, so instrumented code costs an attribute check. ``start_reporting``
+    logs a summary and writes the full snapshot as JSON every ``interval`` seconds.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.started = time.monotonic()
+
+        self._lock = threading.Lock()
+        self._reporter: Optional[threading.Thread] = None
+        self._stop_reporting = threading.Event()
+
+    def timer(self, name: str):
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def observe(self, name: str, ms: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(ms)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled or not n:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name: str, value: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.gauges[name] = value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "uptime_s": time.monotonic() - self.started,
+                "stages": {name: h.snapshot() for name, h in sorted(self.histograms.items())},
+                "counters": dict(sorted(self.counters.items())),
+                "gauges": dict(sorted(self.gauges.items())),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.gauges.clear()
+            self.started = time.monotonic()
+
+    def summary(self) -> List[str]:
+        snapshot = self.snapshot()
+        lines = [
+            f"{name}: n={s['count']} mean {s['mean_ms']:.1f} ms, p50 {s['p50_ms']:g} ms, "
+            f"p95 {s['p95_ms']:g} ms, max {s['max_ms']:.1f} ms"
+            for name, s in snapshot["stages"].items()
+        ]
+        if snapshot["counters"]:
+            lines.append("counters: " + ", ".join(f"{k}={v}" for k, v in snapshot["counters"].items()))
+        if snapshot["gauges"]:
+            lines.append("gauges: " + ", ".join(f"{k}={v:g}" for k, v in snapshot["gauges"].items()))
+        return lines
+
+    def write(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        tmp.replace(path)
+
+    def start_reporting(self, logger, interval: float, path: Optional[Path] = None) -> None:
+        if not self.enabled or self._reporter is not None:
+            return
+        self._stop_reporting.clear()
+        self._reporter = threading.Thread(
+            target=self._report_loop, args=(logger, interval, path), name="MetricsReporter", daemon=True
+        )
+        self._reporter.start()
+
+    def stop_reporting(self, logger=None, path: Optional[Path] = None) -> None:
+        if self._reporter is None:
+            return
+        self._stop_reporting.set()
+        self._reporter.join(timeout=1.0)
+        self._reporter = None
+        self._report(logger, path)
+
+    def _report_loop(self, logger, interval: float, path: Optional[Path]) -> None:
+        while not self._stop_reporting.wait(interval):
+            self._report(logger, path)
+
+    def _report(self, logger, path: Optional[Path]) -> None:
+        try:
+            if logger is not None:
+                for line in self.summary():
+                    logger.info(f"Metrics {line}")
+            if path is not None:
+                self.write(path)
+        except Exception as e:
+            if logger is not None:
+                logger.error(f"Cannot report metrics: {e}")
+
+
+metrics = MetricsRegistry(enabled=config.metrics.ENABLED)
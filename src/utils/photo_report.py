@@ -0,0 +1,17 @@
+from services import person_service
+
+
+def print_photos_without_faces():
+    report = person_service.get_photos_without_faces()
+    if not report:
+        print("Every stored photo contains a detectable face")
+        return
+
+    for name, photos in sorted(report.items()):
+        print(f"{name}: {len(photos)} photo(s) without faces")
+        for photo in photos:
+            print(f"    {photo}")
+
+
+if __name__ == "__main__":
+    print_photos_without_faces()
@@ -0,0 +1,85 @@
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+class StartupProfiler:
+    """Import-time and init-phase breakdown of the app start, reported once to the log.
+
+    ``track_imports`` wraps ``builtins.__import__`` and charges every first-time import to
+    its top-level package, excluding the time spent in nested imports of other modules, so
+    ``cv2`` or ``kivy`` show what they cost themselves. Imports made by other threads are
+    not tracked. ``phase`` times a named block, ``mark`` records a milestone since start.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.marks: List[Tuple[str, float]] = []
+        self.imports: Dict[str, float] = {}
+
+        self._original_import = None
+        self._thread = None
+        self._children: List[float] = []
+
+    def track_imports(self) -> None:
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        self._thread = threading.get_ident()
+        builtins.__import__ = self._timed_import
+
+    def stop_tracking_imports(self) -> None:
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        if level or name in sys.modules or threading.get_ident() != self._thread:
+            return original(name, globals, locals, fromlist, level)
+
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+
+            package = name.partition(".")[0]
+            self.imports[package] = self.imports.get(package, 0.0) + elapsed - children
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name: str) -> float:
+        elapsed = time.perf_counter() - self.started
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def report(self, logger, top: int = 15) -> None:
+        for name, elapsed in self.marks:
+            logger.info(f"Startup: {name} after {elapsed * 1000:.0f} ms")
+        for name, elapsed in self.phases:
+            logger.info(f"Startup phase {name}: {elapsed * 1000:.0f} ms")
+
+        slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top]
+        if slowest:
+            logger.info("Startup imports: " + ", ".join(
+                f"{package} {elapsed * 1000:.0f} ms" for package, elapsed in slowest
+            ))
+
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from PIL import Image
+
+from core import config, AppLogger
+from utils.image_loader import load_image
+
+logger = AppLogger().get_logger(__name__)
+
+
+class ThumbnailCache:
+    """JPEG thumbnails on disk, keyed by source path, mtime and size, built in a thread pool.
+
+    A hit refreshes the thumbnail's mtime. The first write of a session and every
+    ``EVICT_EVERY`` writes after it delete thumbnails unused for ``THUMBNAIL_MAX_AGE_DAYS``,
+    then the least recently used ones until the directory fits ``THUMBNAIL_CACHE_MB``.
+    """
+
+    EVICT_EVERY = 100
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_dimension: Optional[int] = None,
+                 max_workers: Optional[int] = None, max_bytes: Optional[int] = None,
+                 max_age: Optional[float] = None):
+        self.cache_dir = cache_dir or config.paths.THUMBNAIL_DIR
+        self.max_dimension = max_dimension or config.ui.THUMBNAIL_SIZE
+        self.max_bytes = max_bytes or config.ui.THUMBNAIL_CACHE_MB * 1024 * 1024
+        self.max_age = max_age or config.ui.THUMBNAIL_MAX_AGE_DAYS * 24 * 3600
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.ui.THUMBNAIL_WORKERS,
+            thread_name_prefix="Thumbnail"
+        )
+        self._written = 0
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    def path_for(self, source: Union[str, Path]) -> Path:
+        source = Path(source).resolve()
+        stat = source.stat()
+        key = f"{source}:{stat.st_mtime_ns}:{stat.st_size}:{self.max_dimension}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.jpg"
+
+    def get_or_create(self, source: Union[str, Path]) -> Path:
+        thumbnail = self.path_for(source)
+        if thumbnail.exists():
+            try:
+                os.utime(thumbnail)
+            except OSError:
+                pass
+            return thumbnail
+
+        image, _ = load_image(source, self.max_dimension)
+        thumbnail.parent.mkdir(parents=True, exist_ok=True)
+        # write then rename, a concurrent reader never sees a partial file
+        partial = thumbnail.with_suffix(f".{threading.get_ident()}.part")
+        Image.fromarray(image).save(partial, "JPEG", quality=85)
+        partial.replace(thumbnail)
+
+        with self._lock:
+            evict = self._written % self.EVICT_EVERY == 0
+            self._written += 1
+        if evict:
+            self.evict()
+        return thumbnail
+
+    def evict(self) -> int:
+        """Delete expired and least recently used thumbnails, returns how many were deleted."""
+        if not self._evict_lock.acquire(blocking=False):
+            return 0
+        try:
+            entries = []
+            for path in self.cache_dir.glob("*"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            now = time.time()
+            total = sum(size for _, size, _ in entries)
+            deleted = 0
+            for mtime, size, path in entries:
+                if path.suffix == ".part":
+                    # a partial file older than a minute was left by an interrupted write
+                    if now - mtime <= 60:
+                        continue
+                elif now - mtime <= self.max_age and total <= self.max_bytes:
+                    continue
+                try:
+                    path.unlink()
+                    total -= size
+                    deleted += 1
+                except OSError as e:
+                    logger.debug(f"Cannot delete thumbnail {path}: {e}")
+
+            if deleted:
+                logger.info(f"Evicted {deleted} thumbnails, {total / (1024 * 1024):.1f} MB left")
+            return deleted
+        finally:
+            self._evict_lock.release()
+
+    def submit(self, source: Union[str, Path]) -> Future:
+        return self.executor.submit(self.get_or_create, source)
+
+    def prefetch(self, sources: Iterable[Union[str, Path]]) -> None:
+        for source in sources:
+            self.submit(source).add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if future.exception() is not None:
+            logger.warning(f"Thumbnail generation failed: {future.exception()}")
+
+
+thumbnail_cache = ThumbnailCache()